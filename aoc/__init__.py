@@ -0,0 +1,39 @@
+"""Shared tooling for running, timing and inspecting the Advent of Code day solvers
+
+Submodules and the day solvers are loaded on first attribute access, so
+`import aoc` stays cheap and aoc.day7 is the day7/solve.py module.
+"""
+import importlib
+import re
+
+SUBMODULES = (
+    "bench",
+    "cache",
+    "complexity",
+    "days",
+    "generators",
+    "grid",
+    "importtime",
+    "memory",
+    "profiling",
+    "reader",
+    "runner",
+)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    match = re.fullmatch(r"day(\d+)", name)
+    if match:
+        return importlib.import_module(".days", __name__).load_module(
+            int(match.group(1))
+        )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    days = importlib.import_module(".days", __name__)
+    return sorted(
+        list(globals()) + list(SUBMODULES) + [f"day{d}" for d in days.discover_days()]
+    )
@@ -0,0 +1,666 @@
+#!/usr/bin/env python
+
+"""Command line entry point: python -m aoc <command> [options]"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+
+# each command imports its own modules, so a run never loads the profilers,
+# the benchmark statistics or numpy unless the selected days need them
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+
+def get_days(args):
+    """Resolve the --days selection, defaulting to every discovered day
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        list: day numbers
+    """
+    if args.days:
+        return aoc_days.parse_day_range(args.days)
+    return aoc_days.discover_days()
+
+
+def cmd_run(args):
+    """Run the selected days in a process pool and print answers and timings
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import cache  # pylint: disable=import-outside-toplevel
+    from . import checkpoint  # pylint: disable=import-outside-toplevel
+    from . import engines  # pylint: disable=import-outside-toplevel
+    from . import runner  # pylint: disable=import-outside-toplevel
+
+    if args.artifacts:
+        from . import artifacts  # pylint: disable=import-outside-toplevel
+
+        artifacts.enable(args.artifacts, args.artifact_dir)
+    if args.trace:
+        from . import timeline  # pylint: disable=import-outside-toplevel
+
+        timeline.enable()
+    if args.progress:
+        from . import progress  # pylint: disable=import-outside-toplevel
+
+        progress.enable_logging()
+    days = get_days(args)
+    selection = engines.parse_selection(args.engine)
+    choices = engines.load_choices(args.engines_file or engines.DEFAULT_CHOICES)
+    start = time.perf_counter()
+    results = runner.run_days(
+        days,
+        jobs=args.jobs,
+        input_name=args.input,
+        cache_dir=(
+            None
+            if args.no_cache or args.artifacts
+            else args.cache_dir or cache.DEFAULT_CACHE_DIR
+        ),
+        budget=args.budget,
+        engines={day: engines.resolve_day(day, selection, choices) for day in days},
+        checkpoint_dir=(
+            (args.checkpoint_dir or checkpoint.DEFAULT_CHECKPOINT_DIR)
+            if args.checkpoint or args.checkpoint_dir
+            else None
+        ),
+    )
+    elapsed = time.perf_counter() - start
+    if args.trace:
+        traces = [result.pop("trace", []) for result in results]
+        save_trace(args.trace, traces, "run", start, days=days)
+    if args.format == "json":
+        print(runner.format_json(results))
+    else:
+        print(runner.format_table(results))
+        print(f"total wall time: {runner.format_time(elapsed)}")
+    failed = [
+        r
+        for r in results
+        if "error" in r or any("error" in p for p in r["parts"].values())
+    ]
+    return 1 if failed else 0
+
+
+def save_trace(path, traces, name, start, **args):
+    """Write the spans workers sent back, under one span for the whole command
+
+    Args:
+        path (str): Chrome Trace Event JSON file
+        traces (list): span lists taken from each result's 'trace'
+        name (str): name of the command's span
+        start (float): perf_counter time the command started
+        **args: values shown on the command's span
+    """
+    from . import timeline  # pylint: disable=import-outside-toplevel
+
+    timeline.add_span(name, start, timeline.now(), cat="run", **args)
+    events = timeline.drain()
+    for trace in traces:
+        events.extend(trace)
+    timeline.write_trace(path, events)
+
+
+def cmd_batch(args):
+    """Solve every input matching a folder or glob for one day, streaming JSON lines
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code, 1 when any input failed
+    """
+    from . import batch  # pylint: disable=import-outside-toplevel
+
+    if args.trace:
+        from . import timeline  # pylint: disable=import-outside-toplevel
+
+        timeline.enable()
+    if args.progress:
+        from . import progress  # pylint: disable=import-outside-toplevel
+
+        progress.enable_logging()
+    paths = batch.find_inputs(args.inputs)
+    if not paths:
+        logger.error("no input files match %s", args.inputs)
+        return 1
+    parts = tuple(int(p) for p in args.parts.split(","))
+    start = time.perf_counter()
+    failed = 0
+    traces = []
+    for result in batch.run_batch(
+        args.day,
+        paths,
+        jobs=args.jobs,
+        parts=parts,
+        cache_dir=args.cache_dir,
+        budget=args.budget,
+    ):
+        failed += batch.has_error(result)
+        traces.append(result.pop("trace", []))
+        print(batch.format_json_line(result), flush=True)
+    logger.info(
+        "day %d: %d inputs, %d failed, %.3fs",
+        args.day,
+        len(paths),
+        failed,
+        time.perf_counter() - start,
+    )
+    if args.trace:
+        save_trace(args.trace, traces, "batch", start, day=args.day)
+    return 1 if failed else 0
+
+
+def cmd_bench(args):
+    """Benchmark the selected days and gate on the stored baseline
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code, 1 when any phase regressed past the threshold
+    """
+    from . import bench  # pylint: disable=import-outside-toplevel
+    from . import engines  # pylint: disable=import-outside-toplevel
+
+    args.engines_file = args.engines_file or engines.DEFAULT_CHOICES
+    document = bench.run_benchmarks(
+        get_days(args),
+        inputs=args.inputs.split(","),
+        warmups=args.warmups,
+        repeats=args.repeats,
+        time_budget=args.time_budget,
+        all_engines=args.all_engines or args.pick_engines,
+        engine_selection=engines.parse_selection(args.engine),
+        engine_choices=engines.load_choices(args.engines_file),
+    )
+    if args.pick_engines:
+        choices = engines.load_choices(args.engines_file)
+        choices.update(engines.pick_fastest(document))
+        engines.save_choices(choices, args.engines_file)
+        print(f"fastest engines written to {args.engines_file}")
+    args.baseline = args.baseline or bench.DEFAULT_BASELINE
+    baseline = None if args.save else bench.load_baseline(args.baseline)
+    comparisons = bench.compare(document, baseline, args.threshold) if baseline else []
+    print(bench.format_report(document, comparisons))
+    if args.save:
+        bench.save_baseline(document, args.baseline)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"no baseline at {args.baseline}, rerun with --save to create one")
+    regressions = [c for c in comparisons if c["regressed"]]
+    for c in regressions:
+        if c["new"] is None:
+            print(f"day {c['day']} {c['phase']} on {c['input']} failed: {c['error']}")
+            continue
+        print(
+            f"day {c['day']} {c['phase']} on {c['input']} regressed: "
+            f"{c['old'] * 1000:.3f}ms -> {c['new'] * 1000:.3f}ms (x{c['ratio']:.2f})"
+        )
+    return 1 if regressions else 0
+
+
+def cmd_generate(args):
+    """Write a seeded synthetic input for a day
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import generators  # pylint: disable=import-outside-toplevel
+
+    if args.out:
+        generators.write_input(args.day, args.out, args.size, args.seed)
+    else:
+        sys.stdout.write(generators.generate_input(args.day, args.size, args.seed))
+    return 0
+
+
+def cmd_complexity(args):
+    """Fit time and peak memory scaling exponents for the selected days
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import complexity  # pylint: disable=import-outside-toplevel
+
+    reports = []
+    for day in get_days(args):
+        logger.info("scaling day %d", day)
+        reports.append(
+            complexity.scale_day(
+                day,
+                steps=args.steps,
+                factor=args.factor,
+                start=args.start,
+                max_time=args.max_time,
+                seed=args.seed,
+                memory=not args.no_memory,
+            )
+        )
+    if args.format == "json":
+        print(json.dumps(reports, indent=2))
+    else:
+        print(complexity.format_report(reports))
+    return 0
+
+
+def cmd_memory(args):
+    """Trace peak and retained memory of each phase of the selected days
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import memory  # pylint: disable=import-outside-toplevel
+    from . import runner  # pylint: disable=import-outside-toplevel
+
+    results = {}
+    for day in get_days(args):
+        logger.info("tracing day %d", day)
+        try:
+            results[day] = memory.trace_day(day, args.input, args.top)
+        except Exception as err:  # pylint: disable=broad-except
+            results[day] = {"-": {"error": runner.format_error(err)}}
+    if args.format == "json":
+        print(memory.format_json(results))
+    else:
+        print(memory.format_report(results))
+    return 0
+
+
+def cmd_fuzz(args):
+    """Check optimized solvers against their reference solvers on generated inputs
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code, 1 when any part disagreed
+    """
+    from . import fuzz  # pylint: disable=import-outside-toplevel
+
+    days = get_days(args) if args.days else fuzz.get_fuzzed_days()
+    reports = []
+    for day in days:
+        for part in fuzz.get_fuzzed_parts(day):
+            for engine in fuzz.get_checked_engines(day, part):
+                logger.info("fuzzing day %d part %d %s", day, part, engine)
+                reports.append(
+                    fuzz.fuzz_part(
+                        day,
+                        part,
+                        engine,
+                        args.cases,
+                        args.max_size,
+                        args.seed,
+                        args.budget,
+                    )
+                )
+    if args.format == "json":
+        print(fuzz.format_json(reports))
+    else:
+        print(fuzz.format_report(reports))
+    return 1 if any(r["mismatches"] for r in reports) else 0
+
+
+def cmd_importtime(args):
+    """Report which modules a one-day run imports and how long each takes
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import importtime  # pylint: disable=import-outside-toplevel
+
+    results = {day: importtime.measure_day(day) for day in get_days(args)}
+    if args.format == "json":
+        print(importtime.format_json(results))
+    else:
+        print(importtime.format_report(results, args.top))
+    return 0
+
+
+def cmd_serve(args):
+    """Serve solve requests on a Unix socket until interrupted
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import daemon  # pylint: disable=import-outside-toplevel
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        daemon.serve(
+            args.socket or daemon.DEFAULT_SOCKET,
+            jobs=args.jobs,
+            days=aoc_days.parse_day_range(args.days) if args.days else None,
+            stop=stop,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_service(args):
+    """Serve solve requests through the asyncio service until interrupted
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import daemon  # pylint: disable=import-outside-toplevel
+    from . import service  # pylint: disable=import-outside-toplevel
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        service.serve(
+            args.socket or daemon.DEFAULT_SOCKET,
+            jobs=args.jobs,
+            days=aoc_days.parse_day_range(args.days) if args.days else None,
+            max_pending=args.max_pending,
+            stop=stop,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_stats(args):
+    """Print the queue depth, job counts and latencies of a running service
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code
+    """
+    from . import daemon  # pylint: disable=import-outside-toplevel
+
+    request = {"command": "stats"}
+    reply = daemon.send_requests([request], args.socket or daemon.DEFAULT_SOCKET)[0]
+    print(json.dumps(reply, indent=2))
+    return 1 if "error" in reply else 0
+
+
+def cmd_ask(args):
+    """Send one day/part request to a running daemon and print the reply
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        int: process exit code, 1 when the daemon reported an error
+    """
+    from . import daemon  # pylint: disable=import-outside-toplevel
+
+    request = {"day": args.day, "part": args.part}
+    if args.budget is not None:
+        request["budget"] = args.budget
+    if args.deadline is not None:
+        request["deadline"] = args.deadline
+    if args.stdin:
+        request["data"] = sys.stdin.read()
+    else:
+        request["input"] = args.input
+    reply = daemon.send_requests([request], args.socket or daemon.DEFAULT_SOCKET)[0]
+    if args.format == "json":
+        print(json.dumps(reply))
+    elif "error" in reply:
+        print(f"day {args.day} part {args.part}: {reply['error']}")
+    else:
+        print(
+            f"day {args.day} part {args.part}: {reply['answer']} "
+            f"(parse {reply['parse_time'] * 1000:.1f}ms, "
+            f"solve {reply['time'] * 1000:.1f}ms)"
+        )
+    return 1 if "error" in reply else 0
+
+
+def build_parser():
+    """Build the argument parser for all commands
+
+    Returns:
+        argparse.ArgumentParser: configured parser
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve several days in parallel")
+    run.add_argument("--days", help="day selection like 1-5,7 (default: all)")
+    run.add_argument("--jobs", type=int, default=None, help="worker processes")
+    run.add_argument("--input", default="input.txt", help="input file in each day")
+    run.add_argument("--format", choices=("table", "json"), default="table")
+    run.add_argument("--cache-dir", help="default: $AOC_CACHE_DIR or .aoc_cache")
+    run.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse and solve again instead of loading",
+    )
+    run.add_argument(
+        "--budget", type=float, help="seconds each part may run before it is cancelled"
+    )
+    run.add_argument(
+        "--progress",
+        action="store_true",
+        help="log the progress of every part, not just those with a budget",
+    )
+    run.add_argument(
+        "--engine", help="engine selection like 7=insertion,6.2=brute_force"
+    )
+    run.add_argument("--engines-file", help="default: $AOC_ENGINES or engines.json")
+    run.add_argument(
+        "--artifacts",
+        help="debug artifacts to write: grid,deps,records or all (skips the cache)",
+    )
+    run.add_argument("--artifact-dir", help="default: $AOC_ARTIFACT_DIR or artifacts")
+    run.add_argument("--trace", help="write a Chrome trace of every phase here")
+    run.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="save the progress of long solves and resume them on a rerun",
+    )
+    run.add_argument(
+        "--checkpoint-dir", help="default: $AOC_CHECKPOINT_DIR or .aoc_checkpoints"
+    )
+    run.set_defaults(func=cmd_run)
+
+    batch_cmd = commands.add_parser(
+        "batch", help="solve many inputs for one day as JSON lines"
+    )
+    batch_cmd.add_argument("--day", type=int, required=True)
+    batch_cmd.add_argument(
+        "--inputs", required=True, help="folder of inputs or a glob pattern"
+    )
+    batch_cmd.add_argument("--jobs", type=int, default=None, help="worker processes")
+    batch_cmd.add_argument("--parts", default="1,2")
+    batch_cmd.add_argument(
+        "--cache-dir", default=None, help="reuse parses and answers from here"
+    )
+    batch_cmd.add_argument(
+        "--budget", type=float, help="seconds each part may run before it is cancelled"
+    )
+    batch_cmd.add_argument(
+        "--progress",
+        action="store_true",
+        help="log the progress of every part, not just those with a budget",
+    )
+    batch_cmd.add_argument("--trace", help="write a Chrome trace of every phase here")
+    batch_cmd.set_defaults(func=cmd_batch)
+
+    bench_cmd = commands.add_parser("bench", help="time parse/part1/part2 per day")
+    bench_cmd.add_argument("--days", help="day selection like 1-5,7 (default: all)")
+    bench_cmd.add_argument("--inputs", default="test.txt,input.txt")
+    bench_cmd.add_argument("--warmups", type=int, default=1)
+    bench_cmd.add_argument("--repeats", type=int, default=5)
+    bench_cmd.add_argument(
+        "--time-budget", type=float, default=10.0, help="seconds of runs per phase"
+    )
+    bench_cmd.add_argument("--baseline", help="default: bench_baseline.json")
+    bench_cmd.add_argument(
+        "--threshold", type=float, default=1.25, help="allowed slowdown ratio"
+    )
+    bench_cmd.add_argument(
+        "--save", action="store_true", help="store results as the new baseline"
+    )
+    bench_cmd.add_argument(
+        "--engine", help="engine selection like 7=insertion,6.2=brute_force"
+    )
+    bench_cmd.add_argument(
+        "--all-engines", action="store_true", help="time every engine of each part"
+    )
+    bench_cmd.add_argument(
+        "--pick-engines",
+        action="store_true",
+        help="time every engine and save the fastest as the defaults",
+    )
+    bench_cmd.add_argument(
+        "--engines-file", help="default: $AOC_ENGINES or engines.json"
+    )
+    bench_cmd.set_defaults(func=cmd_bench)
+
+    generate = commands.add_parser("generate", help="write a synthetic input")
+    generate.add_argument("--day", type=int, required=True)
+    generate.add_argument(
+        "--size", type=int, default=None, help="default: real puzzle scale"
+    )
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--out", help="output file (default: stdout)")
+    generate.set_defaults(func=cmd_generate)
+
+    scaling = commands.add_parser(
+        "complexity", help="fit scaling exponents on generated inputs"
+    )
+    scaling.add_argument("--days", help="day selection like 1-5,7 (default: all)")
+    scaling.add_argument("--steps", type=int, default=5, help="number of sizes")
+    scaling.add_argument("--factor", type=float, default=2.0, help="size growth")
+    scaling.add_argument(
+        "--start", type=float, default=0.25, help="first size vs real puzzle scale"
+    )
+    scaling.add_argument(
+        "--max-time", type=float, default=10.0, help="stop growing past this"
+    )
+    scaling.add_argument("--seed", type=int, default=0)
+    scaling.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    scaling.add_argument("--format", choices=("table", "json"), default="table")
+    scaling.set_defaults(func=cmd_complexity)
+
+    memory_cmd = commands.add_parser(
+        "memory", help="trace peak memory and top allocating lines per phase"
+    )
+    memory_cmd.add_argument("--days", help="day selection like 1-5,7 (default: all)")
+    memory_cmd.add_argument(
+        "--input", default="input.txt", help="input file in each day"
+    )
+    memory_cmd.add_argument(
+        "--top", type=int, default=10, help="source lines per phase"
+    )
+    memory_cmd.add_argument("--format", choices=("table", "json"), default="table")
+    memory_cmd.set_defaults(func=cmd_memory)
+
+    fuzz_cmd = commands.add_parser(
+        "fuzz", help="compare optimized solvers with their references"
+    )
+    fuzz_cmd.add_argument(
+        "--days", help="day selection like 7,12 (default: days with references)"
+    )
+    fuzz_cmd.add_argument("--cases", type=int, default=1000, help="inputs per part")
+    fuzz_cmd.add_argument(
+        "--max-size", type=int, default=8, help="largest generator size"
+    )
+    fuzz_cmd.add_argument("--seed", type=int, default=0)
+    fuzz_cmd.add_argument(
+        "--budget", type=float, default=1.0, help="seconds per solver per input"
+    )
+    fuzz_cmd.add_argument("--format", choices=("table", "json"), default="table")
+    fuzz_cmd.set_defaults(func=cmd_fuzz)
+
+    imports = commands.add_parser(
+        "importtime", help="per-module import times of a one-day cold start"
+    )
+    imports.add_argument("--days", help="day selection like 1-5,7 (default: all)")
+    imports.add_argument("--top", type=int, default=15, help="modules per day")
+    imports.add_argument("--format", choices=("table", "json"), default="table")
+    imports.set_defaults(func=cmd_importtime)
+
+    serve = commands.add_parser("serve", help="answer solve requests on a Unix socket")
+    serve.add_argument("--socket", help="default: $AOC_SOCKET or .aoc.sock")
+    serve.add_argument("--jobs", type=int, default=None, help="worker processes")
+    serve.add_argument("--days", help="days to preload like 1-5,7 (default: all)")
+    serve.set_defaults(func=cmd_serve)
+
+    service_cmd = commands.add_parser(
+        "service", help="asyncio solve service with a bounded queue"
+    )
+    service_cmd.add_argument("--socket", help="default: $AOC_SOCKET or .aoc.sock")
+    service_cmd.add_argument("--jobs", type=int, default=None, help="worker processes")
+    service_cmd.add_argument("--days", help="days to preload like 1-5,7 (default: all)")
+    service_cmd.add_argument(
+        "--max-pending",
+        type=int,
+        default=32,
+        help="queued jobs before new ones are rejected",
+    )
+    service_cmd.set_defaults(func=cmd_service)
+
+    stats = commands.add_parser("stats", help="queue depth and latency of a service")
+    stats.add_argument("--socket", help="default: $AOC_SOCKET or .aoc.sock")
+    stats.set_defaults(func=cmd_stats)
+
+    ask = commands.add_parser("ask", help="send one request to a running daemon")
+    ask.add_argument("--day", type=int, required=True)
+    ask.add_argument("--part", type=int, choices=(1, 2), required=True)
+    ask.add_argument("--input", default="input.txt", help="input file in the day")
+    ask.add_argument(
+        "--stdin", action="store_true", help="send the input text from stdin"
+    )
+    ask.add_argument("--socket", help="default: $AOC_SOCKET or .aoc.sock")
+    ask.add_argument("--format", choices=("text", "json"), default="text")
+    ask.add_argument("--budget", type=float, help="seconds the solve may run")
+    ask.add_argument(
+        "--deadline", type=float, help="seconds the service may take, queueing included"
+    )
+    ask.set_defaults(func=cmd_ask)
+
+    return parser
+
+
+def main(argv=None):
+    """Main function used to dispatch commands"""
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Opt-in debug artifacts: grid dumps, dependency trees and per-iteration records
+
+Nothing is produced unless asked for, through $AOC_ARTIFACTS (a comma
+separated list of KINDS, or 'all') or enable(). Solvers check enabled(kind)
+or records(logger) once, outside their loops, so a disabled artifact costs a
+single set lookup per solve and no disk I/O or string formatting.
+"""
+import logging
+import os
+
+from .days import ROOT
+
+logger = logging.getLogger(__name__)
+
+ARTIFACTS_ENV = "AOC_ARTIFACTS"
+ARTIFACT_DIR_ENV = "AOC_ARTIFACT_DIR"
+DEFAULT_ARTIFACT_DIR = os.path.join(ROOT, "artifacts")
+
+# grid: numeric grid dumps such as day 10's loop sides
+# deps: dependency trees such as day 20's module graph
+# records: per-iteration debug log records, which also need DEBUG logging
+KINDS = ("grid", "deps", "records")
+
+
+def parse_kinds(text):
+    """Parse an artifact selection such as 'grid,deps' or 'all'
+
+    Args:
+        text (str): comma separated kinds, None or empty for none
+
+    Returns:
+        frozenset: selected kinds, unknown ones dropped with a warning
+    """
+    kinds = set()
+    for kind in (text or "").split(","):
+        kind = kind.strip()
+        if kind == "all":
+            kinds.update(KINDS)
+        elif kind in KINDS:
+            kinds.add(kind)
+        elif kind:
+            logger.warning("ignoring unknown artifact kind %r", kind)
+    return frozenset(kinds)
+
+
+_state = {
+    "kinds": parse_kinds(os.environ.get(ARTIFACTS_ENV)),
+    "out_dir": os.environ.get(ARTIFACT_DIR_ENV, DEFAULT_ARTIFACT_DIR),
+}
+
+
+def enable(kinds, out_dir=None):
+    """Turn artifact kinds on for this process and any it starts
+
+    Args:
+        kinds (str): comma separated kinds or 'all', empty to turn all off
+        out_dir (str, optional): folder artifacts are written to, None to
+            keep the current one. Defaults to None.
+    """
+    _state["kinds"] = parse_kinds(kinds)
+    os.environ[ARTIFACTS_ENV] = ",".join(sorted(_state["kinds"]))
+    if out_dir is not None:
+        _state["out_dir"] = out_dir
+        os.environ[ARTIFACT_DIR_ENV] = out_dir
+
+
+def enabled(kind):
+    """Check whether an artifact kind was asked for
+
+    Args:
+        kind (str): one of KINDS
+
+    Returns:
+        bool: True when the kind is on
+    """
+    return kind in _state["kinds"]
+
+
+def records(log):
+    """Check whether a solver should emit its per-iteration debug records
+
+    Args:
+        log (logging.Logger): the solver's logger
+
+    Returns:
+        bool: True when records are on and the logger shows DEBUG
+    """
+    return "records" in _state["kinds"] and log.isEnabledFor(logging.DEBUG)
+
+
+def get_path(name):
+    """Get the file path for an artifact, creating the folder
+
+    Args:
+        name (str): file name, such as 'day10-sides.txt'
+
+    Returns:
+        str: full path
+    """
+    os.makedirs(_state["out_dir"], exist_ok=True)
+    return os.path.join(_state["out_dir"], name)
+
+
+def write_grid(name, grid, fmt="%d"):
+    """Dump a 2D numeric grid as text if grid artifacts are on
+
+    Args:
+        name (str): file name
+        grid (np.ndarray): grid to dump
+        fmt (str, optional): numpy savetxt format. Defaults to "%d".
+
+    Returns:
+        str: path written, or None when grid artifacts are off
+    """
+    if not enabled("grid"):
+        return None
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    path = get_path(name)
+    np.savetxt(path, grid, fmt=fmt)
+    logger.info("wrote %s", path)
+    return path
+
+
+def write_lines(kind, name, lines):
+    """Write text lines as an artifact if its kind is on
+
+    Args:
+        kind (str): one of KINDS
+        name (str): file name
+        lines (iterable): lines without trailing newlines
+
+    Returns:
+        str: path written, or None when the kind is off
+    """
+    if not enabled(kind):
+        return None
+    path = get_path(name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(f"{line}\n" for line in lines)
+    logger.info("wrote %s", path)
+    return path
@@ -0,0 +1,115 @@
+"""Solve many input files for one day across long-lived worker processes"""
+import glob
+import json
+import logging
+import os
+
+from . import days as aoc_days
+from .runner import run_day
+
+logger = logging.getLogger(__name__)
+
+
+def find_inputs(pattern):
+    """Expand a directory or glob pattern into input files
+
+    Args:
+        pattern (str): folder, whose files are all used, or a glob pattern
+
+    Returns:
+        list: sorted file paths
+    """
+    if os.path.isdir(pattern):
+        paths = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+        paths = glob.glob(pattern, recursive=True)
+    return sorted(os.path.abspath(p) for p in paths if os.path.isfile(p))
+
+
+def init_worker(day):
+    """Import a day's solve module once when a worker process starts
+
+    Args:
+        day (int): day number
+    """
+    aoc_days.load_module(day)
+
+
+def solve_input(day, path, parts=(1, 2), cache_dir=None, budget=None):
+    """Read, parse and solve one input file, timing each phase
+
+    Args:
+        day (int): day number
+        path (str): absolute input file path
+        parts (tuple, optional): parts to solve. Defaults to (1, 2).
+        cache_dir (str, optional): parse and answer cache folder, None to always
+            parse and solve. Defaults to None.
+        budget (float, optional): seconds each part may run before it is
+            cancelled, None for no limit. Defaults to None.
+
+    Returns:
+        dict: run_day result with the 'input' path
+    """
+    result = {"input": path}
+    result.update(run_day(day, path, parts, cache_dir, budget))
+    return result
+
+
+def run_batch(day, paths, jobs=None, parts=(1, 2), cache_dir=None, budget=None):
+    """Solve input files across a process pool, yielding results as they finish
+
+    Args:
+        day (int): day number
+        paths (list): absolute input file paths
+        jobs (int, optional): worker processes, None for one per CPU and 1 to run
+            in this process. Defaults to None.
+        parts (tuple, optional): parts to solve. Defaults to (1, 2).
+        cache_dir (str, optional): parse and answer cache folder, None to always
+            parse and solve. Defaults to None.
+        budget (float, optional): seconds each part may run before it is
+            cancelled, None for no limit. Defaults to None.
+
+    Yields:
+        dict: solve_input result per file, in completion order
+    """
+    if jobs == 1 or len(paths) <= 1:
+        for path in paths:
+            yield solve_input(day, path, parts, cache_dir, budget)
+        return
+
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(day,)
+    ) as pool:
+        futures = [
+            pool.submit(solve_input, day, path, parts, cache_dir, budget)
+            for path in paths
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_json_line(result):
+    """Render one batch result as a single JSON line
+
+    Args:
+        result (dict): solve_input result
+
+    Returns:
+        str: compact JSON without a trailing newline
+    """
+    return json.dumps(result, separators=(",", ":"), default=str)
+
+
+def has_error(result):
+    """Check whether reading, parsing or any part of a batch result failed
+
+    Args:
+        result (dict): solve_input result
+
+    Returns:
+        bool: True when an error was recorded
+    """
+    return "error" in result or any("error" in p for p in result["parts"].values())
@@ -0,0 +1,362 @@
+"""Benchmark harness timing each day's parse, Part 1 and Part 2 against a baseline"""
+import json
+import logging
+import os
+import platform
+import statistics
+import time
+
+from . import counters
+from . import days as aoc_days
+from . import engines as aoc_engines
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = os.path.join(aoc_days.ROOT, "bench_baseline.json")
+
+# timings below this many seconds are too noisy to gate on
+NOISE_FLOOR = 0.001
+
+
+def time_call(func, warmups=1, repeats=5, time_budget=10.0, setup=None):
+    """Time repeated calls of a function
+
+    Args:
+        func (callable): function taking the setup value (or nothing)
+        warmups (int, optional): untimed calls before measuring. Defaults to 1.
+        repeats (int, optional): maximum timed calls. Defaults to 5.
+        time_budget (float, optional): stop repeating once the timed calls have
+            used this many seconds; at least one call always runs. Defaults to 10.0.
+        setup (callable, optional): untimed function producing func's argument
+            for each call. Defaults to None.
+
+    Returns:
+        tuple: (last return value, stats dict of min/median/mean/stdev/runs)
+    """
+
+    def call_once():
+        if setup is None:
+            start = time.perf_counter()
+            value = func()
+        else:
+            arg = setup()
+            start = time.perf_counter()
+            value = func(arg)
+        return value, time.perf_counter() - start
+
+    spent = 0.0
+    for _ in range(warmups):
+        _, elapsed = call_once()
+        spent += elapsed
+        if spent > time_budget:
+            break
+
+    times = []
+    value = None
+    while len(times) < max(repeats, 1):
+        value, elapsed = call_once()
+        times.append(elapsed)
+        if sum(times) > time_budget:
+            break
+
+    stats = {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "runs": len(times),
+    }
+    return value, stats
+
+
+def bench_day(
+    day,
+    input_name="input.txt",
+    warmups=1,
+    repeats=5,
+    time_budget=10.0,
+    engines=None,
+    all_engines=False,
+):
+    """Benchmark the parse, Part 1 and Part 2 phases of a day on one input
+
+    Args:
+        day (int): day number
+        input_name (str, optional): input file in the day folder. Defaults to "input.txt".
+        warmups (int, optional): untimed calls per phase. Defaults to 1.
+        repeats (int, optional): maximum timed calls per phase. Defaults to 5.
+        time_budget (float, optional): seconds of timed calls per phase. Defaults to 10.0.
+        engines (dict, optional): part to engine name, None for the defaults.
+            Defaults to None.
+        all_engines (bool, optional): time every engine of each part as its
+            own 'partN:engine' phase. Defaults to False.
+
+    Returns:
+        dict: phase name ('parse', 'part1', 'part2') to stats, answer and the
+            last call's work counters, or error
+    """
+    module = aoc_days.load_module(day)
+    text_data = module.get_file_data(aoc_days.get_input_path(day, input_name))
+    phases = {}
+    parsed = {}
+    for part in (1, 2):
+        parse_name = aoc_days.get_parse_name(day, part)
+        try:
+            if parse_name not in parsed:
+                parsed[parse_name], stats = time_call(
+                    lambda: aoc_days.parse_input(module, parse_name, text_data),
+                    warmups,
+                    repeats,
+                    time_budget,
+                )
+                # days with a second parse function report it under its own name
+                key = "parse" if not phases else parse_name
+                phases[key] = {"stats": stats}
+        except Exception as err:  # pylint: disable=broad-except
+            phases[f"part{part}"] = {"error": f"{type(err).__name__}: {err}"}
+            continue
+        data = parsed[parse_name]
+        if all_engines:
+            names = {f"part{part}:{e}": e for e in aoc_days.get_engines(day, part)}
+        else:
+            names = {f"part{part}": (engines or {}).get(part)}
+        for phase, engine in names.items():
+            work = {}
+
+            def solve(d, e=engine, work=work):
+                with counters.collect() as counts:
+                    answer = aoc_days.solve_part(module, day, part, d, e)
+                work.update(counts)
+                return answer
+
+            try:
+                answer, stats = time_call(
+                    solve,
+                    warmups,
+                    repeats,
+                    time_budget,
+                    setup=lambda: aoc_days.get_part_input(day, data),
+                )
+                phases[phase] = {
+                    "stats": stats,
+                    "answer": aoc_days.to_plain(answer),
+                    "counters": work,
+                }
+            except Exception as err:  # pylint: disable=broad-except
+                phases[phase] = {"error": f"{type(err).__name__}: {err}"}
+    return phases
+
+
+def run_benchmarks(days, inputs=("test.txt", "input.txt"), **kwargs):
+    """Benchmark every selected day against each input file
+
+    Args:
+        days (list): day numbers
+        inputs (tuple, optional): input file names. Defaults to ("test.txt", "input.txt").
+        **kwargs: warmups, repeats, time_budget and all_engines passed to
+            bench_day, and engine_selection and engine_choices resolved into
+            each day's engines
+
+    Returns:
+        dict: benchmark document with environment info and results keyed
+            by day then input name
+    """
+    selection = kwargs.pop("engine_selection", None)
+    choices = kwargs.pop("engine_choices", None)
+    results = {}
+    for day in days:
+        results[str(day)] = {}
+        for input_name in inputs:
+            logger.info("benchmarking day %d on %s", day, input_name)
+            try:
+                engines = aoc_engines.resolve_day(day, selection, choices)
+                results[str(day)][input_name] = bench_day(
+                    day, input_name, engines=engines, **kwargs
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                results[str(day)][input_name] = {
+                    "error": f"{type(err).__name__}: {err}"
+                }
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def iter_timings(document):
+    """Yield every successfully timed phase in a benchmark document
+
+    Args:
+        document (dict): output of run_benchmarks
+
+    Yields:
+        tuple: (day, input name, phase name, stats)
+    """
+    for day, inputs in document["results"].items():
+        for input_name, phases in inputs.items():
+            for phase, entry in phases.items():
+                if isinstance(entry, dict) and "stats" in entry:
+                    yield day, input_name, phase, entry["stats"]
+
+
+def get_phase_error(document, day, input_name, phase):
+    """Explain why a phase has no timing in a benchmark document
+
+    Args:
+        document (dict): output of run_benchmarks
+        day (str): day number key
+        input_name (str): input file name
+        phase (str): phase name
+
+    Returns:
+        str: the phase's or input's error, 'missing' when the phase was not
+            timed, or None when the day and input were not benchmarked at all
+    """
+    phases = document["results"].get(day, {}).get(input_name)
+    if phases is None:
+        return None
+    entry = phases.get(phase)
+    if isinstance(entry, dict) and "error" in entry:
+        return entry["error"]
+    return phases.get("error", "missing")
+
+
+def compare(current, baseline, threshold=1.25):
+    """Compare benchmark medians against a baseline
+
+    A phase timed in the baseline that now fails, or is no longer timed, on
+    a day and input that were benchmarked again counts as regressed.
+
+    Args:
+        current (dict): output of run_benchmarks
+        baseline (dict): previously saved output of run_benchmarks
+        threshold (float, optional): allowed slowdown ratio. Defaults to 1.25.
+
+    Returns:
+        list: one dict per compared phase with old/new medians, ratio and a
+            'regressed' flag; a failed phase has None as 'new' and 'ratio'
+            and its 'error'
+    """
+    new = {
+        (day, input_name, phase): stats
+        for day, input_name, phase, stats in iter_timings(current)
+    }
+    comparisons = []
+    for day, input_name, phase, stats in iter_timings(baseline):
+        comparison = {
+            "day": int(day),
+            "input": input_name,
+            "phase": phase,
+            "old": stats["median"],
+        }
+        key = (day, input_name, phase)
+        if key not in new:
+            error = get_phase_error(current, day, input_name, phase)
+            if error is not None:
+                comparison.update(new=None, ratio=None, regressed=True, error=error)
+                comparisons.append(comparison)
+            continue
+        old_median = stats["median"]
+        new_median = new[key]["median"]
+        ratio = new_median / old_median if old_median else float("inf")
+        regressed = ratio > threshold and new_median - old_median > NOISE_FLOOR
+        comparison.update(new=new_median, ratio=ratio, regressed=regressed)
+        comparisons.append(comparison)
+    return comparisons
+
+
+def load_baseline(path=DEFAULT_BASELINE):
+    """Load a saved benchmark document
+
+    Args:
+        path (str, optional): JSON file. Defaults to DEFAULT_BASELINE.
+
+    Returns:
+        dict: benchmark document or None when the file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(document, path=DEFAULT_BASELINE):
+    """Write a benchmark document as the new baseline
+
+    Args:
+        document (dict): output of run_benchmarks
+        path (str, optional): JSON file. Defaults to DEFAULT_BASELINE.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def format_report(document, comparisons=None):
+    """Render benchmark results, and their baseline comparison, as a table
+
+    Args:
+        document (dict): output of run_benchmarks
+        comparisons (list, optional): output of compare. Defaults to None.
+
+    Returns:
+        str: text table
+    """
+    ratios = {}
+    for c in comparisons or []:
+        flag = " REGRESSED" if c["regressed"] else ""
+        ratio = "failed" if c["ratio"] is None else f"x{c['ratio']:.2f}"
+        ratios[(str(c["day"]), c["input"], c["phase"])] = ratio + flag
+        if c["ratio"] is None:
+            ratios[(str(c["day"]), c["input"], "-")] = "failed REGRESSED"
+
+    rows = [("day", "input", "phase", "median", "min", "runs", "vs baseline", "work")]
+    for day, inputs in document["results"].items():
+        for input_name, phases in inputs.items():
+            if "error" in phases:
+                rows.append(
+                    (
+                        day,
+                        input_name,
+                        "-",
+                        phases["error"],
+                        "",
+                        "",
+                        ratios.get((day, input_name, "-"), ""),
+                        "",
+                    )
+                )
+                continue
+            for phase, entry in phases.items():
+                if "error" in entry:
+                    rows.append(
+                        (
+                            day,
+                            input_name,
+                            phase,
+                            entry["error"],
+                            "",
+                            "",
+                            ratios.get((day, input_name, phase), ""),
+                            "",
+                        )
+                    )
+                    continue
+                stats = entry["stats"]
+                rows.append(
+                    (
+                        day,
+                        input_name,
+                        phase,
+                        f"{stats['median'] * 1000:.3f}ms",
+                        f"{stats['min'] * 1000:.3f}ms",
+                        str(stats["runs"]),
+                        ratios.get((day, input_name, phase), ""),
+                        counters.format_counters(entry.get("counters")),
+                    )
+                )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(v.ljust(w) for v, w in zip(row, widths)).rstrip() for row in rows
+    )
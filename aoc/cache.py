@@ -0,0 +1,273 @@
+"""Content-addressed on-disk caches of parsed inputs and solved answers"""
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "AOC_CACHE_DIR", os.path.join(aoc_days.ROOT, ".aoc_cache")
+)
+
+
+def hash_input(text_data):
+    """Hash the raw bytes of an input
+
+    Args:
+        text_data (str, bytes or mmap): raw input
+
+    Returns:
+        str: hex sha256 digest
+    """
+    if isinstance(text_data, str):
+        text_data = text_data.encode("utf-8")
+    return hashlib.sha256(text_data).hexdigest()
+
+
+def get_shared_sources(module):
+    """Find the sources of every aoc module a day module runs code from
+
+    Follows the aoc modules, and the aoc functions imported by name, that the
+    day module holds, then the ones those hold in turn, so a solver calling
+    aoc.search, which calls aoc.counters, depends on both. Only modules that
+    are already imported are looked at, so days without grids never import
+    numpy.
+
+    Args:
+        module (module): dayN.solve module
+
+    Returns:
+        list: source paths of the aoc modules, sorted
+    """
+    seen = set()
+    pending = [module]
+    while pending:
+        namespace = vars(pending.pop())
+        for value in namespace.values():
+            name = getattr(value, "__name__", None)
+            if not isinstance(value, type(sys)):
+                name = getattr(value, "__module__", None)
+            if not isinstance(name, str) or not name.startswith("aoc."):
+                continue
+            if name not in seen and name in sys.modules:
+                seen.add(name)
+                pending.append(sys.modules[name])
+    return sorted(sys.modules[name].__file__ for name in seen)
+
+
+@functools.lru_cache(maxsize=None)
+def hash_code(module):
+    """Hash the source of a day module and the aoc modules it builds on
+
+    The whole module is hashed rather than single functions because the
+    parse and solve functions call helpers and module-level lookup tables.
+    Editing any aoc module the day reaches, such as aoc.search or aoc.grid,
+    changes the hash too.
+
+    Args:
+        module (module): dayN.solve module
+
+    Returns:
+        str: hex sha256 digest
+    """
+    digest = hashlib.sha256()
+    for path in [module.__file__] + get_shared_sources(module):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_cache_path(cache_dir, day, name, input_hash, code_hash):
+    """Get the cache file path, without extension, for a parse result
+
+    Args:
+        cache_dir (str): cache root folder
+        day (int): day number
+        name (str): parse function name
+        input_hash (str): hash_input digest
+        code_hash (str): hash_code digest
+
+    Returns:
+        str: path prefix; '.npy' or '.pkl' is added when stored
+    """
+    return os.path.join(
+        cache_dir, f"day{day}", f"{name}-{input_hash[:16]}-{code_hash[:16]}"
+    )
+
+
+def load_parsed(path):
+    """Load a cached parse result
+
+    Args:
+        path (str): path prefix from get_cache_path
+
+    Returns:
+        tuple: (found, data)
+    """
+    if os.path.exists(path + ".npy"):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return True, np.load(path + ".npy")
+    if os.path.exists(path + ".pkl"):
+        with open(path + ".pkl", "rb") as f:
+            return True, pickle.load(f)
+    return False, None
+
+
+def save_parsed(path, data):
+    """Store a parse result, numpy grids as .npy and anything else pickled
+
+    The file is written under a temporary name and renamed into place so
+    concurrent runs never read a partial file.
+
+    Args:
+        path (str): path prefix from get_cache_path
+        data (any): parse result
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # only grid days produce arrays, and they have already imported numpy
+    np = sys.modules.get("numpy")
+    is_array = np is not None and isinstance(data, np.ndarray) and data.dtype != object
+    final = path + (".npy" if is_array else ".pkl")
+    temp = f"{final}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            if is_array:
+                np.save(f, data)
+            else:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, final)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def cached_parse(
+    module, day, parse_name, text_data, cache_dir=DEFAULT_CACHE_DIR, input_hash=None
+):
+    """Parse an input, reusing the stored result for the same bytes and code
+
+    Args:
+        module (module): dayN.solve module
+        day (int): day number
+        parse_name (str): parse function name
+        text_data (str, bytes or mmap): raw input
+        cache_dir (str, optional): cache root folder, None to always parse.
+            Defaults to DEFAULT_CACHE_DIR.
+        input_hash (str, optional): precomputed hash_input digest. Defaults to None.
+
+    Returns:
+        tuple: (parsed data, True when it came from the cache)
+    """
+    if cache_dir is None:
+        return aoc_days.parse_input(module, parse_name, text_data), False
+
+    path = get_cache_path(
+        cache_dir,
+        day,
+        parse_name,
+        input_hash or hash_input(text_data),
+        hash_code(module),
+    )
+    try:
+        found, data = load_parsed(path)
+    except Exception as err:  # pylint: disable=broad-except
+        logger.warning("ignoring unreadable cache entry %s: %s", path, err)
+        found = False
+    if found:
+        logger.debug("day %d %s loaded from %s", day, parse_name, path)
+        return data, True
+
+    data = aoc_days.parse_input(module, parse_name, text_data)
+    try:
+        save_parsed(path, data)
+    except Exception as err:  # pylint: disable=broad-except
+        logger.warning("could not cache day %d %s: %s", day, parse_name, err)
+    return data, False
+
+
+def get_answer_path(cache_dir, day, part, input_hash, code_hash, engine=None):
+    """Get the answer store file for a part
+
+    Args:
+        cache_dir (str): cache root folder
+        day (int): day number
+        part (int): 1 or 2
+        input_hash (str): hash_input digest
+        code_hash (str): hash_code digest
+        engine (str, optional): engine that solved it, since each engine's
+            time is stored separately. Defaults to None.
+
+    Returns:
+        str: JSON file path
+    """
+    name = f"answer{part}" if engine is None else f"answer{part}-{engine}"
+    return get_cache_path(cache_dir, day, name, input_hash, code_hash) + ".json"
+
+
+def load_answer(cache_dir, day, part, input_hash, code_hash, engine=None):
+    """Look up a stored answer for the same input bytes and solver source
+
+    Args:
+        cache_dir (str): cache root folder
+        day (int): day number
+        part (int): 1 or 2
+        input_hash (str): hash_input digest
+        code_hash (str): hash_code digest
+        engine (str, optional): engine that solved it. Defaults to None.
+
+    Returns:
+        dict: 'answer' with the original solve 'time' and 'counters', or
+            None when not stored
+    """
+    path = get_answer_path(cache_dir, day, part, input_hash, code_hash, engine)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        logger.warning("ignoring unreadable answer entry %s: %s", path, err)
+        return None
+
+
+def save_answer(
+    cache_dir,
+    day,
+    part,
+    input_hash,
+    code_hash,
+    answer,
+    elapsed,
+    engine=None,
+    counts=None,
+):
+    """Store a solved answer with the time and work it took
+
+    Args:
+        cache_dir (str): cache root folder
+        day (int): day number
+        part (int): 1 or 2
+        input_hash (str): hash_input digest
+        code_hash (str): hash_code digest
+        answer (any): json friendly answer
+        elapsed (float): solve time in seconds
+        engine (str, optional): engine that solved it. Defaults to None.
+        counts (dict, optional): work counters of the solve. Defaults to None.
+    """
+    path = get_answer_path(cache_dir, day, part, input_hash, code_hash, engine)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump({"answer": answer, "time": elapsed, "counters": counts or {}}, f)
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
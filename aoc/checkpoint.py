@@ -0,0 +1,172 @@
+"""Checkpoint and resume of long-running solver loops
+
+Inside session(), which the runner opens per part when checkpoints are on,
+a solver loop calls load(name, default) once to pick up where an earlier
+run stopped, and save(name, state) each iteration with a small picklable
+snapshot of its progress (loop index and accumulators, or simulator state
+and round count). save() writes to disk at most once per interval, and the
+latest state is also written when the part is interrupted (a budget
+timeout, Ctrl-C), so a rerun on the same input and solver source resumes
+from the last checkpoint. The file is removed once the part finishes.
+Outside session() load() returns the default and save() does nothing.
+"""
+
+import logging
+import os
+import pickle
+import time
+from contextlib import contextmanager
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = os.environ.get(
+    "AOC_CHECKPOINT_DIR", os.path.join(aoc_days.ROOT, ".aoc_checkpoints")
+)
+
+# seconds between two checkpoint writes
+CHECKPOINT_INTERVAL = 5.0
+
+_current = {
+    "path": None,
+    "states": None,
+    "dirty": False,
+    "interval": CHECKPOINT_INTERVAL,
+    "next_save": None,
+}
+
+
+def get_checkpoint_path(checkpoint_dir, day, part, input_hash, code_hash, engine):
+    """Get the checkpoint file for a part on one input
+
+    Args:
+        checkpoint_dir (str): checkpoint root folder
+        day (int): day number
+        part (int): 1 or 2
+        input_hash (str): cache.hash_input digest
+        code_hash (str): cache.hash_code digest
+        engine (str): engine solving the part
+
+    Returns:
+        str: pickle file path
+    """
+    name = f"part{part}-{engine}-{input_hash[:16]}-{code_hash[:16]}.pickle"
+    return os.path.join(checkpoint_dir, f"day{day}", name)
+
+
+def read_states(path):
+    """Read a checkpoint file
+
+    Args:
+        path (str): pickle file path
+
+    Returns:
+        dict: loop name to saved state, empty when there is no usable file
+    """
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as err:  # pylint: disable=broad-except
+        logger.warning("ignoring unreadable checkpoint %s: %s", path, err)
+        return {}
+
+
+def write_states(path, states):
+    """Write a checkpoint file atomically
+
+    Args:
+        path (str): pickle file path
+        states (dict): loop name to state
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            pickle.dump(states, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def flush():
+    """Write the latest saved states if they changed since the last write"""
+    if _current["path"] is None or not _current["dirty"]:
+        return
+    write_states(_current["path"], _current["states"])
+    _current["dirty"] = False
+    logger.debug("checkpointed %s", _current["path"])
+
+
+def load(name, default=None):
+    """Get the state a loop saved in an earlier run of this part
+
+    Args:
+        name (str): loop name, unique within the part
+        default (any, optional): state when there is none. Defaults to None.
+
+    Returns:
+        any: saved state, or default
+    """
+    if _current["path"] is None or name not in _current["states"]:
+        return default
+    logger.info("resuming %s from %s", name, _current["path"])
+    return _current["states"][name]
+
+
+def save(name, state):
+    """Record a loop's progress, writing it out at most once per interval
+
+    Args:
+        name (str): loop name, unique within the part
+        state (any): picklable snapshot that must not change afterwards,
+            such as a tuple of ints
+    """
+    if _current["path"] is None:
+        return
+    _current["states"][name] = state
+    _current["dirty"] = True
+    now = time.perf_counter()
+    if now >= _current["next_save"]:
+        _current["next_save"] = now + _current["interval"]
+        flush()
+
+
+@contextmanager
+def session(path, interval=CHECKPOINT_INTERVAL):
+    """Let the loops of one part resume from, and save to, a checkpoint file
+
+    Args:
+        path (str): get_checkpoint_path result, None to turn checkpoints off
+        interval (float, optional): seconds between writes.
+            Defaults to CHECKPOINT_INTERVAL.
+    """
+    if path is None:
+        yield
+        return
+    saved = dict(_current)
+    _current.update(
+        path=path,
+        states=read_states(path),
+        dirty=False,
+        interval=interval,
+        next_save=time.perf_counter() + interval,
+    )
+    try:
+        yield
+    except BaseException:
+        # keep the newest progress of an interrupted part for the next run
+        try:
+            flush()
+        except OSError as err:
+            logger.warning("could not checkpoint %s: %s", path, err)
+        raise
+    else:
+        if os.path.exists(path):
+            os.remove(path)
+    finally:
+        _current.clear()
+        _current.update(saved)
@@ -0,0 +1,200 @@
+"""Empirical scaling report: time and peak memory of each solver over growing inputs"""
+import logging
+import math
+import statistics
+import time
+import tracemalloc
+
+from . import days as aoc_days
+from . import generators
+
+logger = logging.getLogger(__name__)
+
+
+def measure_phase(func, memory=True):
+    """Time a call and, optionally, rerun it under tracemalloc for its peak
+
+    Args:
+        func (callable): function taking no arguments
+        memory (bool, optional): also measure peak traced memory. Defaults to True.
+
+    Returns:
+        dict: 'time' in seconds and 'peak' in bytes (None without memory)
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {"time": elapsed, "peak": peak}
+
+
+def fit_exponent(xs, ys):
+    """Fit y ~ c * x^k on a log-log scale
+
+    Args:
+        xs (list): input sizes
+        ys (list): measured values
+
+    Returns:
+        float: fitted exponent k, or None with fewer than two usable points
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y]
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return None
+    slope, _ = statistics.linear_regression(*zip(*points))
+    return slope
+
+
+def get_phase_name(day, phase):
+    """Get a readable solver name such as day7.get_total_winnings_2
+
+    Args:
+        day (int): day number
+        phase (str): 'parse', 'part1' or 'part2'
+
+    Returns:
+        str: dotted day and function name
+    """
+    if phase == "parse":
+        return f"day{day}.{aoc_days.get_spec(day)['parse']}"
+    part = int(phase[-1])
+    return f"day{day}.{aoc_days.get_solver_name(day, part)}"
+
+
+def scale_day(day, steps=5, factor=2.0, start=0.25, max_time=10.0, seed=0, memory=True):
+    """Run a day's parse and parts over geometrically growing generated inputs
+
+    A phase stops growing once a single run takes longer than max_time or
+    raises, so the slow solvers stay bounded.
+
+    Args:
+        day (int): day number
+        steps (int, optional): number of input sizes. Defaults to 5.
+        factor (float, optional): growth between sizes. Defaults to 2.0.
+        start (float, optional): smallest size as a fraction of the real
+            puzzle scale. Defaults to 0.25.
+        max_time (float, optional): seconds after which a phase stops growing.
+            Defaults to 10.0.
+        seed (int, optional): generator seed. Defaults to 0.
+        memory (bool, optional): also fit peak memory. Defaults to True.
+
+    Returns:
+        dict: measured points and per-phase fits
+    """
+    module = aoc_days.load_module(day)
+    default_size = generators.get_default_size(day)
+    active = {"parse", "part1", "part2"}
+    points = []
+    errors = {}
+    for step in range(steps):
+        size = max(int(round(default_size * start * factor**step)), 1)
+        if points and size == points[-1]["size"]:
+            continue
+        text_data = generators.generate_input(day, size, seed)
+        point = {"size": size, "bytes": len(text_data), "phases": {}}
+        points.append(point)
+        parsed = {}
+        for phase in ("parse", "part1", "part2"):
+            if phase not in active:
+                continue
+            try:
+                if phase == "parse":
+                    name = aoc_days.get_spec(day)["parse"]
+                    result = measure_phase(
+                        lambda: aoc_days.parse_input(module, name, text_data), memory
+                    )
+                else:
+                    part = int(phase[-1])
+                    name = aoc_days.get_parse_name(day, part)
+                    if name not in parsed:
+                        parsed[name] = aoc_days.parse_input(module, name, text_data)
+                    data = parsed[name]
+                    result = measure_phase(
+                        lambda: aoc_days.solve_part(
+                            module, day, part, aoc_days.get_part_input(day, data)
+                        ),
+                        memory,
+                    )
+            except Exception as err:  # pylint: disable=broad-except
+                errors[phase] = f"size {size}: {type(err).__name__}: {err}"
+                active.discard(phase)
+                continue
+            point["phases"][phase] = result
+            logger.debug("day %d %s size %d: %s", day, phase, size, result)
+            if result["time"] > max_time:
+                active.discard(phase)
+        if not active:
+            break
+
+    fits = {}
+    for phase in ("parse", "part1", "part2"):
+        measured = [p for p in points if phase in p["phases"]]
+        xs = [p["bytes"] for p in measured]
+        fits[phase] = {
+            "name": get_phase_name(day, phase),
+            "time_exponent": fit_exponent(
+                xs, [p["phases"][phase]["time"] for p in measured]
+            ),
+            "memory_exponent": fit_exponent(
+                xs, [p["phases"][phase]["peak"] for p in measured]
+            ),
+            "points": len(measured),
+            "error": errors.get(phase),
+        }
+    return {"day": day, "points": points, "fits": fits}
+
+
+def format_exponent(exponent):
+    """Format a fitted exponent as n^k
+
+    Args:
+        exponent (float): fitted exponent or None
+
+    Returns:
+        str: formatted exponent
+    """
+    if exponent is None:
+        return "n/a"
+    return f"n^{exponent:.2f}"
+
+
+def format_report(reports):
+    """Render scaling fits, one line per solver
+
+    Args:
+        reports (list): scale_day results
+
+    Returns:
+        str: text report, n being the generated input size in bytes
+    """
+    lines = []
+    for report in reports:
+        for phase, fit in report["fits"].items():
+            largest = max(
+                (p for p in report["points"] if phase in p["phases"]),
+                key=lambda p: p["bytes"],
+                default=None,
+            )
+            line = (
+                f"{fit['name']} ~ {format_exponent(fit['time_exponent'])} time, "
+                f"{format_exponent(fit['memory_exponent'])} peak memory "
+                f"({fit['points']} sizes"
+            )
+            if largest:
+                line += (
+                    f", largest {largest['bytes']} bytes in "
+                    f"{largest['phases'][phase]['time']:.3f}s"
+                )
+            line += ")"
+            if fit["error"]:
+                line += f" stopped at {fit['error']}"
+            lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,56 @@
+"""Algorithmic work counters reported by solvers next to their timings
+
+Solvers tally work in local ints inside their loops and hand the totals to
+add() once per call, such as states expanded by a search or pulses sent
+through day 20's modules. The runner wraps each part in collect(), so the
+totals land in that part's result. Outside collect() add() returns straight
+away, and solvers run on their own behave exactly as before.
+"""
+
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_current = {"counts": None}
+
+
+def add(name, amount=1):
+    """Add to a named work counter of the part being solved
+
+    Args:
+        name (str): counter name, such as 'expanded' or 'memo_hits'
+        amount (int, optional): work done. Defaults to 1.
+    """
+    counts = _current["counts"]
+    if counts is None:
+        return
+    counts[name] = counts.get(name, 0) + amount
+
+
+@contextmanager
+def collect():
+    """Collect the counters added while a block runs
+
+    Yields:
+        dict: counter name to total, filled in as the block runs
+    """
+    saved = _current["counts"]
+    counts = {}
+    _current["counts"] = counts
+    try:
+        yield counts
+    finally:
+        _current["counts"] = saved
+
+
+def format_counters(counts):
+    """Render counters as a single line, sorted by name
+
+    Args:
+        counts (dict): counter name to total
+
+    Returns:
+        str: 'name=total' pairs, empty when there are none
+    """
+    return " ".join(f"{name}={counts[name]:,}" for name in sorted(counts or {}))
@@ -0,0 +1,138 @@
+"""Cycle detection for simulations run for far more steps than they have states
+
+A simulation is a step(state) function returning the next state. Snapshots
+are compared through key(state), which should be a compact hashable value
+such as a grid's bytes or a bitmask. Both detectors return
+(prefix, period, state at step n): states prefix + k * period are all equal
+for k >= 0, and prefix and period are None when step n came before any
+repeat.
+"""
+
+import logging
+
+from . import counters
+from . import progress
+from . import timeline
+
+logger = logging.getLogger(__name__)
+
+
+def find_cycle_dict(step, state, n, key=None):
+    """Detect a cycle by remembering the step each key was first seen at
+
+    Simulates prefix + period steps and keeps every state in memory, so the
+    state at step n is looked up rather than simulated again.
+
+    Args:
+        step (callable): state to next state, leaving its argument unchanged
+        state (any): state at step 0
+        n (int): step whose state is wanted
+        key (callable, optional): state to hashable snapshot, None to hash
+            the state itself. Defaults to None.
+
+    Returns:
+        tuple: (prefix, period, state at step n)
+    """
+    key = key or (lambda s: s)
+    seen = {}
+    states = []
+    for i in range(n + 1):
+        snapshot = key(state)
+        if snapshot in seen:
+            prefix = seen[snapshot]
+            period = i - prefix
+            counters.add("steps", i)
+            logger.debug("cycle of %d after %d steps", period, prefix)
+            return prefix, period, states[prefix + (n - prefix) % period]
+        seen[snapshot] = i
+        states.append(state)
+        progress.report(i)
+        if i < n:
+            state = step(state)
+    counters.add("steps", n)
+    return None, None, state
+
+
+def find_cycle_brent(step, state, n, key=None):
+    """Detect a cycle with Brent's algorithm, holding only two states at a time
+
+    Args:
+        step (callable): state to next state, leaving its argument unchanged
+        state (any): state at step 0
+        n (int): step whose state is wanted
+        key (callable, optional): state to comparable snapshot, None to
+            compare the states themselves. Defaults to None.
+
+    Returns:
+        tuple: (prefix, period, state at step n)
+    """
+    key = key or (lambda s: s)
+    start = state
+    if n == 0:
+        return None, None, start
+
+    # find the period: the hare runs ahead in power of two stretches until
+    # it meets the tortoise parked at the start of the stretch
+    power = period = 1
+    tortoise, hare = start, step(start)
+    hare_steps = 1
+    while key(tortoise) != key(hare):
+        if hare_steps >= n:
+            # step n came first, and the hare is standing on it
+            counters.add("steps", hare_steps)
+            return None, None, hare
+        if power == period:
+            tortoise = hare
+            power *= 2
+            period = 0
+        hare = step(hare)
+        hare_steps += 1
+        period += 1
+        progress.report(hare_steps)
+
+    # find the prefix: walk two states period apart until they match
+    tortoise = hare = start
+    for _ in range(period):
+        hare = step(hare)
+    prefix = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        prefix += 1
+    logger.debug("cycle of %d after %d steps", period, prefix)
+
+    counters.add("steps", hare_steps + period + 2 * prefix)
+    if n < prefix:
+        state = start
+        remaining = n
+    else:
+        # tortoise is the state at step prefix
+        state = tortoise
+        remaining = (n - prefix) % period
+    for _ in range(remaining):
+        state = step(state)
+    counters.add("steps", remaining)
+    return prefix, period, state
+
+
+METHODS = {"dict": find_cycle_dict, "brent": find_cycle_brent}
+
+
+def find_cycle(step, state, n, key=None, method="dict"):
+    """Get the state after n steps of a simulation that eventually repeats
+
+    Args:
+        step (callable): state to next state, leaving its argument unchanged
+        state (any): state at step 0
+        n (int): step whose state is wanted
+        key (callable, optional): state to hashable snapshot. Defaults to None.
+        method (str, optional): 'dict' to keep every state, fastest when they
+            fit in memory, or 'brent' for constant memory. Defaults to "dict".
+
+    Returns:
+        tuple: (prefix, period, state at step n)
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    with timeline.span("find_cycle", method=method):
+        return METHODS[method](step, state, n, key)
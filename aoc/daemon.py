@@ -0,0 +1,242 @@
+"""Long-lived solver daemon answering day/part requests over a Unix socket
+
+Requests and replies are one JSON object per line. A request names a day and
+part plus either an input file (relative to the day folder, or absolute) or
+the raw input text:
+
+    {"day": 7, "part": 2, "input": "test.txt"}
+    {"day": 2, "part": 1, "data": "Game 1: 3 blue, 4 red\\n"}
+    {"command": "ping"}
+    {"command": "shutdown"}
+
+Each connection is served by its own thread, and the solves run in a pool of
+worker processes that imported every day module when they started.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import counters
+from . import days as aoc_days
+from . import progress
+from .runner import format_error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = os.environ.get("AOC_SOCKET", os.path.join(aoc_days.ROOT, ".aoc.sock"))
+
+# seconds between checks of the stop flag while waiting for connections
+ACCEPT_TIMEOUT = 0.2
+
+
+def preload(days=None):
+    """Import the solve modules of a worker up front
+
+    Args:
+        days (list, optional): day numbers, None for every day. Defaults to None.
+
+    Returns:
+        list: days that imported cleanly
+    """
+    loaded = []
+    for day in days or aoc_days.discover_days():
+        try:
+            aoc_days.load_module(day)
+            loaded.append(day)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("day %d not preloaded: %s", day, format_error(err))
+    return loaded
+
+
+def get_loaded():
+    """List the days whose solve modules a worker has imported
+
+    Returns:
+        list: day numbers
+    """
+    return [day for day in aoc_days.discover_days() if f"day{day}.solve" in sys.modules]
+
+
+def solve_request(request):
+    """Parse an input and solve one part, in a worker process
+
+    Args:
+        request (dict): 'day', 'part', either 'input' or 'data', and an
+            optional 'budget' in seconds for the solve
+
+    Returns:
+        dict: 'day', 'part', 'answer', 'parse_time' and 'time' in seconds,
+            and the solve's work 'counters'
+    """
+    day, part = int(request["day"]), int(request["part"])
+    if part not in aoc_days.get_spec(day)["parts"]:
+        raise ValueError(f"day {day} has no part {part}")
+    module = aoc_days.load_module(day)
+    if "data" in request:
+        text_data = request["data"]
+    else:
+        text_data = module.get_file_data(
+            aoc_days.get_input_path(day, request.get("input", "input.txt"))
+        )
+    start = time.perf_counter()
+    data = aoc_days.parse_input(module, aoc_days.get_parse_name(day, part), text_data)
+    parse_time = time.perf_counter() - start
+    data = aoc_days.get_part_input(day, data)
+    start = time.perf_counter()
+    with counters.collect() as counts:
+        with progress.budget(
+            request.get("budget"),
+            label=f"day {day} part {part}",
+            callback=progress.get_callback(request.get("budget")),
+        ):
+            answer = aoc_days.solve_part(module, day, part, data)
+    return {
+        "day": day,
+        "part": part,
+        "answer": aoc_days.to_plain(answer),
+        "parse_time": parse_time,
+        "time": time.perf_counter() - start,
+        "counters": counts,
+    }
+
+
+def handle_line(line, pool, stop, loaded):
+    """Answer one request line
+
+    Args:
+        line (bytes): JSON request
+        pool (concurrent.futures.Executor): solver workers
+        stop (threading.Event): set by a shutdown request
+        loaded (list): preloaded day numbers, reported by ping
+
+    Returns:
+        dict: reply, with 'error' when the request failed
+    """
+    try:
+        request = json.loads(line)
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "days": loaded}
+        if command == "shutdown":
+            stop.set()
+            return {"ok": True}
+        if command is not None:
+            raise ValueError(f"unknown command {command!r}")
+        return pool.submit(solve_request, request).result()
+    except Exception as err:  # pylint: disable=broad-except
+        return {"error": format_error(err)}
+
+
+def handle_connection(conn, pool, stop, loaded):
+    """Answer request lines from one client until it disconnects
+
+    Args:
+        conn (socket.socket): accepted connection
+        pool (concurrent.futures.Executor): solver workers
+        stop (threading.Event): set by a shutdown request
+        loaded (list): preloaded day numbers
+    """
+    with conn, conn.makefile("rb") as reader:
+        for line in reader:
+            if not line.strip():
+                continue
+            reply = handle_line(line, pool, stop, loaded)
+            try:
+                conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+            except OSError as err:
+                logger.debug("client went away: %s", err)
+                return
+
+
+def serve(socket_path=DEFAULT_SOCKET, jobs=None, days=None, stop=None, ready=None):
+    """Serve solve requests on a Unix socket until stopped
+
+    Args:
+        socket_path (str, optional): socket file. Defaults to DEFAULT_SOCKET.
+        jobs (int, optional): worker processes, None for one per CPU.
+            Defaults to None.
+        days (list, optional): days to preload, None for every day.
+            Defaults to None.
+        stop (threading.Event, optional): set to stop serving. Defaults to None.
+        ready (threading.Event, optional): set once requests are accepted.
+            Defaults to None.
+    """
+    stop = stop or threading.Event()
+    if os.path.exists(socket_path):
+        try:
+            send_requests([{"command": "ping"}], socket_path, timeout=1)
+        except OSError:
+            os.remove(socket_path)
+        else:
+            raise RuntimeError(f"a daemon is already serving {socket_path}")
+
+    jobs = jobs or os.cpu_count()
+    # forkserver workers start from a clean process, not a fork of this
+    # threaded server
+    pool = ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=preload,
+        initargs=(days,),
+    )
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # start every worker now so the first requests do not pay for imports
+        warmups = [pool.submit(get_loaded) for _ in range(jobs)]
+        loaded = [future.result() for future in warmups][0]
+        listener.bind(socket_path)
+        listener.listen()
+        listener.settimeout(ACCEPT_TIMEOUT)
+        logger.info("serving days %s on %s with %d workers", loaded, socket_path, jobs)
+        if ready is not None:
+            ready.set()
+        while not stop.is_set():
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            threading.Thread(
+                target=handle_connection,
+                args=(conn, pool, stop, loaded),
+                daemon=True,
+            ).start()
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        pool.shutdown(cancel_futures=True)
+        logger.info("stopped serving %s", socket_path)
+
+
+def send_requests(requests, socket_path=DEFAULT_SOCKET, timeout=None):
+    """Send requests over one connection and wait for each reply
+
+    Args:
+        requests (list): request dicts
+        socket_path (str, optional): socket file. Defaults to DEFAULT_SOCKET.
+        timeout (float, optional): seconds to wait on the socket, None to wait
+            for slow solves. Defaults to None.
+
+    Returns:
+        list: reply dicts in request order
+    """
+    replies = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(socket_path)
+        with conn.makefile("rb") as reader:
+            for request in requests:
+                conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+                line = reader.readline()
+                if not line:
+                    raise ConnectionError("daemon closed the connection")
+                replies.append(json.loads(line))
+    return replies
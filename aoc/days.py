@@ -0,0 +1,466 @@
+"""Discovery and uniform calling conventions for the dayN/solve.py modules"""
+import copy
+import importlib
+import logging
+import os
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Each day's solver functions have their own names and argument shapes, so the
+# table below describes how to drive them uniformly:
+#   parse: name of the function turning the raw text blob into parsed data
+#   parts: per-part entries with
+#     func: name of the solver function
+#     engines: optional engine name to solver function name, for parts with
+#           several interchangeable solvers taking the same arguments; such
+#           parts name their default engine instead of a func
+#     default: engine used unless another is selected
+#     reference: optional engine whose answers every other engine must match,
+#           usually the slow solver a faster one replaced, checked by aoc.fuzz
+#     args: None to pass the parsed data as-is, or N to unpack the first N
+#           entries of a parsed tuple as positional arguments
+#     parse: optional parse function overriding the day's default for this part
+#   mutates: True when the solvers modify their input, so each part gets a copy
+# Days missing from the table fall back to the template names in DEFAULT_SPEC.
+
+# engine name of a part with a single solver
+DEFAULT_ENGINE = "default"
+
+DEFAULT_SPEC = {
+    "parse": "parse_data",
+    "parts": {1: {"func": "function"}, 2: {"func": "function2"}},
+}
+
+DAY_SPECS = {
+    1: {
+        "parse": "parse_data",
+        "parts": {1: {"func": "get_cal_sum"}, 2: {"func": "get_cal_sum_part2"}},
+    },
+    2: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "get_possible_games_sum"},
+            2: {"func": "get_min_power_sum"},
+        },
+    },
+    3: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "get_part_number_sum", "args": 2},
+            2: {"func": "get_gear_ratio_sum", "args": 2},
+        },
+    },
+    4: {
+        "parse": "parse_data",
+        "parts": {1: {"func": "get_points_worth"}, 2: {"func": "get_cards_count"}},
+    },
+    5: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "find_lowest_location", "args": 2},
+            2: {"func": "find_lowest_location_with_ranges", "args": 2},
+        },
+    },
+    6: {
+        "parse": "parse_data",
+        "parts": {
+            1: {
+                "engines": {
+                    "closed_form": "find_wins_closed_form",
+                    "brute_force": "find_wins",
+                },
+                "default": "closed_form",
+                "reference": "brute_force",
+                "args": 2,
+            },
+            2: {
+                "engines": {
+                    "closed_form": "get_race_winners_closed_form",
+                    "brute_force": "get_race_winners",
+                },
+                "default": "closed_form",
+                "reference": "brute_force",
+                "args": 2,
+                "parse": "parse_data2",
+            },
+        },
+    },
+    7: {
+        "parse": "parse_data",
+        "parts": {
+            1: {
+                "engines": {
+                    "sorted": "get_total_winnings_sorted",
+                    "insertion": "get_total_winnings",
+                },
+                "default": "sorted",
+                "reference": "insertion",
+            },
+            2: {
+                "engines": {
+                    "sorted": "get_total_winnings_2_sorted",
+                    "insertion": "get_total_winnings_2",
+                },
+                "default": "sorted",
+                "reference": "insertion",
+            },
+        },
+    },
+    8: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "get_min_required_steps"},
+            2: {"func": "get_min_required_ghost_steps"},
+        },
+    },
+    9: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "find_extrapolation_sum"},
+            2: {"func": "find_extrapolation_prev_sum"},
+        },
+    },
+    10: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "function"},
+            2: {
+                "engines": {
+                    "shoelace": "get_enclosed_tile_count_shoelace",
+                    "flood_fill": "get_enclosed_tile_count",
+                },
+                "default": "shoelace",
+                "reference": "flood_fill",
+            },
+        },
+    },
+    11: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "get_sum_galaxy_distances"},
+            2: {"func": "get_sum_galaxy_distances_multiple"},
+        },
+    },
+    12: {
+        "parse": "parse_data",
+        "parts": {
+            1: {
+                "engines": {
+                    "table": "get_sum_arrangements_dp",
+                    "work_queue": "get_sum_arrangements",
+                },
+                "default": "table",
+                "reference": "work_queue",
+            },
+            2: {
+                "engines": {
+                    "table": "get_expanded_sum_arrangements_dp",
+                    "work_queue": "get_expanded_sum_arrangements",
+                },
+                "default": "table",
+                "reference": "work_queue",
+            },
+        },
+    },
+    13: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "summarize_reflection_lines"},
+            2: {"func": "summarize_smudged_reflection_lines"},
+        },
+    },
+    14: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "get_load_after_north_tilt"},
+            2: {"func": "get_load_after_spin_cycles"},
+        },
+    },
+    15: {
+        "parse": "parse_data",
+        "parts": {1: {"func": "get_steps_hash_sum"}, 2: {"func": "function2"}},
+    },
+    16: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "get_energized_sum"},
+            2: {
+                "engines": {
+                    "serial": "check_all_entrances_for_max",
+                    "shared_pool": "check_all_entrances_for_max_shared",
+                },
+                "default": "serial",
+            },
+        },
+    },
+    17: {
+        "parse": "parse_data",
+        "parts": {
+            1: {
+                "engines": {
+                    "dial": "get_least_heat_lost_crucibles",
+                    "list_scan": "get_least_heat_lost_crucibles_list_scan",
+                },
+                "default": "dial",
+                "reference": "list_scan",
+            },
+            2: {
+                "engines": {
+                    "dial": "get_least_heat_loss_ultra_crucibles",
+                    "list_scan": "get_least_heat_loss_ultra_crucibles_list_scan",
+                },
+                "default": "dial",
+                "reference": "list_scan",
+            },
+        },
+    },
+    18: {
+        "parse": "parse_data",
+        "parts": {1: {"func": "function"}, 2: {"func": "function2"}},
+    },
+    19: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "function", "args": 2},
+            2: {"func": "function2", "args": 1},
+        },
+    },
+    20: {
+        "parse": "parse_data",
+        "parts": {1: {"func": "function"}, 2: {"func": "function2"}},
+        "mutates": True,
+    },
+    21: {
+        "parse": "parse_data",
+        "parts": {
+            1: {"func": "function", "args": 2},
+            2: {"func": "function2", "args": 1},
+        },
+    },
+}
+
+
+def discover_days(root=ROOT):
+    """Find every dayN folder that contains a solve.py module
+
+    Args:
+        root (str, optional): repository root to scan. Defaults to ROOT.
+
+    Returns:
+        list: sorted day numbers
+    """
+    days = []
+    for entry in os.listdir(root):
+        match = re.fullmatch(r"day(\d+)", entry)
+        if match and os.path.isfile(os.path.join(root, entry, "solve.py")):
+            days.append(int(match.group(1)))
+    days.sort()
+    return days
+
+
+def parse_day_range(text):
+    """Parse a day selection such as '1-5,7,9-10'
+
+    Args:
+        text (str): comma separated day numbers and inclusive ranges
+
+    Returns:
+        list: sorted, de-duplicated day numbers
+    """
+    days = set()
+    for chunk in text.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if "-" in chunk:
+            start, end = chunk.split("-")
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(chunk))
+    return sorted(days)
+
+
+def get_spec(day):
+    """Get the calling convention for a day
+
+    Args:
+        day (int): day number
+
+    Returns:
+        dict: spec entry, falling back to the template names
+    """
+    return DAY_SPECS.get(day, DEFAULT_SPEC)
+
+
+def load_day_module(day, name="solve"):
+    """Import a module from a day's folder, making the repo root importable
+
+    Args:
+        day (int): day number
+        name (str, optional): module name in the day folder. Defaults to "solve".
+
+    Returns:
+        module: the imported dayN.<name> module
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return importlib.import_module(f"day{day}.{name}")
+
+
+def load_module(day):
+    """Import the solve module for a day
+
+    Args:
+        day (int): day number
+
+    Returns:
+        module: the imported dayN.solve module
+    """
+    return load_day_module(day)
+
+
+def get_input_path(day, input_name="input.txt"):
+    """Get the path of an input file that lives in a day's folder
+
+    Args:
+        day (int): day number
+        input_name (str, optional): file name or absolute path. Defaults to "input.txt".
+
+    Returns:
+        str: full path to the input file
+    """
+    return os.path.join(ROOT, f"day{day}", input_name)
+
+
+def get_parse_name(day, part):
+    """Get the name of the parse function feeding a part
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+
+    Returns:
+        str: parse function name
+    """
+    spec = get_spec(day)
+    return spec["parts"][part].get("parse", spec["parse"])
+
+
+def parse_input(module, parse_name, text_data):
+    """Run a day's parse function over a raw text blob
+
+    Args:
+        module (module): dayN.solve module
+        parse_name (str): parse function name
+        text_data (str): raw text blob
+
+    Returns:
+        any: parsed data
+    """
+    return getattr(module, parse_name)(text_data)
+
+
+def get_part_input(day, data):
+    """Get the parsed data to hand to a solver, copied if the day's solvers mutate it
+
+    Args:
+        day (int): day number
+        data (any): parsed data shared between parts and runs
+
+    Returns:
+        any: data safe to pass to solve_part
+    """
+    if get_spec(day).get("mutates"):
+        return copy.deepcopy(data)
+    return data
+
+
+def get_engines(day, part):
+    """Get the interchangeable solvers of a part
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+
+    Returns:
+        dict: engine name to solver function name
+    """
+    entry = get_spec(day)["parts"][part]
+    if "engines" not in entry:
+        return {DEFAULT_ENGINE: entry["func"]}
+    return dict(entry["engines"])
+
+
+def get_default_engine(day, part):
+    """Get the engine a part runs unless another is selected
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+
+    Returns:
+        str: engine name
+    """
+    return get_spec(day)["parts"][part].get("default", DEFAULT_ENGINE)
+
+
+def get_solver_name(day, part, engine=None):
+    """Get the solver function name behind one of a part's engines
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+        engine (str, optional): engine name, None for the default.
+            Defaults to None.
+
+    Returns:
+        str: solver function name
+    """
+    engines = get_engines(day, part)
+    engine = engine or get_default_engine(day, part)
+    if engine not in engines:
+        raise ValueError(
+            f"day {day} part {part} has no engine {engine!r} "
+            f"(choose from {', '.join(engines)})"
+        )
+    return engines[engine]
+
+
+def solve_part(module, day, part, data, engine=None):
+    """Run a part's solver function against parsed data
+
+    Args:
+        module (module): dayN.solve module
+        day (int): day number
+        part (int): 1 or 2
+        data (any): parsed data, as returned by get_part_input
+        engine (str, optional): engine to solve with, None for the default.
+            Defaults to None.
+
+    Returns:
+        any: the part's answer
+    """
+    entry = get_spec(day)["parts"][part]
+    func = getattr(module, get_solver_name(day, part, engine))
+    n_args = entry.get("args")
+    if n_args is None:
+        return func(data)
+    return func(*data[:n_args])
+
+
+def to_plain(answer):
+    """Convert numpy scalars to plain python values for reporting
+
+    Args:
+        answer (any): solver answer
+
+    Returns:
+        any: json friendly answer
+    """
+    if hasattr(answer, "item"):
+        return answer.item()
+    return answer
@@ -0,0 +1,146 @@
+"""Selecting between a part's interchangeable solvers ('engines')
+
+Engines are declared in DAY_SPECS. Which one a part runs comes from, in
+order: an explicit selection such as '7=insertion,6.2=brute_force', the
+choices file written by 'bench --all-engines --pick-engines' from measured
+medians, and finally the spec's default.
+"""
+
+import json
+import logging
+import os
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHOICES = os.environ.get(
+    "AOC_ENGINES", os.path.join(aoc_days.ROOT, "engines.json")
+)
+
+
+def parse_selection(text):
+    """Parse an engine selection such as '7=insertion,6.2=brute_force'
+
+    Args:
+        text (str): comma separated day[.part]=engine pairs
+
+    Returns:
+        dict: (day, part) to engine name, part None for every part of a day
+
+    Raises:
+        ValueError: a pair is malformed or names an engine the day lacks
+    """
+    selection = {}
+    for chunk in (text or "").split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        target, _, engine = chunk.partition("=")
+        day, _, part = target.partition(".")
+        if not engine:
+            raise ValueError(f"expected day[.part]=engine, got {chunk!r}")
+        day, part, engine = int(day), int(part) if part else None, engine.strip()
+        parts = [part] if part else list(aoc_days.get_spec(day)["parts"])
+        if not any(engine in aoc_days.get_engines(day, p) for p in parts):
+            raise ValueError(f"day {day} has no engine {engine!r}")
+        selection[(day, part)] = engine
+    return selection
+
+
+def load_choices(path=DEFAULT_CHOICES):
+    """Load the engines picked by measured speed
+
+    Args:
+        path (str, optional): JSON file. Defaults to DEFAULT_CHOICES.
+
+    Returns:
+        dict: 'day.part' to engine name, empty when the file does not exist
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_choices(choices, path=DEFAULT_CHOICES):
+    """Write the engines picked by measured speed
+
+    Args:
+        choices (dict): 'day.part' to engine name
+        path (str, optional): JSON file. Defaults to DEFAULT_CHOICES.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(choices, f, indent=2, sort_keys=True)
+
+
+def resolve_engine(day, part, selection=None, choices=None):
+    """Work out which engine a part runs
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+        selection (dict, optional): parse_selection result. Defaults to None.
+        choices (dict, optional): load_choices result. Defaults to None.
+
+    Returns:
+        str: engine name
+    """
+    selection = selection or {}
+    engines = aoc_days.get_engines(day, part)
+    if (day, part) in selection:
+        return selection[(day, part)]
+    # a whole-day selection only applies to the parts that have that engine
+    if selection.get((day, None)) in engines:
+        return selection[(day, None)]
+    chosen = (choices or {}).get(f"{day}.{part}")
+    if chosen in engines:
+        return chosen
+    if chosen is not None:
+        logger.warning(
+            "ignoring unknown engine %r for day %d part %d", chosen, day, part
+        )
+    return aoc_days.get_default_engine(day, part)
+
+
+def resolve_day(day, selection=None, choices=None):
+    """Work out which engine each part of a day runs
+
+    Args:
+        day (int): day number
+        selection (dict, optional): parse_selection result. Defaults to None.
+        choices (dict, optional): load_choices result. Defaults to None.
+
+    Returns:
+        dict: part to engine name
+    """
+    return {
+        part: resolve_engine(day, part, selection, choices)
+        for part in aoc_days.get_spec(day)["parts"]
+    }
+
+
+def pick_fastest(document, input_name="input.txt"):
+    """Choose each multi-engine part's fastest engine from a benchmark
+
+    Args:
+        document (dict): run_benchmarks output with every engine timed
+        input_name (str, optional): input whose timings decide.
+            Defaults to "input.txt".
+
+    Returns:
+        dict: 'day.part' to the engine with the lowest median
+    """
+    best = {}
+    for day, phases in document["results"].items():
+        for phase, entry in phases.get(input_name, {}).items():
+            if ":" not in phase or "stats" not in entry:
+                continue
+            part, engine = phase[len("part") :].split(":")
+            if len(aoc_days.get_engines(int(day), int(part))) < 2:
+                continue
+            key = f"{day}.{part}"
+            median = entry["stats"]["median"]
+            if key not in best or median < best[key][1]:
+                best[key] = (engine, median)
+    return {key: engine for key, (engine, _) in best.items()}
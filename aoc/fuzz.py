@@ -0,0 +1,260 @@
+"""Differential fuzzing of optimized solvers against the ones they replaced
+
+A part whose DAY_SPECS entry names a 'reference' engine is fuzzed by
+generating many small seeded inputs with the day's generator and solving each
+with the reference and with each of the part's other engines. Inputs the
+reference itself rejects, or cannot solve within the per-case budget, are
+skipped. Any other disagreement, including the fast solver raising, is a
+mismatch, shrunk to a minimal reproducer by deleting input lines while the
+mismatch persists.
+"""
+
+import copy
+import json
+import logging
+import random
+
+from . import days as aoc_days
+from . import generators
+from . import progress
+from .runner import format_error
+
+logger = logging.getLogger(__name__)
+
+# generator sizes are drawn from 1 to this for each case
+DEFAULT_MAX_SIZE = 8
+
+# seconds each solver may spend on one case
+DEFAULT_CASE_BUDGET = 1.0
+
+
+def get_fuzzed_parts(day):
+    """List the parts of a day that have a reference solver to check against
+
+    Args:
+        day (int): day number
+
+    Returns:
+        list: part numbers
+    """
+    parts = aoc_days.get_spec(day)["parts"]
+    return sorted(part for part, entry in parts.items() if "reference" in entry)
+
+
+def get_checked_engines(day, part):
+    """List the engines of a part that are checked against its reference
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+
+    Returns:
+        list: engine names
+    """
+    reference = aoc_days.get_spec(day)["parts"][part].get("reference")
+    return [e for e in aoc_days.get_engines(day, part) if e != reference]
+
+
+def get_fuzzed_days():
+    """List the days with at least one reference solver
+
+    Returns:
+        list: day numbers
+    """
+    return [day for day in aoc_days.discover_days() if get_fuzzed_parts(day)]
+
+
+def solve_both(module, day, part, text_data, engine, budget=DEFAULT_CASE_BUDGET):
+    """Solve one input with a part's reference and another of its engines
+
+    Args:
+        module (module): dayN.solve module
+        day (int): day number
+        part (int): 1 or 2
+        text_data (str): raw input text
+        engine (str): engine checked against the reference
+        budget (float, optional): seconds each solver may take, None for no
+            limit. Defaults to DEFAULT_CASE_BUDGET.
+
+    Returns:
+        tuple: (expected, actual) answers, actual being an 'error: ...'
+            string when the engine raised, or None when the reference raised
+    """
+    entry = aoc_days.get_spec(day)["parts"][part]
+    parse_name = aoc_days.get_parse_name(day, part)
+    try:
+        data = aoc_days.parse_input(module, parse_name, text_data)
+        with progress.budget(budget, callback=None):
+            expected = aoc_days.solve_part(
+                module, day, part, copy.deepcopy(data), entry["reference"]
+            )
+    except Exception:  # pylint: disable=broad-except
+        return None
+    try:
+        with progress.budget(budget, callback=None):
+            actual = aoc_days.solve_part(module, day, part, data, engine)
+    except Exception as err:  # pylint: disable=broad-except
+        actual = f"error: {format_error(err)}"
+    return aoc_days.to_plain(expected), aoc_days.to_plain(actual)
+
+
+def is_mismatch(module, day, part, text_data, engine, budget=DEFAULT_CASE_BUDGET):
+    """Check whether an engine disagrees with the reference on an input
+
+    Args:
+        module (module): dayN.solve module
+        day (int): day number
+        part (int): 1 or 2
+        text_data (str): raw input text
+        engine (str): engine checked against the reference
+        budget (float, optional): seconds each solver may take.
+            Defaults to DEFAULT_CASE_BUDGET.
+
+    Returns:
+        bool: True when the reference solves it and the engine differs
+    """
+    answers = solve_both(module, day, part, text_data, engine, budget)
+    return answers is not None and answers[0] != answers[1]
+
+
+def minimize(text_data, still_fails):
+    """Shrink an input by deleting runs of lines while it keeps failing
+
+    Tries halves, then quarters and so on down to single lines, keeping each
+    deletion that still fails.
+
+    Args:
+        text_data (str): failing input text
+        still_fails (callable): input text to bool
+
+    Returns:
+        str: smallest failing input found
+    """
+    lines = text_data.splitlines()
+    chunk = max(len(lines) // 2, 1)
+    while True:
+        i = 0
+        removed = False
+        while i < len(lines) and len(lines) > 1:
+            trial = lines[:i] + lines[i + chunk :]
+            if trial and still_fails("\n".join(trial) + "\n"):
+                lines = trial
+                removed = True
+            else:
+                i += chunk
+        if chunk == 1 and not removed:
+            break
+        chunk = max(chunk // 2, 1)
+    return "\n".join(lines) + "\n"
+
+
+def fuzz_part(
+    day,
+    part,
+    engine=None,
+    cases=1000,
+    max_size=DEFAULT_MAX_SIZE,
+    seed=0,
+    budget=DEFAULT_CASE_BUDGET,
+):
+    """Compare one of a part's engines against its reference on generated inputs
+
+    Args:
+        day (int): day number
+        part (int): 1 or 2
+        engine (str, optional): engine to check, None for the default.
+            Defaults to None.
+        cases (int, optional): inputs to generate. Defaults to 1000.
+        max_size (int, optional): largest generator size. Defaults to
+            DEFAULT_MAX_SIZE.
+        seed (int, optional): seed picking each case's size and generator seed.
+            Defaults to 0.
+        budget (float, optional): seconds each solver may spend on one case.
+            Defaults to DEFAULT_CASE_BUDGET.
+
+    Returns:
+        dict: day, part, engine, case counts, the seeds of every mismatching case and,
+            for the first one, its minimized input and both answers
+    """
+    module = aoc_days.load_module(day)
+    engine = engine or aoc_days.get_default_engine(day, part)
+    rng = random.Random(seed)
+    report = {
+        "day": day,
+        "part": part,
+        "engine": engine,
+        "cases": cases,
+        "skipped": 0,
+        "mismatches": [],
+        "reproducer": None,
+    }
+    for _ in range(cases):
+        size = rng.randint(1, max_size)
+        case_seed = rng.randrange(2**32)
+        text_data = generators.generate_input(day, size, case_seed)
+        answers = solve_both(module, day, part, text_data, engine, budget)
+        if answers is None:
+            report["skipped"] += 1
+            continue
+        if answers[0] == answers[1]:
+            continue
+        report["mismatches"].append({"size": size, "seed": case_seed})
+        if report["reproducer"] is None:
+            text_data = minimize(
+                text_data, lambda t: is_mismatch(module, day, part, t, engine, budget)
+            )
+            expected, actual = solve_both(module, day, part, text_data, engine, budget)
+            report["reproducer"] = {
+                "input": text_data,
+                "expected": expected,
+                "actual": actual,
+            }
+            logger.warning(
+                "day %d part %d %s: mismatch on size %d seed %d",
+                day,
+                part,
+                engine,
+                size,
+                case_seed,
+            )
+    return report
+
+
+def format_report(reports):
+    """Render fuzz results, one line per part plus any reproducer
+
+    Args:
+        reports (list): fuzz_part results
+
+    Returns:
+        str: text report
+    """
+    lines = []
+    for report in reports:
+        checked = report["cases"] - report["skipped"]
+        name = f"day {report['day']} part {report['part']} {report['engine']}"
+        if not report["mismatches"]:
+            lines.append(f"{name}: ok, {checked} inputs agree")
+            continue
+        lines.append(
+            f"{name}: {len(report['mismatches'])} of {checked} inputs differ, "
+            f"first at size {report['mismatches'][0]['size']} "
+            f"seed {report['mismatches'][0]['seed']}"
+        )
+        reproducer = report["reproducer"]
+        lines.append(f"  expected {reproducer['expected']!r}")
+        lines.append(f"  actual   {reproducer['actual']!r}")
+        lines.extend(f"  | {line}" for line in reproducer["input"].splitlines())
+    return "\n".join(lines)
+
+
+def format_json(reports):
+    """Render fuzz results as JSON
+
+    Args:
+        reports (list): fuzz_part results
+
+    Returns:
+        str: JSON document
+    """
+    return json.dumps(reports, indent=2, default=str)
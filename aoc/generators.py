@@ -0,0 +1,63 @@
+"""Seeded synthetic inputs from the dayN/generate.py modules"""
+import logging
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+
+def load_generator(day):
+    """Import the generate module for a day
+
+    Args:
+        day (int): day number
+
+    Returns:
+        module: the imported dayN.generate module
+    """
+    return aoc_days.load_day_module(day, "generate")
+
+
+def get_default_size(day):
+    """Get the size at which a day's generator matches the real puzzle input
+
+    Args:
+        day (int): day number
+
+    Returns:
+        int: default size
+    """
+    return load_generator(day).DEFAULT_SIZE
+
+
+def generate_input(day, size=None, seed=0):
+    """Generate an input text blob for a day
+
+    Args:
+        day (int): day number
+        size (int, optional): generator size, None for real puzzle scale.
+            Defaults to None.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    generator = load_generator(day)
+    if size is None:
+        size = generator.DEFAULT_SIZE
+    return generator.generate(size, seed)
+
+
+def write_input(day, path, size=None, seed=0):
+    """Generate an input for a day and write it to a file
+
+    Args:
+        day (int): day number
+        path (str): output file
+        size (int, optional): generator size. Defaults to None.
+        seed (int, optional): random seed. Defaults to 0.
+    """
+    text_data = generate_input(day, size, seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text_data)
+    logger.debug("wrote %d bytes for day %d to %s", len(text_data), day, path)
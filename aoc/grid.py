@@ -0,0 +1,158 @@
+"""Character grids read straight from the input bytes as 2-D numpy arrays"""
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+
+def to_bytes(text_data):
+    """Get a bytes-like view of an input blob
+
+    Args:
+        text_data (str, bytes, bytearray, memoryview or mmap): raw input
+
+    Returns:
+        bytes-like: the blob itself when it already supports the buffer
+            protocol, otherwise its ASCII encoding
+    """
+    if isinstance(text_data, str):
+        return text_data.encode("ascii")
+    return text_data
+
+
+def make_lookup(codes, dtype=np.uint8, default=0):
+    """Build a 256-entry table translating byte values to grid codes
+
+    Args:
+        codes (dict): character to code, e.g. {".": 0, "#": 1}
+        dtype (type, optional): code type. Defaults to np.uint8.
+        default (int, optional): code for characters not in codes. Defaults to 0.
+
+    Returns:
+        np.ndarray: lookup table indexed by byte value
+    """
+    lookup = np.full(256, default, dtype=dtype)
+    for char, code in codes.items():
+        lookup[ord(char)] = code
+    return lookup
+
+
+def view_chars(text_data):
+    """View a rectangular block of text as a 2-D array of byte values
+
+    No character data is copied: the rows are strided views over the input
+    buffer that step over the line endings. Blank lines around the block are
+    ignored and both \\n and \\r\\n line endings are accepted.
+
+    Args:
+        text_data (str, bytes, bytearray, memoryview or mmap): raw grid text
+
+    Returns:
+        np.ndarray: read-only (rows, cols) uint8 array of the characters
+
+    Raises:
+        ValueError: when the lines are not all the same width
+    """
+    buffer = np.frombuffer(to_bytes(text_data), dtype=np.uint8)
+    is_text = (buffer != NEWLINE) & (buffer != CARRIAGE_RETURN)
+    filled = np.flatnonzero(is_text)
+    if not filled.size:
+        return np.zeros((0, 0), dtype=np.uint8)
+    buffer = buffer[filled[0] : filled[-1] + 1]
+
+    newlines = np.flatnonzero(buffer == NEWLINE)
+    stride = int(newlines[0]) + 1 if newlines.size else buffer.size + 1
+    cols = stride - 1
+    if newlines.size and buffer[cols - 1] == CARRIAGE_RETURN:
+        cols -= 1
+    rows = newlines.size + 1
+    # the last line has no line ending left after stripping
+    if (
+        buffer.size != rows * stride - 1 - (stride - 1 - cols)
+        or (newlines != np.arange(rows - 1) * stride + stride - 1).any()
+    ):
+        raise ValueError("grid lines are not all the same width")
+
+    return np.lib.stride_tricks.as_strided(
+        buffer, shape=(rows, cols), strides=(stride, 1), writeable=False
+    )
+
+
+def to_grid(text_data, lookup=None):
+    """Parse a rectangular block of text into a compact numpy grid
+
+    Args:
+        text_data (str, bytes, bytearray, memoryview or mmap): raw grid text
+        lookup (np.ndarray, optional): table from make_lookup. Defaults to None,
+            which keeps the raw byte values.
+
+    Returns:
+        np.ndarray: (rows, cols) grid of codes, a fresh writable array
+    """
+    chars = view_chars(text_data)
+    if lookup is None:
+        return chars.copy()
+    return lookup[chars]
+
+
+def split_grids(text_data, lookup=None):
+    """Parse blank-line separated blocks of text into numpy grids
+
+    Args:
+        text_data (str, bytes, bytearray, memoryview or mmap): raw input
+        lookup (np.ndarray, optional): table from make_lookup. Defaults to None.
+
+    Returns:
+        list: one (rows, cols) grid per block
+    """
+    data = memoryview(to_bytes(text_data)).cast("B")
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    # a block ends at a newline followed by an empty (or \r-only) line
+    ends = np.flatnonzero(buffer == NEWLINE)
+    grids = []
+    start = 0
+    for prev, end in zip(ends[:-1], ends[1:]):
+        gap = buffer[prev + 1 : end]
+        if gap.size and not (gap == CARRIAGE_RETURN).all():
+            continue
+        if prev >= start:
+            grids.append(to_grid(data[start:prev], lookup))
+        start = end + 1
+    if (buffer[start:] != NEWLINE).any():
+        grids.append(to_grid(data[start:], lookup))
+    return [g for g in grids if g.size]
+
+
+def find(grid, code):
+    """Find the first cell holding a code, scanning row by row
+
+    Args:
+        grid (np.ndarray): 2-D grid
+        code (int): value to look for, e.g. ord("S") on a raw grid
+
+    Returns:
+        tuple: (row, col) of the first match, or None when absent
+    """
+    flat = np.flatnonzero(grid == code)
+    if not flat.size:
+        return None
+    r, c = divmod(int(flat[0]), grid.shape[1])
+    return (r, c)
+
+
+def read_grid(path, lookup=None):
+    """Read an input file straight into a numpy grid
+
+    Args:
+        path (str): input file
+        lookup (np.ndarray, optional): table from make_lookup. Defaults to None.
+
+    Returns:
+        np.ndarray: (rows, cols) grid of codes
+    """
+    with open(path, "rb") as f:
+        return to_grid(f.read(), lookup)
@@ -0,0 +1,135 @@
+"""Per-module cold start import times of a one-day run, from python -X importtime"""
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+# import time:       self [us] |       cumulative | imported package
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)\s*$")
+
+# what 'python -m aoc run --days N' imports before it starts solving; the day
+# is imported by name because importlib.import_module is not timed
+DAY_IMPORTS = "import aoc.__main__, aoc.runner, day{day}.solve"
+
+
+def parse_importtime(text):
+    """Parse the stderr of python -X importtime
+
+    Args:
+        text (str): importtime report
+
+    Returns:
+        list: dicts with 'module', 'self' and 'cumulative' microseconds and
+            nesting 'depth', in the order the imports finished
+    """
+    entries = []
+    for line in text.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(
+                {
+                    "module": module,
+                    "self": int(self_us),
+                    "cumulative": int(cumulative_us),
+                    "depth": len(indent) // 2,
+                }
+            )
+    return entries
+
+
+def measure_imports(code, python=sys.executable):
+    """Run code in a fresh interpreter with -X importtime
+
+    Args:
+        code (str): python source passed to -c
+        python (str, optional): interpreter. Defaults to sys.executable.
+
+    Returns:
+        list: parse_importtime entries
+    """
+    env = dict(os.environ, PYTHONPATH=aoc_days.ROOT)
+    # a warm bytecode cache, so the report shows imports rather than compiles
+    for _ in range(2):
+        proc = subprocess.run(
+            [python, "-X", "importtime", "-c", code],
+            cwd=aoc_days.ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import failed: {proc.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure_day(day, python=sys.executable):
+    """Measure the imports of a one-day run, leaving out interpreter start-up
+
+    Args:
+        day (int): day number
+        python (str, optional): interpreter. Defaults to sys.executable.
+
+    Returns:
+        list: parse_importtime entries for modules the run adds
+    """
+    startup = {e["module"] for e in measure_imports("pass", python)}
+    entries = measure_imports(DAY_IMPORTS.format(day=day), python)
+    return [e for e in entries if e["module"] not in startup]
+
+
+def get_total(entries):
+    """Add up the time of the outermost imports
+
+    Args:
+        entries (list): parse_importtime entries
+
+    Returns:
+        int: microseconds
+    """
+    return sum(e["cumulative"] for e in entries if e["depth"] == 0)
+
+
+def format_report(results, top=15):
+    """Render per-module import times for several days
+
+    Args:
+        results (dict): day number to measure_day entries
+        top (int, optional): modules per day, by self time. Defaults to 15.
+
+    Returns:
+        str: text report
+    """
+    lines = []
+    for day, entries in results.items():
+        numpy = "imports numpy" if "numpy" in {e["module"] for e in entries} else ""
+        lines.append(
+            f"day{day}: {len(entries)} modules, "
+            f"{get_total(entries) / 1000:.1f}ms {numpy}".rstrip()
+        )
+        lines.append(f"  {'self ms':>8}  {'cumul ms':>8}  module")
+        for entry in sorted(entries, key=lambda e: e["self"], reverse=True)[:top]:
+            lines.append(
+                f"  {entry['self'] / 1000:8.2f}  {entry['cumulative'] / 1000:8.2f}"
+                f"  {entry['module']}"
+            )
+    return "\n".join(lines)
+
+
+def format_json(results):
+    """Render per-module import times as JSON
+
+    Args:
+        results (dict): day number to measure_day entries
+
+    Returns:
+        str: JSON document
+    """
+    return json.dumps(results, indent=2)
@@ -0,0 +1,181 @@
+"""Half-open integer intervals, sorted disjoint interval sets and boxes
+
+An interval is a (start, end) tuple covering start <= x < end. An interval
+set is a list of intervals sorted by start with no two overlapping or
+touching, as returned by normalize. A box is a tuple of intervals, one per
+dimension, such as the x, m, a and s rating ranges of day 19.
+"""
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(intervals):
+    """Sort intervals and coalesce the ones that overlap or touch
+
+    Args:
+        intervals (iterable): (start, end) tuples, empty ones allowed
+
+    Returns:
+        list: sorted disjoint interval set
+    """
+    merged = []
+    for start, end in sorted(i for i in intervals if i[0] < i[1]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def union(*interval_sets):
+    """Combine interval sets into one
+
+    Args:
+        *interval_sets (list): intervals in any order
+
+    Returns:
+        list: sorted disjoint interval set
+    """
+    return normalize(i for intervals in interval_sets for i in intervals)
+
+
+def intersect(first, second):
+    """Get the values covered by both of two interval sets
+
+    Args:
+        first (list): sorted disjoint interval set
+        second (list): sorted disjoint interval set
+
+    Returns:
+        list: sorted disjoint interval set
+    """
+    overlaps = []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        if start < end:
+            overlaps.append((start, end))
+        # move past whichever interval finishes first
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+    return overlaps
+
+
+def split(intervals, threshold):
+    """Split an interval set into the values below a threshold and the rest
+
+    Args:
+        intervals (list): sorted disjoint interval set
+        threshold (int): first value of the upper part
+
+    Returns:
+        tuple: (interval set below threshold, interval set at or above it)
+    """
+    below, above = [], []
+    for start, end in intervals:
+        if end <= threshold:
+            below.append((start, end))
+        elif start >= threshold:
+            above.append((start, end))
+        else:
+            below.append((start, threshold))
+            above.append((threshold, end))
+    return below, above
+
+
+def translate(intervals, offset):
+    """Shift every interval by an offset
+
+    Args:
+        intervals (list): interval set
+        offset (int): amount added to both ends
+
+    Returns:
+        list: shifted interval set
+    """
+    return [(start + offset, end + offset) for start, end in intervals]
+
+
+def map_intervals(intervals, shifts):
+    """Translate the parts of an interval set that fall in shift ranges
+
+    Values outside every shift range map to themselves. One sweep over both
+    sorted lists cuts each interval at the shift range boundaries, so the
+    cost is O(k log k) in the number of fragments.
+
+    Args:
+        intervals (list): sorted disjoint interval set
+        shifts (iterable): disjoint (start, end, offset) ranges, in any order
+
+    Returns:
+        list: sorted disjoint interval set of mapped values
+    """
+    shifts = sorted(shifts)
+    fragments = []
+    first = 0
+    for start, end in intervals:
+        # shift ranges ending before this interval cannot reach later ones
+        while first < len(shifts) and shifts[first][1] <= start:
+            first += 1
+        pos = start
+        k = first
+        while pos < end and k < len(shifts) and shifts[k][0] < end:
+            shift_start, shift_end, offset = shifts[k]
+            if pos < shift_start:
+                fragments.append((pos, shift_start))
+                pos = shift_start
+            cut = min(end, shift_end)
+            fragments.append((pos + offset, cut + offset))
+            pos = cut
+            k += 1
+        if pos < end:
+            fragments.append((pos, end))
+    return normalize(fragments)
+
+
+def total_length(intervals):
+    """Count the values covered by an interval set
+
+    Args:
+        intervals (list): sorted disjoint interval set
+
+    Returns:
+        int: number of covered values
+    """
+    return sum(end - start for start, end in intervals)
+
+
+def split_box(box, axis, threshold):
+    """Cut a box in two along one dimension
+
+    Args:
+        box (tuple): one (start, end) interval per dimension
+        axis (int): dimension to cut
+        threshold (int): first value of the upper half on that dimension
+
+    Returns:
+        tuple: (box below threshold, box at or above it), None for an empty half
+    """
+    start, end = box[axis]
+    cut = min(max(threshold, start), end)
+    lower = box[:axis] + ((start, cut),) + box[axis + 1 :]
+    upper = box[:axis] + ((cut, end),) + box[axis + 1 :]
+    return (lower if start < cut else None), (upper if cut < end else None)
+
+
+def box_volume(box):
+    """Count the integer points in a box
+
+    Args:
+        box (tuple): one (start, end) interval per dimension
+
+    Returns:
+        int: product of the side lengths
+    """
+    return math.prod(max(end - start, 0) for start, end in box)
@@ -0,0 +1,234 @@
+"""Peak and retained memory of each day's parse, Part 1 and Part 2 under tracemalloc"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import _weakrefset
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+# allocations made by the tracing itself are left out of the reports
+IGNORED_FILES = (
+    tracemalloc.__file__,
+    threading.__file__,
+    _weakrefset.__file__,
+    __file__,
+)
+
+
+def get_source_name(filename):
+    """Shorten a source path to the part after the repo root or import path
+
+    Args:
+        filename (str): source file path
+
+    Returns:
+        str: e.g. day18/solve.py or numpy/_core/fromnumeric.py
+    """
+    filename = os.path.realpath(filename)
+    roots = [aoc_days.ROOT] + [os.path.realpath(p) for p in sys.path if p]
+    for root in sorted(roots, key=len, reverse=True):
+        if filename.startswith(root + os.sep):
+            return os.path.relpath(filename, root)
+    return filename
+
+
+def get_top_lines(snapshot, base, top=10):
+    """Get the source lines holding the most memory compared to a base snapshot
+
+    Args:
+        snapshot (tracemalloc.Snapshot): later snapshot
+        base (tracemalloc.Snapshot): snapshot taken before the phase
+        top (int, optional): number of lines. Defaults to 10.
+
+    Returns:
+        list: dicts with 'line', 'size' and 'count' growth, largest first
+    """
+    filters = [tracemalloc.Filter(False, f) for f in IGNORED_FILES]
+    filters.append(tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"))
+    diffs = snapshot.filter_traces(filters).compare_to(
+        base.filter_traces(filters), "lineno"
+    )
+    lines = []
+    for diff in diffs:
+        if diff.size_diff <= 0:
+            continue
+        frame = diff.traceback[0]
+        lines.append(
+            {
+                "line": f"{get_source_name(frame.filename)}:{frame.lineno}",
+                "size": diff.size_diff,
+                "count": diff.count_diff,
+            }
+        )
+        if len(lines) == top:
+            break
+    return lines
+
+
+def trace_phase(func, top=10, interval=0.01, growth=1.25):
+    """Run a function under tracemalloc and report its memory use
+
+    Transient structures are freed by the time the function returns, so a
+    watcher thread snapshots the heap whenever it has grown by the growth
+    factor since the last snapshot. The largest of those snapshots shows which
+    lines held the memory at the peak.
+
+    Args:
+        func (callable): function taking no arguments
+        top (int, optional): source lines to report. Defaults to 10.
+        interval (float, optional): seconds between heap checks. Defaults to 0.01.
+        growth (float, optional): heap growth between peak snapshots.
+            Defaults to 1.25.
+
+    Returns:
+        tuple: (return value, report dict with 'time', 'peak' and 'retained'
+            bytes, and 'peak_lines' and 'retained_lines')
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        base = tracemalloc.take_snapshot()
+        base_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        stop = threading.Event()
+        largest = {"size": base_size, "snapshot": None}
+
+        def watch():
+            while not stop.wait(interval):
+                size = tracemalloc.get_traced_memory()[0]
+                if size > largest["size"] * growth:
+                    largest["snapshot"] = tracemalloc.take_snapshot()
+                    largest["size"] = tracemalloc.get_traced_memory()[0]
+
+        watcher = threading.Thread(target=watch, daemon=True)
+        watcher.start()
+        start = time.perf_counter()
+        try:
+            value = func()
+        finally:
+            elapsed = time.perf_counter() - start
+            stop.set()
+            watcher.join()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    peak_snapshot = after
+    if largest["snapshot"] is not None and largest["size"] > current:
+        peak_snapshot = largest["snapshot"]
+    report = {
+        "time": elapsed,
+        "peak": peak - base_size,
+        "retained": current - base_size,
+        "peak_lines": get_top_lines(peak_snapshot, base, top),
+        "retained_lines": get_top_lines(after, base, top),
+    }
+    return value, report
+
+
+def trace_day(day, input_name="input.txt", top=10):
+    """Trace the memory of a day's parse, Part 1 and Part 2 phases
+
+    Args:
+        day (int): day number
+        input_name (str, optional): input file in the day folder. Defaults to "input.txt".
+        top (int, optional): source lines per phase. Defaults to 10.
+
+    Returns:
+        dict: phase name ('parse', 'part1', 'part2') to report or error
+    """
+    module = aoc_days.load_module(day)
+    text_data = module.get_file_data(aoc_days.get_input_path(day, input_name))
+    phases = {}
+    parsed = {}
+    for part in (1, 2):
+        parse_name = aoc_days.get_parse_name(day, part)
+        try:
+            if parse_name not in parsed:
+                parsed[parse_name], report = trace_phase(
+                    lambda: aoc_days.parse_input(module, parse_name, text_data), top
+                )
+                # days with a second parse function report it under its own name
+                phases["parse" if not phases else parse_name] = report
+            # copies for mutating days are made before tracing starts
+            data = aoc_days.get_part_input(day, parsed[parse_name])
+            answer, report = trace_phase(
+                lambda: aoc_days.solve_part(module, day, part, data), top
+            )
+            report["answer"] = aoc_days.to_plain(answer)
+            phases[f"part{part}"] = report
+        except Exception as err:  # pylint: disable=broad-except
+            phases[f"part{part}"] = {"error": f"{type(err).__name__}: {err}"}
+    return phases
+
+
+def format_bytes(size):
+    """Format a byte count with a binary unit
+
+    Args:
+        size (int): bytes, possibly negative
+
+    Returns:
+        str: e.g. '12.3 MiB'
+    """
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}" if unit != "B" else f"{size} B"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def format_report(results):
+    """Render memory reports for several days
+
+    Args:
+        results (dict): day number to trace_day result
+
+    Returns:
+        str: text report, one block per phase
+    """
+    lines = []
+    for day, phases in results.items():
+        for phase, report in phases.items():
+            if "error" in report:
+                lines.append(f"day{day} {phase}: {report['error']}")
+                continue
+            lines.append(
+                f"day{day} {phase}: peak {format_bytes(report['peak'])}, "
+                f"retained {format_bytes(report['retained'])}, "
+                f"{report['time']:.3f}s"
+            )
+            for title, key in (
+                ("at peak", "peak_lines"),
+                ("retained", "retained_lines"),
+            ):
+                if report[key]:
+                    lines.append(f"  {title}:")
+                for entry in report[key]:
+                    lines.append(
+                        f"    {format_bytes(entry['size']):>10}  "
+                        f"{entry['count']:>8} blocks  {entry['line']}"
+                    )
+    return "\n".join(lines)
+
+
+def format_json(results):
+    """Render memory reports as JSON
+
+    Args:
+        results (dict): day number to trace_day result
+
+    Returns:
+        str: JSON document
+    """
+    return json.dumps(results, indent=2, default=str)
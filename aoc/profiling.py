@@ -0,0 +1,320 @@
+"""Opt-in profiling of each day's Part 1 and Part 2, switched on with AOC_PROFILE"""
+import collections
+import functools
+import io
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+from . import days as aoc_days
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "AOC_PROFILE"
+MODES = ("cprofile", "sample")
+DEFAULT_PROFILE_DIR = os.environ.get(
+    "AOC_PROFILE_DIR", os.path.join(aoc_days.ROOT, "profiles")
+)
+DEFAULT_TOP = int(os.environ.get("AOC_PROFILE_TOP", "15"))
+DEFAULT_INTERVAL = float(os.environ.get("AOC_PROFILE_INTERVAL", "0.001"))
+
+
+def get_frame_name(filename, funcname):
+    """Name a function the same way in both profilers, e.g. day7/solve.py:get_card_value
+
+    Args:
+        filename (str): code file name ('~' for builtins in cProfile)
+        funcname (str): function name
+
+    Returns:
+        str: readable frame name without ';' so it is safe in collapsed stacks
+    """
+    if filename == "~":
+        name = funcname
+    else:
+        path = os.path.realpath(filename)
+        if path.startswith(aoc_days.ROOT + os.sep):
+            path = os.path.relpath(path, aoc_days.ROOT)
+        else:
+            path = os.path.basename(path)
+        name = f"{path}:{funcname}"
+    return name.replace(";", ",")
+
+
+def run_cprofile(func, *args, **kwargs):
+    """Call a function under cProfile
+
+    Args:
+        func (callable): function to profile
+        *args: positional arguments for func
+        **kwargs: keyword arguments for func
+
+    Returns:
+        tuple: (return value, report dict with 'stats', 'collapsed' and 'top')
+    """
+    # pstats pulls in dataclasses, enum and inspect, so only load it when profiling
+    import cProfile  # pylint: disable=import-outside-toplevel
+    import pstats  # pylint: disable=import-outside-toplevel
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        value = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+    stats = pstats.Stats(profiler)
+
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats()
+
+    # cProfile only records caller -> callee pairs, so its stacks are two
+    # frames deep, weighted by the callee's own time on that edge
+    collapsed = collections.Counter()
+    rows = []
+    for (filename, _, funcname), (
+        _,
+        ncalls,
+        tottime,
+        cumtime,
+        callers,
+    ) in stats.stats.items():
+        name = get_frame_name(filename, funcname)
+        rows.append((name, tottime, cumtime, ncalls))
+        for (c_file, _, c_func), edge in callers.items():
+            caller = get_frame_name(c_file, c_func)
+            collapsed[f"{caller};{name}"] += int(edge[2] * 1e6)
+        if not callers:
+            collapsed[name] += int(tottime * 1e6)
+    rows.sort(key=lambda row: row[1], reverse=True)
+    report = {
+        "profiler": profiler,
+        "stats": text.getvalue(),
+        "collapsed": collapsed,
+        "top": rows,
+        "unit": "us",
+    }
+    return value, report
+
+
+def run_sampler(func, *args, interval=DEFAULT_INTERVAL, **kwargs):
+    """Call a function while a background thread samples its call stack
+
+    Args:
+        func (callable): function to profile
+        *args: positional arguments for func
+        interval (float, optional): seconds between samples.
+            Defaults to DEFAULT_INTERVAL.
+        **kwargs: keyword arguments for func
+
+    Returns:
+        tuple: (return value, report dict with 'stats', 'collapsed' and 'top')
+    """
+    target = threading.get_ident()
+    stop = threading.Event()
+    stacks = collections.Counter()
+    top_frame = sys._getframe()  # pylint: disable=protected-access
+
+    def sample():
+        while not stop.wait(interval):
+            frame = sys._current_frames().get(  # pylint: disable=protected-access
+                target
+            )
+            names = []
+            # stop at this function's frame so the stacks start at func
+            while frame is not None and frame is not top_frame:
+                code = frame.f_code
+                names.append(get_frame_name(code.co_filename, code.co_name))
+                frame = frame.f_back
+            # a stack caught after func returned belongs to this function
+            if names and not stop.is_set():
+                stacks[";".join(reversed(names))] += 1
+
+    # the sampler only runs when it gets the GIL, so hand it over as often
+    # as it wants to sample
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(interval, switch_interval))
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        value = func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+
+    own = collections.Counter()
+    total = collections.Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        for name in set(frames):
+            total[name] += count
+    n_samples = sum(stacks.values()) or 1
+    seconds = elapsed / n_samples
+    rows = sorted(
+        ((name, own[name] * seconds, total[name] * seconds, None) for name in total),
+        key=lambda row: row[1],
+        reverse=True,
+    )
+    lines = [f"{n_samples} samples over {elapsed:.3f}s", ""]
+    lines.append(f"{'own':>8}  {'total':>8}  function")
+    for name, own_s, total_s, _ in sorted(rows, key=lambda r: r[2], reverse=True):
+        lines.append(f"{own_s:8.3f}  {total_s:8.3f}  {name}")
+    report = {
+        "profiler": None,
+        "stats": "\n".join(lines) + "\n",
+        "collapsed": stacks,
+        "top": rows,
+        "unit": "samples",
+    }
+    return value, report
+
+
+def write_report(report, out_dir, label):
+    """Write a profile's sorted stats, collapsed stacks and raw cProfile data
+
+    Args:
+        report (dict): report from run_cprofile or run_sampler
+        out_dir (str): output folder, created when missing
+        label (str): file name stem such as day7-part2
+
+    Returns:
+        list: written file paths
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    stem = os.path.join(out_dir, label)
+    paths = [f"{stem}.txt", f"{stem}.collapsed"]
+    with open(paths[0], "w", encoding="utf-8") as f:
+        f.write(report["stats"])
+    with open(paths[1], "w", encoding="utf-8") as f:
+        for stack, weight in sorted(report["collapsed"].items()):
+            if weight:
+                f.write(f"{stack} {weight}\n")
+    if report["profiler"] is not None:
+        paths.append(f"{stem}.prof")
+        report["profiler"].dump_stats(paths[-1])
+    return paths
+
+
+def format_top(report, top=DEFAULT_TOP):
+    """Render the functions with the most time spent in their own code
+
+    Args:
+        report (dict): report from run_cprofile or run_sampler
+        top (int, optional): number of functions. Defaults to DEFAULT_TOP.
+
+    Returns:
+        str: text table
+    """
+    lines = [f"{'own s':>9}  {'total s':>9}  {'calls':>9}  function"]
+    for name, own, total, calls in report["top"][:top]:
+        calls = "" if calls is None else str(calls)
+        lines.append(f"{own:9.4f}  {total:9.4f}  {calls:>9}  {name}")
+    return "\n".join(lines)
+
+
+def get_module_day(module):
+    """Get the day number of a solve module from its folder name
+
+    Args:
+        module (module): dayN.solve module, possibly running as __main__
+
+    Returns:
+        int: day number, or None outside a dayN folder
+    """
+    folder = os.path.basename(os.path.dirname(os.path.realpath(module.__file__)))
+    match = re.fullmatch(r"day(\d+)", folder)
+    return int(match.group(1)) if match else None
+
+
+def profile_parts(module, mode, out_dir=DEFAULT_PROFILE_DIR, top=DEFAULT_TOP):
+    """Swap a module's part solvers for wrappers that profile each call
+
+    A solver called from inside another profiled solver (day 16's Part 2
+    calls its Part 1 function) is counted as part of the outer call.
+
+    Args:
+        module (module): dayN.solve module
+        mode (str): 'cprofile' or 'sample'
+        out_dir (str, optional): output folder. Defaults to DEFAULT_PROFILE_DIR.
+        top (int, optional): hot functions to log. Defaults to DEFAULT_TOP.
+
+    Returns:
+        callable: function restoring the original solvers
+    """
+    if mode not in MODES:
+        raise ValueError(f"{PROFILE_ENV} must be one of {', '.join(MODES)}")
+    day = get_module_day(module)
+    spec = aoc_days.get_spec(day)
+    prefix = f"day{day}" if day is not None else module.__name__
+    run = run_cprofile if mode == "cprofile" else run_sampler
+    active = []
+    originals = {}
+
+    def wrap(func, label):
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            if active:
+                return func(*args, **kwargs)
+            active.append(label)
+            try:
+                value, report = run(func, *args, **kwargs)
+            finally:
+                active.pop()
+            paths = write_report(report, out_dir, f"{prefix}-{label}")
+            logger.info(
+                "%s %s profile written to %s\n%s",
+                prefix,
+                label,
+                ", ".join(paths),
+                format_top(report, top),
+            )
+            return value
+
+        return profiled
+
+    for part in spec["parts"]:
+        for name in aoc_days.get_engines(day, part).values():
+            func = getattr(module, name, None)
+            if func is not None and name not in originals:
+                originals[name] = func
+                setattr(module, name, wrap(func, f"part{part}"))
+
+    def restore():
+        for name, func in originals.items():
+            setattr(module, name, func)
+
+    return restore
+
+
+def profile_main(main):
+    """Decorate a day's main() to set up logging and profile its parts
+
+    Logging is configured here rather than when the module is imported, so
+    loading a day from the runner or the tests leaves logging alone.
+
+    Args:
+        main (callable): the day's main function
+
+    Returns:
+        callable: main, profiled only when AOC_PROFILE is set when it is called
+    """
+
+    @functools.wraps(main)
+    def wrapper(*args, **kwargs):
+        logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+        mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+        if not mode:
+            return main(*args, **kwargs)
+        restore = profile_parts(sys.modules[main.__module__], mode)
+        try:
+            return main(*args, **kwargs)
+        finally:
+            restore()
+
+    return wrapper
@@ -0,0 +1,226 @@
+"""Progress reporting and per-part time budgets for long-running solvers
+
+Solvers call report(done, total) from their main loop. The runner wraps each
+part in budget(), which sets the callback that reports go to and a deadline.
+A report made after the deadline raises TimeoutError, so the solver unwinds
+through its own code. Solvers that never report are stopped by a SIGALRM
+timer instead, when the part runs in a process's main thread. Progress is
+only logged for parts with a budget, or everywhere once enable_logging() was
+called.
+"""
+
+import logging
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# seconds between two calls of the progress callback
+REPORT_INTERVAL = 1.0
+
+PROGRESS_ENV = "AOC_PROGRESS"
+
+_settings = {"log": os.environ.get(PROGRESS_ENV) == "1"}
+
+_current = {
+    "label": None,
+    "callback": None,
+    "start": None,
+    "deadline": None,
+    "budget": None,
+    "next_report": None,
+}
+
+
+def enable_logging(on=True):
+    """Log the progress of every part, not just those with a budget
+
+    Applies to this process and any it starts.
+
+    Args:
+        on (bool, optional): log progress. Defaults to True.
+    """
+    _settings["log"] = on
+    os.environ[PROGRESS_ENV] = "1" if on else "0"
+
+
+def get_callback(seconds=None):
+    """Pick the progress callback for a part
+
+    Args:
+        seconds (float, optional): the part's budget. Defaults to None.
+
+    Returns:
+        callable: log_progress when the part has a budget or progress logging
+            is on, None otherwise
+    """
+    if seconds is not None or _settings["log"]:
+        return log_progress
+    return None
+
+
+def log_progress(update):
+    """Default progress callback, logging one line per update
+
+    Args:
+        update (dict): label, done, total, elapsed, rate and eta
+    """
+    logger.info("%s", format_progress(update))
+
+
+def format_progress(update):
+    """Render a progress update as a single line
+
+    Args:
+        update (dict): label, done, total, elapsed, rate and eta
+
+    Returns:
+        str: processed count, rate and estimated time left
+    """
+    done = f"{update['done']}"
+    if update["total"]:
+        done += f"/{update['total']} ({update['done'] / update['total']:.0%})"
+    text = f"{update['label']}: {done}, {update['rate']:.1f}/s"
+    if update["eta"] is not None:
+        text += f", eta {update['eta']:.1f}s"
+    return text
+
+
+def get_update(done, total, now):
+    """Build the progress update passed to callbacks
+
+    Args:
+        done (int): items processed so far
+        total (int): items in all, None when unknown
+        now (float): current perf_counter time
+
+    Returns:
+        dict: label, done, total, elapsed, rate and eta in seconds
+    """
+    elapsed = now - _current["start"]
+    rate = done / elapsed if elapsed > 0 else 0.0
+    eta = None
+    if total and rate > 0:
+        eta = (total - done) / rate
+    return {
+        "label": _current["label"],
+        "done": done,
+        "total": total,
+        "elapsed": elapsed,
+        "rate": rate,
+        "eta": eta,
+    }
+
+
+def report(done, total=None):
+    """Report solver progress and stop the solver once its budget is spent
+
+    Cheap enough to call every iteration: the callback runs at most once per
+    REPORT_INTERVAL, and outside budget() it returns straight away.
+
+    Args:
+        done (int): items processed so far
+        total (int, optional): items in all, None when unknown. Defaults to None.
+
+    Raises:
+        TimeoutError: the part has run past its budget
+    """
+    if _current["start"] is None:
+        return
+    now = time.perf_counter()
+    if _current["deadline"] is not None and now > _current["deadline"]:
+        raise TimeoutError(f"exceeded {_current['budget']:g}s budget")
+    if _current["callback"] is not None and now >= _current["next_report"]:
+        _current["next_report"] = now + REPORT_INTERVAL
+        _current["callback"](get_update(done, total, now))
+
+
+def raise_timeout(signum, frame):  # pylint: disable=unused-argument
+    """SIGALRM handler cancelling a part that stopped reporting
+
+    Raises:
+        TimeoutError: while a budget is running
+    """
+    if _current["deadline"] is None:
+        return
+    raise TimeoutError(f"exceeded {_current['budget']:g}s budget")
+
+
+def can_interrupt():
+    """Check whether a SIGALRM timer can cancel code in this thread
+
+    Returns:
+        bool: True in the main thread of a platform with setitimer
+    """
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+@contextmanager
+def stage(name):
+    """Report a separately counted stage of the running part
+
+    Reports made inside the block are labelled with the stage's name, and
+    their rate and estimate count from the start of the stage, so a solver
+    whose count restarts for each stage does not appear to run backwards.
+
+    Args:
+        name (str): stage shown after the part's label
+    """
+    if _current["start"] is None:
+        yield
+        return
+    label, start = _current["label"], _current["start"]
+    _current.update(label=f"{label} {name}", start=time.perf_counter())
+    try:
+        yield
+    finally:
+        _current.update(label=label, start=start)
+
+
+@contextmanager
+def budget(seconds=None, label="solve", callback=None):
+    """Run a block with a time budget and a progress callback
+
+    Args:
+        seconds (float, optional): time allowed, None for no limit.
+            Defaults to None.
+        label (str, optional): name shown in progress updates.
+            Defaults to "solve".
+        callback (callable, optional): called with progress update dicts,
+            such as log_progress, None to drop them. Defaults to None.
+
+    Raises:
+        TimeoutError: the block ran past its budget
+    """
+    start = time.perf_counter()
+    saved = dict(_current)
+    _current.update(
+        label=label,
+        callback=callback,
+        start=start,
+        deadline=None if seconds is None else start + seconds,
+        budget=seconds,
+        next_report=start + REPORT_INTERVAL,
+    )
+    timer = seconds is not None and can_interrupt()
+    if timer:
+        previous = signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        # the alarm can still go off after the block raised, so the state is
+        # restored even if it interrupts cancelling the timer
+        try:
+            if timer:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        finally:
+            _current.update(saved)
+            if timer:
+                signal.signal(signal.SIGALRM, previous)
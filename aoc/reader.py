@@ -0,0 +1,148 @@
+"""Memory-mapped puzzle inputs with line, section and block iterators"""
+import logging
+import mmap
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = " \t\n\r\x0b\x0c"
+WHITESPACE_BYTES = frozenset(WHITESPACE.encode("ascii"))
+
+
+def read_input(path):
+    """Memory-map an input file read-only
+
+    Args:
+        path (str): input file
+
+    Returns:
+        mmap.mmap: mapping of the whole file (b"" for an empty file)
+    """
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            return b""
+
+
+def view_bytes(text_data):
+    """Get a zero-copy byte view of an input
+
+    Args:
+        text_data (str, bytes, bytearray or mmap): raw input
+
+    Returns:
+        memoryview: read-only bytes of the input (str inputs are encoded)
+    """
+    if isinstance(text_data, str):
+        text_data = text_data.encode("utf-8")
+    return memoryview(text_data).toreadonly()
+
+
+def get_bounds(text_data):
+    """Get the span of an input without its leading and trailing whitespace
+
+    Args:
+        text_data (str, bytes, bytearray or mmap): raw input
+
+    Returns:
+        tuple: (start, end) offsets, like the span kept by str.strip()
+    """
+    whitespace = WHITESPACE if isinstance(text_data, str) else WHITESPACE_BYTES
+    start, end = 0, len(text_data)
+    while start < end and text_data[start] in whitespace:
+        start += 1
+    while end > start and text_data[end - 1] in whitespace:
+        end -= 1
+    return start, end
+
+
+def iter_split(text_data, sep="\n", encoding="utf-8"):
+    """Yield the pieces of a stripped input between separators, one at a time
+
+    This matches text_data.strip().split(sep) without building the stripped
+    copy or the list of pieces.
+
+    Args:
+        text_data (str, bytes, bytearray or mmap): raw input
+        sep (str, optional): separator. Defaults to "\\n".
+        encoding (str, optional): decoding for byte inputs. Defaults to "utf-8".
+
+    Yields:
+        str: each piece
+    """
+    if isinstance(text_data, str):
+        piece = text_data.__getitem__
+    else:
+        sep = sep.encode(encoding)
+
+        def piece(span):
+            return text_data[span].decode(encoding)
+
+    start, end = get_bounds(text_data)
+    if start == end:
+        return
+    while True:
+        found = text_data.find(sep, start, end)
+        if found == -1:
+            yield piece(slice(start, end))
+            return
+        yield piece(slice(start, found))
+        start = found + len(sep)
+
+
+def iter_lines(text_data, encoding="utf-8"):
+    """Yield the lines of a stripped input, one at a time
+
+    Args:
+        text_data (str, bytes, bytearray or mmap): raw input
+        encoding (str, optional): decoding for byte inputs. Defaults to "utf-8".
+
+    Yields:
+        str: each line without its line ending
+    """
+    for line in iter_split(text_data, "\n", encoding):
+        yield line.rstrip("\r")
+
+
+def iter_sections(text_data, encoding="utf-8"):
+    """Yield the blank-line separated sections of a stripped input
+
+    Args:
+        text_data (str, bytes, bytearray or mmap): raw input
+        encoding (str, optional): decoding for byte inputs. Defaults to "utf-8".
+
+    Yields:
+        str: each section, its lines still joined by newlines
+    """
+    for section in iter_split(text_data, "\n\n", encoding):
+        yield section.strip()
+
+
+def iter_blocks(text_data, block_size=1 << 20, sep="\n"):
+    """Yield byte views of roughly block_size that end on separator boundaries
+
+    Each block ends right after a separator (or at the end of the input), so
+    whole lines, or whole blank-line separated sections with sep="\\n\\n", are
+    never split across blocks.
+
+    Args:
+        text_data (str, bytes, bytearray or mmap): raw input
+        block_size (int, optional): target bytes per block. Defaults to 1 MiB.
+        sep (str, optional): boundary to cut at. Defaults to "\\n".
+
+    Yields:
+        memoryview: zero-copy view of each block
+    """
+    if isinstance(text_data, str):
+        text_data = text_data.encode("utf-8")
+    view = view_bytes(text_data)
+    sep = sep.encode("ascii")
+    start = 0
+    while start < len(view):
+        cut = min(start + block_size, len(view))
+        if cut < len(view):
+            found = text_data.find(sep, max(cut - len(sep), start))
+            cut = len(view) if found == -1 else found + len(sep)
+        yield view[start:cut]
+        start = cut
@@ -0,0 +1,307 @@
+"""Run several day solvers side by side in a process pool"""
+import json
+import logging
+import time
+
+from . import cache
+from . import checkpoint
+from . import counters
+from . import days as aoc_days
+from . import progress
+from . import timeline
+
+logger = logging.getLogger(__name__)
+
+
+def format_error(err):
+    """Summarize an exception raised by a day in a single line
+
+    Args:
+        err (Exception): raised exception
+
+    Returns:
+        str: exception type and message
+    """
+    return f"{type(err).__name__}: {err}"
+
+
+def run_day(
+    day,
+    input_name="input.txt",
+    parts=(1, 2),
+    cache_dir=None,
+    budget=None,
+    engines=None,
+    checkpoint_dir=None,
+):
+    """Read, parse and solve a single day, timing each phase
+
+    Args:
+        day (int): day number
+        input_name (str, optional): input file in the day folder. Defaults to "input.txt".
+        parts (tuple, optional): parts to solve. Defaults to (1, 2).
+        cache_dir (str, optional): parse and answer cache folder, None to always
+            parse and solve. Defaults to None.
+        budget (float, optional): seconds each part may run before it is
+            cancelled, None for no limit. Defaults to None.
+        engines (dict, optional): part to engine name, None for the defaults.
+            Defaults to None.
+        checkpoint_dir (str, optional): folder where long solver loops save
+            their progress and resume from, None to always start over.
+            Defaults to None.
+
+    Returns:
+        dict: day number, read/parse timings and per-part answers, timings,
+            engine names and work 'counters';
+            'parse_cached' is True when every parse came from the cache, a
+            part's 'cached' is True when its answer and original time were
+            looked up instead of solved, and its 'timeout' is True when it
+            was cancelled for running past the budget; while tracing, 'trace'
+            holds the spans this process recorded
+    """
+    day_start = timeline.now()
+    result = {
+        "day": day,
+        "read_time": None,
+        "parse_time": None,
+        "parse_cached": None,
+        "parts": {},
+    }
+    try:
+        module = aoc_days.load_module(day)
+        start = time.perf_counter()
+        text_data = module.get_file_data(aoc_days.get_input_path(day, input_name))
+        result["read_time"] = time.perf_counter() - start
+        timeline.add_span("read", start, start + result["read_time"], day=day)
+    except Exception as err:  # pylint: disable=broad-except
+        result["error"] = format_error(err)
+        return finish_trace(result, day_start)
+
+    input_hash = code_hash = None
+    if cache_dir is not None or checkpoint_dir is not None:
+        input_hash = cache.hash_input(text_data)
+        code_hash = cache.hash_code(module)
+
+    # parts sharing a parse function share the parsed data
+    parsed = {}
+    for part in parts:
+        engine = (engines or {}).get(part) or aoc_days.get_default_engine(day, part)
+        entry = {"answer": None, "time": None, "cached": False, "engine": engine}
+        result["parts"][part] = entry
+        if cache_dir is not None:
+            stored = cache.load_answer(
+                cache_dir, day, part, input_hash, code_hash, engine
+            )
+            if stored is not None:
+                entry.update(stored, cached=True)
+                continue
+        try:
+            parse_name = aoc_days.get_parse_name(day, part)
+            if parse_name not in parsed:
+                start = time.perf_counter()
+                parsed[parse_name], hit = cache.cached_parse(
+                    module, day, parse_name, text_data, cache_dir, input_hash
+                )
+                parse_time = time.perf_counter() - start
+                result["parse_time"] = (result["parse_time"] or 0) + parse_time
+                result["parse_cached"] = hit and result["parse_cached"] is not False
+                timeline.add_span(
+                    "parse", start, start + parse_time, day=day, cached=hit
+                )
+            data = aoc_days.get_part_input(day, parsed[parse_name])
+            saved_at = None
+            if checkpoint_dir is not None:
+                saved_at = checkpoint.get_checkpoint_path(
+                    checkpoint_dir, day, part, input_hash, code_hash, engine
+                )
+            start = time.perf_counter()
+            with counters.collect() as counts, checkpoint.session(saved_at):
+                entry["counters"] = counts
+                with progress.budget(
+                    budget,
+                    label=f"day {day} part {part}",
+                    callback=progress.get_callback(budget),
+                ):
+                    answer = aoc_days.solve_part(module, day, part, data, engine)
+            entry["time"] = time.perf_counter() - start
+            entry["answer"] = aoc_days.to_plain(answer)
+            timeline.add_span(
+                f"part {part}", start, start + entry["time"], day=day, engine=engine
+            )
+        except TimeoutError as err:
+            entry["time"] = time.perf_counter() - start
+            entry["error"] = format_error(err)
+            entry["timeout"] = True
+            timeline.add_span(
+                f"part {part}", start, start + entry["time"], day=day, timeout=True
+            )
+            continue
+        except Exception as err:  # pylint: disable=broad-except
+            entry["error"] = format_error(err)
+            continue
+        if cache_dir is not None:
+            try:
+                cache.save_answer(
+                    cache_dir,
+                    day,
+                    part,
+                    input_hash,
+                    code_hash,
+                    entry["answer"],
+                    entry["time"],
+                    engine,
+                    entry["counters"],
+                )
+            except (OSError, TypeError) as err:
+                logger.warning("could not store day %d part %d: %s", day, part, err)
+    return finish_trace(result, day_start)
+
+
+def finish_trace(result, start):
+    """Close a day's span and hand over the spans recorded while solving it
+
+    Args:
+        result (dict): run_day result
+        start (float): timeline.now() when the day started
+
+    Returns:
+        dict: the result, with 'trace' added while tracing
+    """
+    if timeline.enabled():
+        timeline.add_span(f"day {result['day']}", start, timeline.now(), cat="day")
+        result["trace"] = timeline.drain()
+    return result
+
+
+def run_days(
+    days,
+    jobs=None,
+    input_name="input.txt",
+    cache_dir=None,
+    budget=None,
+    engines=None,
+    checkpoint_dir=None,
+):
+    """Fan the selected days out across a process pool
+
+    Args:
+        days (list): day numbers to run
+        jobs (int, optional): worker processes, None for one per CPU and 1 to run
+            in this process. Defaults to None.
+        input_name (str, optional): input file in each day folder. Defaults to "input.txt".
+        cache_dir (str, optional): parse and answer cache folder, None to always
+            parse and solve. Defaults to None.
+        budget (float, optional): seconds each part may run before it is
+            cancelled, None for no limit. Defaults to None.
+        engines (dict, optional): day to its run_day engines, None for the
+            defaults. Defaults to None.
+        checkpoint_dir (str, optional): folder where long solver loops save
+            their progress and resume from, None to always start over.
+            Defaults to None.
+
+    Returns:
+        list: run_day results ordered by day
+    """
+    engines = engines or {}
+    if len(days) == 1 or jobs == 1:
+        # a pool only adds process start-up when there is nothing to overlap
+        return [
+            run_day(
+                day,
+                input_name,
+                (1, 2),
+                cache_dir,
+                budget,
+                engines.get(day),
+                checkpoint_dir,
+            )
+            for day in sorted(days)
+        ]
+
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(
+                run_day,
+                day,
+                input_name,
+                (1, 2),
+                cache_dir,
+                budget,
+                engines.get(day),
+                checkpoint_dir,
+            ): day
+            for day in days
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            logger.debug("day %d finished", result["day"])
+            results.append(result)
+    results.sort(key=lambda r: r["day"])
+    return results
+
+
+def format_time(seconds):
+    """Format a duration in seconds for the results table
+
+    Args:
+        seconds (float): duration or None
+
+    Returns:
+        str: human readable duration
+    """
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_table(results):
+    """Render run results as a text table
+
+    Args:
+        results (list): run_day results
+
+    Returns:
+        str: one row per day and part, with any work counters
+    """
+    rows = [("day", "part", "answer", "time", "work")]
+    for result in results:
+        if "error" in result:
+            rows.append((str(result["day"]), "-", result["error"], "-", ""))
+            continue
+        cached = "(cached)" if result.get("parse_cached") else ""
+        rows.append(
+            (str(result["day"]), "parse", cached, format_time(result["parse_time"]), "")
+        )
+        for part, entry in sorted(result["parts"].items()):
+            answer = entry.get("error", entry["answer"])
+            elapsed = format_time(entry["time"])
+            if entry.get("cached"):
+                elapsed += " (cached)"
+            label = str(part)
+            if entry.get("engine", aoc_days.DEFAULT_ENGINE) != aoc_days.DEFAULT_ENGINE:
+                label += f":{entry['engine']}"
+            work = counters.format_counters(entry.get("counters"))
+            rows.append((str(result["day"]), label, str(answer), elapsed, work))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [
+        "  ".join(v.ljust(w) for v, w in zip(row, widths)).rstrip() for row in rows
+    ]
+    return "\n".join(lines)
+
+
+def format_json(results):
+    """Render run results as JSON
+
+    Args:
+        results (list): run_day results
+
+    Returns:
+        str: JSON document
+    """
+    return json.dumps(results, indent=2, default=str)
@@ -0,0 +1,280 @@
+"""Graph searches over integer-encoded states with dense numpy distance arrays
+
+States are plain ints in range(n_states); grid cells are encoded row-major as
+r * cols + c, and solvers fold extra state such as a heading into the same
+int. Distances live in an int64 array indexed by state, so no search keeps a
+dict of tuples. The searches read and write the arrays through memoryviews,
+which hand back plain ints and are much faster than numpy scalar indexing in
+a Python loop. Every search takes a neighbors(state) callable and returns
+(dist, found), where found is the first state the goal accepted, or None.
+"""
+
+import heapq
+import logging
+from collections import deque
+
+import numpy as np
+
+from . import counters
+
+logger = logging.getLogger(__name__)
+
+UNREACHED = -1
+INFINITY = np.iinfo(np.int64).max
+
+
+def encode(point, shape):
+    """Encode a grid cell as a state
+
+    Args:
+        point (tuple): (row, col)
+        shape (tuple): grid (rows, cols)
+
+    Returns:
+        int: row-major cell index
+    """
+    return point[0] * shape[1] + point[1]
+
+
+def decode(state, shape):
+    """Decode a state back into a grid cell
+
+    Args:
+        state (int): row-major cell index
+        shape (tuple): grid (rows, cols)
+
+    Returns:
+        tuple: (row, col)
+    """
+    return divmod(state, shape[1])
+
+
+def grid_neighbors(shape, passable=None):
+    """Build a neighbors function for 4-connected grid cells
+
+    Args:
+        shape (tuple): grid (rows, cols)
+        passable (np.ndarray, optional): bool grid of cells that may be
+            entered, None for every cell. Defaults to None.
+
+    Returns:
+        callable: state to list of neighboring states
+    """
+    rows, cols = shape
+    flat = None if passable is None else np.asarray(passable, dtype=bool).ravel()
+
+    def neighbors(state):
+        r, c = divmod(state, cols)
+        found = []
+        if r > 0:
+            found.append(state - cols)
+        if r < rows - 1:
+            found.append(state + cols)
+        if c > 0:
+            found.append(state - 1)
+        if c < cols - 1:
+            found.append(state + 1)
+        if flat is None:
+            return found
+        return [n for n in found if flat[n]]
+
+    return neighbors
+
+
+def add_search_counts(expanded, pushes):
+    """Report a finished search's work to the part's counters
+
+    Args:
+        expanded (int): states whose neighbors were generated
+        pushes (int): states added to the queue, starts included
+    """
+    counters.add("expanded", expanded)
+    counters.add("pushes", pushes)
+
+
+def bfs(starts, neighbors, n_states, goal=None):
+    """Breadth-first search with unit edge weights
+
+    Args:
+        starts (iterable): start states
+        neighbors (callable): state to iterable of next states
+        n_states (int): number of encodable states
+        goal (callable, optional): state to bool, stops the search at the
+            first state it accepts. Defaults to None.
+
+    Returns:
+        tuple: (dist array with UNREACHED for unvisited states, found state)
+    """
+    dist = np.full(n_states, UNREACHED, dtype=np.int64)
+    steps_to = memoryview(dist)
+    queue = deque()
+    for state in starts:
+        if steps_to[state] == UNREACHED:
+            steps_to[state] = 0
+            queue.append(state)
+    expanded = 0
+    pushes = len(queue)
+    found = None
+    while queue:
+        state = queue.popleft()
+        if goal is not None and goal(state):
+            found = state
+            break
+        expanded += 1
+        step = steps_to[state] + 1
+        for nxt in neighbors(state):
+            if steps_to[nxt] == UNREACHED:
+                steps_to[nxt] = step
+                queue.append(nxt)
+                pushes += 1
+    add_search_counts(expanded, pushes)
+    return dist, found
+
+
+def dijkstra(starts, neighbors, n_states, goal=None):
+    """Dijkstra's search on a binary heap for non-negative edge weights
+
+    Args:
+        starts (iterable): start states
+        neighbors (callable): state to iterable of (next state, weight)
+        n_states (int): number of encodable states
+        goal (callable, optional): state to bool, stops the search at the
+            first state it settles. Defaults to None.
+
+    Returns:
+        tuple: (dist array with INFINITY for unreached states, found state)
+    """
+    return astar(starts, neighbors, n_states, None, goal)
+
+
+def astar(starts, neighbors, n_states, heuristic, goal=None):
+    """A* search, ordering the heap by distance plus an admissible estimate
+
+    Args:
+        starts (iterable): start states
+        neighbors (callable): state to iterable of (next state, weight)
+        n_states (int): number of encodable states
+        heuristic (callable): state to a lower bound on its remaining
+            distance, None for plain Dijkstra
+        goal (callable, optional): state to bool, stops the search at the
+            first state it settles. Defaults to None.
+
+    Returns:
+        tuple: (dist array with INFINITY for unreached states, found state)
+    """
+    dist = np.full(n_states, INFINITY, dtype=np.int64)
+    cost_of = memoryview(dist)
+    heap = []
+    for state in starts:
+        cost_of[state] = 0
+        heap.append((heuristic(state) if heuristic else 0, 0, state))
+    heapq.heapify(heap)
+    expanded = 0
+    pushes = len(heap)
+    found = None
+    while heap:
+        _, cost, state = heapq.heappop(heap)
+        if cost > cost_of[state]:
+            # a shorter path to this state was settled already
+            continue
+        if goal is not None and goal(state):
+            found = state
+            break
+        expanded += 1
+        for nxt, weight in neighbors(state):
+            new_cost = cost + weight
+            if new_cost < cost_of[nxt]:
+                cost_of[nxt] = new_cost
+                estimate = new_cost + heuristic(nxt) if heuristic else new_cost
+                heapq.heappush(heap, (estimate, new_cost, nxt))
+                pushes += 1
+    add_search_counts(expanded, pushes)
+    return dist, found
+
+
+def dial(starts, neighbors, n_states, max_weight, goal=None):
+    """Dial's bucket queue search for small non-negative integer edge weights
+
+    Pending states sit in a ring of max_weight + 1 buckets indexed by
+    distance, so each push and pop is O(1) instead of a heap operation.
+
+    Args:
+        starts (iterable): start states
+        neighbors (callable): state to iterable of (next state, weight)
+        n_states (int): number of encodable states
+        max_weight (int): largest edge weight
+        goal (callable, optional): state to bool, stops the search at the
+            first state it settles. Defaults to None.
+
+    Returns:
+        tuple: (dist array with INFINITY for unreached states, found state)
+    """
+    dist = np.full(n_states, INFINITY, dtype=np.int64)
+    cost_of = memoryview(dist)
+    n_buckets = max_weight + 1
+    buckets = [[] for _ in range(n_buckets)]
+    pending = 0
+    for state in starts:
+        cost_of[state] = 0
+        buckets[0].append(state)
+        pending += 1
+    cost = 0
+    expanded = 0
+    pushes = pending
+    while pending:
+        bucket = buckets[cost % n_buckets]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if cost_of[state] != cost:
+                # a shorter path to this state was found after it was queued
+                continue
+            if goal is not None and goal(state):
+                add_search_counts(expanded, pushes)
+                return dist, state
+            expanded += 1
+            for nxt, weight in neighbors(state):
+                new_cost = cost + weight
+                if new_cost < cost_of[nxt]:
+                    cost_of[nxt] = new_cost
+                    buckets[new_cost % n_buckets].append(nxt)
+                    pending += 1
+                    pushes += 1
+        cost += 1
+    add_search_counts(expanded, pushes)
+    return dist, None
+
+
+def flood_fill(grid, start, value, fillable=(0,)):
+    """Set the 4-connected region of fillable cells around start to value
+
+    The grid itself records which cells were visited, so repeated fills of
+    one grid do no per-call allocation.
+
+    Args:
+        grid (np.ndarray): 2D grid, changed in place
+        start (tuple): (row, col) to fill from
+        value (any): value written to every filled cell, not in fillable
+        fillable (tuple, optional): cell values that may be filled.
+            Defaults to (0,).
+
+    Returns:
+        int: number of cells filled
+    """
+    rows, cols = grid.shape
+    cells = memoryview(grid)
+    r, c = start
+    if not (0 <= r < rows and 0 <= c < cols) or cells[r, c] not in fillable:
+        return 0
+    cells[r, c] = value
+    queue = deque([start])
+    filled = 1
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < cols and cells[nr, nc] in fillable:
+                cells[nr, nc] = value
+                queue.append((nr, nc))
+                filled += 1
+    counters.add("filled", filled)
+    return filled
@@ -0,0 +1,460 @@
+"""asyncio solve service with a bounded queue, deadlines and fast rejection
+
+Speaks the daemon's protocol (one JSON object per line on a Unix socket, see
+aoc/daemon.py) so 'ask' and daemon.send_requests work against it, plus:
+
+    {"day": 7, "part": 2, "input": "test.txt", "id": 1, "deadline": 5}
+    {"command": "cancel", "id": 1}
+    {"command": "stats"}
+
+Requests on one connection are served concurrently and replies carry the
+request's 'id', which must be a string or number not already used by one of
+the connection's pending jobs. An accepted job waits in a queue of at most max_pending
+jobs until one of the jobs dispatchers hands it to the worker pool through
+run_in_executor; when the queue is full the job is rejected at once with
+'rejected': true instead of waiting. A job's deadline counts from when it
+was accepted: a job still queued at its deadline never runs, and a running
+job gets the time left as its solve budget. Cancelling a job, or closing its
+connection, drops it from the queue or abandons it if already running.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from . import daemon
+from .runner import format_error
+
+logger = logging.getLogger(__name__)
+
+# jobs that may wait for a worker before new ones are rejected
+DEFAULT_MAX_PENDING = 32
+
+# completed jobs whose latencies the percentiles are taken over
+LATENCY_WINDOW = 1000
+
+PERCENTILES = (50, 90, 99)
+
+
+def make_service(pool, jobs, max_pending=DEFAULT_MAX_PENDING):
+    """Create the state shared by the dispatchers and connections
+
+    Args:
+        pool (concurrent.futures.Executor): solver workers
+        jobs (int): dispatchers, one per worker
+        max_pending (int, optional): queued jobs before rejecting.
+            Defaults to DEFAULT_MAX_PENDING.
+
+    Returns:
+        dict: queue, pool, job counts and recent latencies
+    """
+    return {
+        "pool": pool,
+        "jobs": jobs,
+        "queue": asyncio.Queue(maxsize=max_pending),
+        "running": 0,
+        "counts": {
+            "accepted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+        },
+        "latencies": deque(maxlen=LATENCY_WINDOW),
+        "stopping": asyncio.Event(),
+    }
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of sorted values
+
+    Args:
+        ordered (list): values in ascending order
+        q (float): percentile from 0 to 100
+
+    Returns:
+        float: value at that rank, None when there are no values
+    """
+    if not ordered:
+        return None
+    rank = max(int(-(-q * len(ordered) // 100)), 1)
+    return ordered[rank - 1]
+
+
+def get_stats(service):
+    """Report queue depth, job counts and latency percentiles
+
+    Args:
+        service (dict): make_service result
+
+    Returns:
+        dict: 'queue_depth', 'max_pending', 'running', job counts and
+            'latency' percentiles in seconds over the last LATENCY_WINDOW jobs
+    """
+    ordered = sorted(service["latencies"])
+    latency = {f"p{q}": percentile(ordered, q) for q in PERCENTILES}
+    latency["max"] = ordered[-1] if ordered else None
+    return {
+        "queue_depth": service["queue"].qsize(),
+        "max_pending": service["queue"].maxsize,
+        "running": service["running"],
+        **service["counts"],
+        "latency": latency,
+    }
+
+
+async def dispatch(service):
+    """Hand queued jobs to the worker pool one at a time, until cancelled
+
+    Args:
+        service (dict): make_service result
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        request, future, deadline = await service["queue"].get()
+        try:
+            if future.done():
+                # cancelled or timed out while it waited
+                continue
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    future.set_exception(TimeoutError("deadline passed in queue"))
+                    continue
+                budget = request.get("budget")
+                request = dict(request, budget=min(budget or remaining, remaining))
+            service["running"] += 1
+            started = time.perf_counter()
+            try:
+                reply = await loop.run_in_executor(
+                    service["pool"], daemon.solve_request, request
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                if not future.done():
+                    future.set_exception(err)
+            else:
+                if not future.done():
+                    future.set_result((reply, started))
+            finally:
+                service["running"] -= 1
+        finally:
+            service["queue"].task_done()
+
+
+async def submit(service, request):
+    """Queue a solve job and wait for its reply
+
+    Args:
+        service (dict): make_service result
+        request (dict): solve request, with an optional 'deadline' in seconds
+
+    Returns:
+        dict: solve reply, or 'error', with the seconds from acceptance to
+            reply as 'latency' and, once it ran, the time queued as 'queue_time'
+    """
+    counts = service["counts"]
+    if service["stopping"].is_set():
+        counts["rejected"] += 1
+        return {"error": "service is shutting down", "rejected": True}
+    accepted = time.perf_counter()
+    deadline = request.get("deadline")
+    deadline = None if deadline is None else accepted + deadline
+    future = asyncio.get_running_loop().create_future()
+    try:
+        service["queue"].put_nowait((request, future, deadline))
+    except asyncio.QueueFull:
+        counts["rejected"] += 1
+        return {
+            "error": f"overloaded: {service['queue'].maxsize} jobs already queued",
+            "rejected": True,
+        }
+    counts["accepted"] += 1
+    try:
+        timeout = None if deadline is None else deadline - accepted
+        reply, started = await asyncio.wait_for(future, timeout)
+    except (asyncio.TimeoutError, TimeoutError) as err:
+        counts["timeouts"] += 1
+        reply = {"error": format_error(TimeoutError(str(err) or "deadline passed"))}
+        reply["timeout"] = True
+    except asyncio.CancelledError:
+        # drops the job if it is still queued
+        future.cancel()
+        raise
+    except Exception as err:  # pylint: disable=broad-except
+        counts["failed"] += 1
+        reply = {"error": format_error(err)}
+    else:
+        counts["completed"] += 1
+        reply["queue_time"] = started - accepted
+    reply["latency"] = time.perf_counter() - accepted
+    service["latencies"].append(reply["latency"])
+    return reply
+
+
+async def answer(service, request, writer, lock):
+    """Solve one request and write its reply
+
+    Args:
+        service (dict): make_service result
+        request (dict): solve request
+        writer (asyncio.StreamWriter): client connection
+        lock (asyncio.Lock): keeps replies on one connection whole
+    """
+    reply = await submit(service, request)
+    if "id" in request:
+        reply["id"] = request["id"]
+    await send(writer, lock, reply)
+
+
+async def send(writer, lock, reply):
+    """Write one reply line, ignoring clients that went away
+
+    Args:
+        writer (asyncio.StreamWriter): client connection
+        lock (asyncio.Lock): keeps replies on one connection whole
+        reply (dict): reply to send
+    """
+    async with lock:
+        try:
+            writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+            await writer.drain()
+        except OSError as err:
+            logger.debug("client went away: %s", err)
+
+
+async def handle_connection(service, loaded, reader, writer):
+    """Serve request lines from one client until it disconnects
+
+    Jobs the client still waits on when it disconnects are cancelled.
+
+    Args:
+        service (dict): make_service result
+        loaded (list): preloaded day numbers, reported by ping
+        reader (asyncio.StreamReader): client connection
+        writer (asyncio.StreamWriter): client connection
+    """
+    lock = asyncio.Lock()
+    # every pending job of the connection, and the ones sent with an id by id
+    tasks = set()
+    ids = {}
+    try:
+        async for line in reader:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                command = request.get("command")
+            except Exception as err:  # pylint: disable=broad-except
+                await send(writer, lock, {"error": format_error(err)})
+                continue
+            if command is None:
+                error = check_job_id(request, ids)
+                if error is not None:
+                    await send(writer, lock, {"error": error, "id": request["id"]})
+                    continue
+                task = asyncio.create_task(answer(service, request, writer, lock))
+                tasks.add(task)
+                if "id" in request:
+                    ids[request["id"]] = task
+                task.add_done_callback(
+                    lambda t, tasks=tasks, ids=ids: discard(tasks, ids, t)
+                )
+                continue
+            if command == "ping":
+                reply = {"ok": True, "days": loaded}
+            elif command == "stats":
+                reply = get_stats(service)
+            elif command == "cancel":
+                job_id = request.get("id")
+                # the id is free for a new job as soon as this one is cancelled
+                task = ids.pop(job_id, None) if is_hashable(job_id) else None
+                reply = {"ok": task is not None and cancel_job(service, task)}
+                if reply["ok"]:
+                    await send(
+                        writer,
+                        lock,
+                        {
+                            "error": "CancelledError: cancelled by the client",
+                            "cancelled": True,
+                            "id": request["id"],
+                        },
+                    )
+            elif command == "shutdown":
+                service["stopping"].set()
+                reply = {"ok": True}
+            else:
+                reply = {"error": f"ValueError: unknown command {command!r}"}
+            await send(writer, lock, reply)
+        if tasks:
+            # let the replies of requests sent before the client stopped writing
+            # go out, unless the client closes the connection altogether
+            await asyncio.gather(*tasks, return_exceptions=True)
+    except (asyncio.CancelledError, ConnectionError):
+        # the service is stopping, or the client hung up
+        pass
+    finally:
+        for task in list(tasks):
+            cancel_job(service, task)
+        writer.close()
+
+
+def is_hashable(value):
+    """Check whether a value can key a dict
+
+    Args:
+        value (any): value decoded from a request
+
+    Returns:
+        bool: True when it is hashable
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def check_job_id(request, ids):
+    """Validate the id a solve request was sent with
+
+    Args:
+        request (dict): solve request
+        ids (dict): id to pending task, for the connection
+
+    Returns:
+        str: error reply text, None when the request has no id or a usable one
+    """
+    if "id" not in request:
+        return None
+    job_id = request["id"]
+    if not is_hashable(job_id):
+        return f"TypeError: job id must be a string or number, not {job_id!r}"
+    if job_id in ids:
+        return f"ValueError: job id {job_id!r} is already pending"
+    return None
+
+
+def cancel_job(service, task):
+    """Cancel a job a connection is waiting on
+
+    Args:
+        service (dict): make_service result
+        task (asyncio.Task): the job's task
+
+    Returns:
+        bool: True when the job was still pending
+    """
+    if not task.cancel():
+        return False
+    service["counts"]["cancelled"] += 1
+    return True
+
+
+def discard(tasks, ids, task):
+    """Forget a finished job of a connection
+
+    Args:
+        tasks (set): pending tasks
+        ids (dict): id to pending task
+        task (asyncio.Task): finished task
+    """
+    tasks.discard(task)
+    for key, value in list(ids.items()):
+        if value is task:
+            del ids[key]
+
+
+async def serve_async(socket_path, pool, jobs, loaded, max_pending, stop, ready):
+    """Accept connections and run the dispatchers until stopped
+
+    Args:
+        socket_path (str): socket file
+        pool (concurrent.futures.Executor): warmed up solver workers
+        jobs (int): worker processes
+        loaded (list): preloaded day numbers
+        max_pending (int): queued jobs before rejecting
+        stop (threading.Event): set to stop serving
+        ready (threading.Event): set once requests are accepted, or None
+    """
+    service = make_service(pool, jobs, max_pending)
+    dispatchers = [asyncio.create_task(dispatch(service)) for _ in range(jobs)]
+    server = await asyncio.start_unix_server(
+        lambda r, w: handle_connection(service, loaded, r, w), path=socket_path
+    )
+    logger.info(
+        "serving days %s on %s with %d workers, %d queued at most",
+        loaded,
+        socket_path,
+        jobs,
+        max_pending,
+    )
+    if ready is not None:
+        ready.set()
+    try:
+        while not (stop.is_set() or service["stopping"].is_set()):
+            await asyncio.sleep(daemon.ACCEPT_TIMEOUT)
+    finally:
+        service["stopping"].set()
+        server.close()
+        await server.wait_closed()
+        for task in dispatchers:
+            task.cancel()
+        await asyncio.gather(*dispatchers, return_exceptions=True)
+
+
+def serve(
+    socket_path=daemon.DEFAULT_SOCKET,
+    jobs=None,
+    days=None,
+    max_pending=DEFAULT_MAX_PENDING,
+    stop=None,
+    ready=None,
+):
+    """Serve solve requests through asyncio until stopped
+
+    Args:
+        socket_path (str, optional): socket file. Defaults to DEFAULT_SOCKET.
+        jobs (int, optional): worker processes, None for one per CPU.
+            Defaults to None.
+        days (list, optional): days to preload, None for every day.
+            Defaults to None.
+        max_pending (int, optional): queued jobs before rejecting.
+            Defaults to DEFAULT_MAX_PENDING.
+        stop (threading.Event, optional): set to stop serving. Defaults to None.
+        ready (threading.Event, optional): set once requests are accepted.
+            Defaults to None.
+    """
+    stop = stop or threading.Event()
+    if os.path.exists(socket_path):
+        try:
+            daemon.send_requests([{"command": "ping"}], socket_path, timeout=1)
+        except OSError:
+            os.remove(socket_path)
+        else:
+            raise RuntimeError(f"a daemon is already serving {socket_path}")
+
+    jobs = jobs or os.cpu_count()
+    pool = ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=daemon.preload,
+        initargs=(days,),
+    )
+    try:
+        warmups = [pool.submit(daemon.get_loaded) for _ in range(jobs)]
+        loaded = [future.result() for future in warmups][0]
+        asyncio.run(
+            serve_async(socket_path, pool, jobs, loaded, max_pending, stop, ready)
+        )
+    finally:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        pool.shutdown(cancel_futures=True)
+        logger.info("stopped serving %s", socket_path)
@@ -0,0 +1,107 @@
+"""Random simple loop shapes shared by the grid and polygon input generators"""
+
+NORTH = (-1, 0)
+SOUTH = (1, 0)
+EAST = (0, 1)
+WEST = (0, -1)
+
+
+def get_tree_squares(rng, rows, cols):
+    """Grow a random spanning tree over a coarse grid and draw it at 4x scale
+
+    Each coarse cell becomes a 3x3 block and each tree edge fills the one
+    square gap between its blocks. The drawn squares form a polyomino with no
+    holes and no corner-only contacts, so its outline is a single simple loop
+    with tiles left inside it.
+
+    Args:
+        rng (random.Random): random source
+        rows (int): coarse grid rows
+        cols (int): coarse grid columns
+
+    Returns:
+        set: (r, c) squares of the polyomino
+    """
+    start = (rng.randrange(rows), rng.randrange(cols))
+    visited = {start}
+    squares = set()
+
+    def draw(r, c):
+        squares.update((r + i, c + j) for i in range(3) for j in range(3))
+
+    draw(4 * start[0], 4 * start[1])
+    # random depth-first search, drawing cells and the edges between them
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc)
+            for dr, dc in (NORTH, SOUTH, EAST, WEST)
+            if 0 <= r + dr < rows
+            and 0 <= c + dc < cols
+            and (r + dr, c + dc) not in visited
+            and rng.random() < 0.8
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        visited.add((nr, nc))
+        draw(4 * nr, 4 * nc)
+        # the gap between the two blocks is a row or column of three squares
+        gap_r, gap_c = 4 * min(r, nr), 4 * min(c, nc)
+        if nr != r:
+            squares.update((gap_r + 3, gap_c + j) for j in range(3))
+        else:
+            squares.update((gap_r + i, gap_c + 3) for i in range(3))
+        stack.append((nr, nc))
+    return squares
+
+
+def get_outline(squares):
+    """Trace the outline of a polyomino along its corner points
+
+    Args:
+        squares (set): (r, c) squares of the polyomino
+
+    Returns:
+        dict: corner point to the set of directions its loop edges leave in
+    """
+    links = {}
+
+    def link(a, b, d):
+        links.setdefault(a, set()).add(d)
+        links.setdefault(b, set()).add((-d[0], -d[1]))
+
+    for r, c in squares:
+        if (r - 1, c) not in squares:
+            link((r, c), (r, c + 1), EAST)
+        if (r + 1, c) not in squares:
+            link((r + 1, c), (r + 1, c + 1), EAST)
+        if (r, c - 1) not in squares:
+            link((r, c), (r + 1, c), SOUTH)
+        if (r, c + 1) not in squares:
+            link((r, c + 1), (r + 1, c + 1), SOUTH)
+    return links
+
+
+def trace_loop(links):
+    """Walk an outline into an ordered loop of corner points
+
+    Args:
+        links (dict): output of get_outline
+
+    Returns:
+        list: corner points in loop order, starting from the top-left corner
+    """
+    start = min(links)
+    loop = [start]
+    last_d = None
+    point = start
+    while True:
+        d = next(d for d in sorted(links[point]) if d != last_d)
+        point = (point[0] + d[0], point[1] + d[1])
+        last_d = (-d[0], -d[1])
+        if point == start:
+            return loop
+        loop.append(point)
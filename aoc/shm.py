@@ -0,0 +1,149 @@
+"""Shared-memory handoff of parsed numpy grids to process-pool workers
+
+share() copies a grid into a multiprocessing.shared_memory segment once and
+returns a small handle (segment name, shape and dtype). Tasks carry the
+handle instead of the grid, and attach() maps the segment in a worker as a
+read-only numpy view, once per worker, so sending a task costs the same
+whatever the grid's size. The process that shared a segment unlinks it in
+release(), or at exit if it was never released.
+"""
+
+import atexit
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# segments created here, by name, with the pid of the process that owns
+# them, since forked workers inherit this dict but must not unlink them
+_owned = {}
+
+# segments this process mapped, by name, with the view handed out
+_attached = {}
+
+
+def share(grid):
+    """Copy a grid into a new shared-memory segment
+
+    Args:
+        grid (np.ndarray): grid to share
+
+    Returns:
+        dict: handle with the segment 'name', 'shape' and 'dtype'
+    """
+    grid = np.ascontiguousarray(grid)
+    segment = shared_memory.SharedMemory(create=True, size=max(grid.nbytes, 1))
+    np.ndarray(grid.shape, grid.dtype, buffer=segment.buf)[...] = grid
+    _owned[segment.name] = (segment, os.getpid())
+    logger.debug("shared %s %s grid as %s", grid.shape, grid.dtype, segment.name)
+    return {"name": segment.name, "shape": grid.shape, "dtype": grid.dtype.str}
+
+
+def attach(handle):
+    """Get a read-only view of a shared grid, mapping its segment on first use
+
+    Args:
+        handle (dict): share() result
+
+    Returns:
+        np.ndarray: read-only view backed by the segment
+    """
+    name = handle["name"]
+    if name not in _attached:
+        if name in _owned:
+            segment = _owned[name][0]
+        else:
+            # pool workers share their parent's resource tracker, which
+            # already holds the segment and forgets it when the owner unlinks
+            segment = shared_memory.SharedMemory(name=name)
+        view = np.ndarray(handle["shape"], handle["dtype"], buffer=segment.buf)
+        view.flags.writeable = False
+        _attached[name] = (segment, view)
+    return _attached[name][1]
+
+
+def release(handle):
+    """Unmap a shared grid and unlink it if this process shared it
+
+    Args:
+        handle (dict): share() result
+    """
+    name = handle["name"]
+    _attached.pop(name, None)
+    segment, owner = _owned.pop(name, (None, None))
+    if segment is not None:
+        try:
+            segment.close()
+        except BufferError:
+            # a caller still holds a view; the mapping goes when the view does
+            logger.debug("%s still has views, unlinking it mapped", name)
+        if owner == os.getpid():
+            segment.unlink()
+
+
+@atexit.register
+def release_all():
+    """Unlink every segment this process shared and never released"""
+    _attached.clear()
+    for name in list(_owned):
+        release({"name": name})
+
+
+def init_worker(handle):
+    """Map a shared grid when a pool worker starts
+
+    Args:
+        handle (dict): share() result
+    """
+    attach(handle)
+
+
+def call_with_grid(func, handle, task):
+    """Run one task in a worker against the shared grid
+
+    Args:
+        func (callable): module-level function taking (grid, task)
+        handle (dict): share() result
+        task (any): small picklable task argument
+
+    Returns:
+        any: func's return value
+    """
+    return func(attach(handle), task)
+
+
+def map_grid(func, grid, tasks, jobs=None, chunksize=16):
+    """Map func(grid, task) over tasks in a process pool sharing one grid
+
+    Args:
+        func (callable): module-level function taking (grid, task)
+        grid (np.ndarray): grid every task reads
+        tasks (list): small picklable task arguments
+        jobs (int, optional): worker processes, None for one per CPU.
+            Defaults to None.
+        chunksize (int, optional): tasks sent to a worker at a time.
+            Defaults to 16.
+
+    Returns:
+        list: results in task order
+    """
+    handle = share(grid)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=init_worker, initargs=(handle,)
+        ) as pool:
+            return list(
+                pool.map(
+                    call_with_grid,
+                    [func] * len(tasks),
+                    [handle] * len(tasks),
+                    tasks,
+                    chunksize=chunksize,
+                )
+            )
+    finally:
+        release(handle)
@@ -0,0 +1,32 @@
+"""Python test file for unit testing the opt-in debug artifacts"""
+import logging
+from . import artifacts
+from .artifacts import parse_kinds
+
+logger = logging.getLogger(__name__)
+
+
+def test_parse_kinds():
+    """Test parsing kind lists, 'all' and unknown kinds"""
+    assert parse_kinds(None) == frozenset()
+    assert parse_kinds("grid, deps") == {"grid", "deps"}
+    assert parse_kinds("all") == set(artifacts.KINDS)
+    assert parse_kinds("grid,nope") == {"grid"}
+
+
+def test_enable(tmp_path, monkeypatch):
+    """Test that nothing is written until a kind is enabled"""
+    monkeypatch.setenv(artifacts.ARTIFACTS_ENV, "")
+    monkeypatch.setenv(artifacts.ARTIFACT_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(artifacts, "_state", dict(artifacts._state))
+    artifacts.enable("", str(tmp_path))
+    assert artifacts.write_grid("grid.txt", [[1, 2], [3, 4]]) is None
+    assert artifacts.write_lines("deps", "deps.txt", ["a <- b"]) is None
+    assert not artifacts.records(logger)
+    assert not list(tmp_path.iterdir())
+
+    artifacts.enable("grid,deps")
+    path = artifacts.write_grid("grid.txt", [[1, 2], [3, 4]])
+    assert open(path, encoding="utf-8").read() == "1 2\n3 4\n"
+    path = artifacts.write_lines("deps", "deps.txt", ["a <- b"])
+    assert open(path, encoding="utf-8").read() == "a <- b\n"
@@ -0,0 +1,23 @@
+"""Python test file for unit testing batch runs over many inputs"""
+import shutil
+
+from .batch import find_inputs, has_error, run_batch
+from .days import get_input_path
+
+
+def test_run_batch(tmp_path):
+    """Test that every input in a folder is solved, including broken ones"""
+    for name in ("a.txt", "b.txt"):
+        shutil.copy(get_input_path(7, "test.txt"), tmp_path / name)
+    (tmp_path / "c.txt").write_text("not a hand\n", encoding="utf-8")
+    paths = find_inputs(str(tmp_path))
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["a.txt", "b.txt", "c.txt"]
+    assert find_inputs(str(tmp_path / "[ab].txt")) == paths[:2]
+
+    results = {r["input"]: r for r in run_batch(7, paths, jobs=2)}
+    assert set(results) == set(paths)
+    for path in paths[:2]:
+        assert not has_error(results[path])
+        assert results[path]["parts"][1]["answer"] == 6440
+        assert results[path]["parts"][2]["answer"] == 5905
+    assert has_error(results[paths[2]])
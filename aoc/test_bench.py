@@ -0,0 +1,59 @@
+"""Python test file for unit testing the benchmark harness"""
+import copy
+from .bench import time_call, bench_day, run_benchmarks, compare, format_report
+
+
+def test_time_call():
+    """Test warmups, repeats and the per-phase time budget"""
+    calls = []
+    value, stats = time_call(lambda: calls.append(1) or len(calls), 2, 3)
+    assert value == 5
+    assert stats["runs"] == 3
+    assert stats["min"] <= stats["median"]
+
+    _, stats = time_call(lambda: None, 0, 100, time_budget=0.0)
+    assert stats["runs"] == 1
+
+
+def test_bench_day():
+    """Test that every phase of a day is timed with its answer"""
+    phases = bench_day(9, "test.txt", warmups=0, repeats=2)
+    assert set(phases) == {"parse", "part1", "part2"}
+    assert phases["part1"]["answer"] == 114
+    assert phases["part2"]["stats"]["runs"] == 2
+
+    # day 6 parses the input a second way for Part 2
+    phases = bench_day(6, "test.txt", warmups=0, repeats=1)
+    assert "parse_data2" in phases
+    assert phases["part2"]["answer"] == 71503
+
+
+def test_compare():
+    """Test the regression gate against a stored baseline"""
+    baseline = run_benchmarks([4], inputs=("test.txt",), warmups=0, repeats=1)
+    slower = copy.deepcopy(baseline)
+    part2 = slower["results"]["4"]["test.txt"]["part2"]["stats"]
+    part2["median"] = part2["median"] * 10 + 0.01
+
+    comparisons = compare(slower, baseline, threshold=1.25)
+    regressed = [(c["day"], c["phase"]) for c in comparisons if c["regressed"]]
+    assert regressed == [(4, "part2")]
+    assert "REGRESSED" in format_report(slower, comparisons)
+    assert not any(c["regressed"] for c in compare(baseline, baseline))
+
+
+def test_compare_failed_phase():
+    """Test that a phase timed in the baseline and now failing is regressed"""
+    baseline = run_benchmarks([4], inputs=("test.txt",), warmups=0, repeats=1)
+    failing = copy.deepcopy(baseline)
+    failing["results"]["4"]["test.txt"]["part2"] = {"error": "ValueError: boom"}
+    comparisons = compare(failing, baseline)
+    regressed = [(c["phase"], c.get("error")) for c in comparisons if c["regressed"]]
+    assert regressed == [("part2", "ValueError: boom")]
+    assert "failed REGRESSED" in format_report(failing, comparisons)
+
+    failing["results"]["4"]["test.txt"] = {"error": "OSError: unreadable"}
+    assert all(c["regressed"] for c in compare(failing, baseline))
+    # days left out of the current run are not compared
+    failing["results"] = {}
+    assert not compare(failing, baseline)
@@ -0,0 +1,74 @@
+"""Python test file for unit testing the parsed input cache"""
+import numpy as np
+from . import search
+from .cache import cached_parse, hash_code, hash_input
+from .days import get_input_path, load_module
+from .runner import run_day
+
+
+def test_cached_parse(tmp_path):
+    """Test that a second parse of the same bytes is loaded from disk"""
+    module = load_module(14)
+    text_data = module.get_file_data(get_input_path(14, "test.txt"))
+    grid, hit = cached_parse(module, 14, "parse_data", text_data, str(tmp_path))
+    assert not hit
+    cached, hit = cached_parse(module, 14, "parse_data", text_data, str(tmp_path))
+    assert hit
+    assert np.array_equal(grid, cached)
+    assert list(tmp_path.glob("day14/*.npy"))
+
+    # non-array results are pickled, and other bytes miss the cache
+    module = load_module(8)
+    data, hit = cached_parse(
+        module, 8, "parse_data", "LR\n\nAAA = (ZZZ, ZZZ)", str(tmp_path)
+    )
+    assert not hit
+    assert cached_parse(
+        module, 8, "parse_data", "LR\n\nAAA = (ZZZ, ZZZ)", str(tmp_path)
+    ) == (data, True)
+    assert hash_input("a") != hash_input("b")
+
+
+def test_run_day_cache(tmp_path):
+    """Test that warm runs reuse parses and answers with their original times"""
+    cold = run_day(4, "test.txt", parts=(1,), cache_dir=str(tmp_path))
+    assert cold["parse_cached"] is False
+    assert not cold["parts"][1]["cached"]
+
+    # Part 1 is looked up, Part 2 is solved from the cached parse
+    warm = run_day(4, "test.txt", cache_dir=str(tmp_path))
+    assert warm["parse_cached"] is True
+    assert warm["parts"][1] == {
+        "answer": 13,
+        "time": cold["parts"][1]["time"],
+        "cached": True,
+        "engine": "default",
+        "counters": {},
+    }
+    assert warm["parts"][2]["answer"] == 30
+    assert not warm["parts"][2]["cached"]
+
+    # with both answers stored nothing is parsed
+    hot = run_day(4, "test.txt", cache_dir=str(tmp_path))
+    assert hot["parse_time"] is None
+    assert all(p["cached"] for p in hot["parts"].values())
+
+    fresh = run_day(4, "test.txt", cache_dir=None)
+    assert fresh["parse_cached"] is False
+    assert not fresh["parts"][2]["cached"]
+
+
+def test_hash_code_shared_modules(tmp_path, monkeypatch):
+    """Test that editing an aoc module a day calls into changes the day's hash"""
+    module = load_module(17)
+    hash_code.cache_clear()
+    before = hash_code(module)
+    edited = tmp_path / "search.py"
+    with open(search.__file__, encoding="utf-8") as f:
+        edited.write_text(f.read() + "\n# edited\n", encoding="utf-8")
+    monkeypatch.setattr(search, "__file__", str(edited))
+    hash_code.cache_clear()
+    try:
+        assert hash_code(module) != before
+    finally:
+        hash_code.cache_clear()
@@ -0,0 +1,53 @@
+"""Python test file for unit testing checkpoint and resume of solver loops"""
+import os
+
+import pytest
+
+from .cache import hash_code, hash_input
+from .checkpoint import get_checkpoint_path, load, save, session, write_states
+from .days import get_default_engine, get_input_path, load_module
+from .runner import run_day
+
+
+def count_to(n, fail_at=None):
+    """Sum 0..n-1 in a checkpointed loop, raising before fail_at if given"""
+    start, total = load("sum", (0, 0))
+    for i in range(start, n):
+        if i == fail_at:
+            raise TimeoutError("interrupted")
+        total += i
+        save("sum", (i + 1, total))
+    return total, start
+
+
+def test_session_resume(tmp_path):
+    """Test that an interrupted loop resumes where it stopped, then cleans up"""
+    path = str(tmp_path / "part2.pickle")
+    save("sum", (5, 10))
+    assert count_to(10) == (45, 0)
+    with pytest.raises(TimeoutError):
+        with session(path, interval=3600):
+            count_to(10, fail_at=6)
+    assert os.path.exists(path)
+    with session(path):
+        assert count_to(10) == (45, 6)
+    assert not os.path.exists(path)
+
+
+def test_run_day_resume(tmp_path):
+    """Test that the runner resumes a part from the checkpoint for its input"""
+    module = load_module(12)
+    text_data = module.get_file_data(get_input_path(12, "test.txt"))
+    path = get_checkpoint_path(
+        str(tmp_path),
+        12,
+        1,
+        hash_input(text_data),
+        hash_code(module),
+        get_default_engine(12, 1),
+    )
+    # a made-up total for the first five rows, so only the sixth is counted
+    write_states(path, {"rows": (5, 100)})
+    result = run_day(12, "test.txt", parts=(1,), checkpoint_dir=str(tmp_path))
+    assert result["parts"][1]["answer"] == 110
+    assert not os.path.exists(path)
@@ -0,0 +1,33 @@
+"""Python test file for unit testing the scaling report"""
+import pytest
+from .complexity import fit_exponent, measure_phase, scale_day, format_report
+
+
+def test_fit_exponent():
+    """Test the log-log fit on exact power laws"""
+    xs = [10, 20, 40, 80]
+    assert fit_exponent(xs, [x**2 for x in xs]) == pytest.approx(2.0)
+    assert fit_exponent(xs, [3 * x for x in xs]) == pytest.approx(1.0)
+    assert fit_exponent([10], [5]) is None
+    assert fit_exponent(xs, [None] * 4) is None
+
+
+def test_measure_phase():
+    """Test that peak memory tracks a large allocation"""
+    result = measure_phase(lambda: [0] * 100000)
+    assert result["time"] >= 0
+    assert result["peak"] >= 100000 * 8
+
+    assert measure_phase(lambda: None, memory=False)["peak"] is None
+
+
+def test_scale_day():
+    """Test fitting a day's phases over a few generated sizes"""
+    report = scale_day(7, steps=3, start=0.05, memory=False)
+    sizes = [p["size"] for p in report["points"]]
+    assert sizes == [50, 100, 200]
+    fit = report["fits"]["part2"]
+    assert fit["name"] == "day7.get_total_winnings_2_sorted"
+    assert fit["points"] == 3
+    assert fit["time_exponent"] > 0.5
+    assert "day7.parse_data ~ n^" in format_report([report])
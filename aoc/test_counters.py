@@ -0,0 +1,27 @@
+"""Python test file for unit testing the solver work counters"""
+from .counters import add, collect, format_counters
+from .runner import run_day
+
+
+def test_collect():
+    """Test that counts only land inside collect() and nested blocks are separate"""
+    add("ignored")
+    with collect() as outer:
+        add("pushes", 3)
+        with collect() as inner:
+            add("pushes")
+        add("pushes", 2)
+    assert outer == {"pushes": 5}
+    assert inner == {"pushes": 1}
+    assert format_counters({"pushes": 1200, "expanded": 7}) == (
+        "expanded=7 pushes=1,200"
+    )
+
+
+def test_run_day_counters():
+    """Test that the runner reports a search day's work next to its answer"""
+    result = run_day(17, "test.txt", parts=(1,))
+    entry = result["parts"][1]
+    assert entry["answer"] == 102
+    assert entry["counters"]["expanded"] > 0
+    assert entry["counters"]["pushes"] >= entry["counters"]["expanded"]
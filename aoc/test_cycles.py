@@ -0,0 +1,33 @@
+"""Python test file for unit testing the cycle detectors"""
+import pytest
+from .cycles import find_cycle
+
+# 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 3: a prefix of 3 and a period of 4
+RHO = [1, 2, 3, 4, 5, 6, 3]
+
+
+@pytest.mark.parametrize("method", ["dict", "brent"])
+def test_find_cycle(method):
+    """Test both detectors on a rho-shaped sequence, before and after the loop"""
+    step = RHO.__getitem__
+    assert find_cycle(step, 0, 0, method=method) == (None, None, 0)
+    assert find_cycle(step, 0, 2, method=method) == (None, None, 2)
+    assert find_cycle(step, 0, 999, method=method) == (3, 4, 3)
+    assert find_cycle(step, 0, 1000, method=method) == (3, 4, 4)
+
+
+def test_methods_agree():
+    """Test that both detectors agree on a longer sequence keyed by a snapshot"""
+
+    def step(pair):
+        return (pair[0] * pair[0] + 1) % 255, pair[1] + 1
+
+    def key(pair):
+        return pair[0]
+
+    by_dict = find_cycle(step, (2, 0), 10**6, key=key)
+    by_brent = find_cycle(step, (2, 0), 10**6, key=key, method="brent")
+    assert by_dict[:2] == by_brent[:2]
+    assert by_dict[2][0] == by_brent[2][0]
+    with pytest.raises(ValueError):
+        find_cycle(step, (2, 0), 1, method="floyd")
@@ -0,0 +1,42 @@
+"""Python test file for unit testing the solver daemon"""
+import threading
+
+from .daemon import send_requests, serve
+from .days import get_input_path
+
+
+def test_daemon(tmp_path):
+    """Test answers, errors and shutdown over a Unix socket"""
+    socket_path = str(tmp_path / "aoc.sock")
+    stop = threading.Event()
+    ready = threading.Event()
+    server = threading.Thread(
+        target=serve,
+        args=(socket_path,),
+        kwargs={"jobs": 1, "days": [2], "stop": stop, "ready": ready},
+    )
+    server.start()
+    try:
+        assert ready.wait(30)
+        with open(get_input_path(2, "test.txt"), encoding="utf-8") as f:
+            text = f.read()
+        replies = send_requests(
+            [
+                {"command": "ping"},
+                {"day": 2, "part": 1, "input": "test.txt"},
+                {"day": 2, "part": 2, "data": text},
+                {"day": 2, "part": 3, "input": "test.txt"},
+            ],
+            socket_path,
+            timeout=30,
+        )
+        assert replies[0] == {"ok": True, "days": [2]}
+        assert replies[1]["answer"] == 8
+        assert replies[2]["answer"] == 2286
+        assert replies[2]["time"] >= 0
+        assert "error" in replies[3]
+        assert send_requests([{"command": "shutdown"}], socket_path) == [{"ok": True}]
+    finally:
+        stop.set()
+        server.join(30)
+    assert not (tmp_path / "aoc.sock").exists()
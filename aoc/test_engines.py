@@ -0,0 +1,43 @@
+"""Python test file for unit testing engine selection"""
+import pytest
+from .days import get_engines, get_solver_name
+from .engines import parse_selection, pick_fastest, resolve_day, resolve_engine
+
+
+def test_resolve_engine():
+    """Test that a selection beats measured choices, which beat the default"""
+    assert get_engines(4, 1) == {"default": "get_points_worth"}
+    assert get_solver_name(7, 1, "insertion") == "get_total_winnings"
+    selection = parse_selection("7=insertion, 6.2=brute_force")
+    assert selection == {(7, None): "insertion", (6, 2): "brute_force"}
+    assert resolve_day(7, selection) == {1: "insertion", 2: "insertion"}
+    choices = {"6.1": "brute_force", "6.2": "closed_form", "7.1": "missing"}
+    assert resolve_day(6, selection, choices) == {1: "brute_force", 2: "brute_force"}
+    assert resolve_engine(7, 1, None, choices) == "sorted"
+    with pytest.raises(ValueError):
+        parse_selection("7=missing")
+    with pytest.raises(ValueError):
+        get_solver_name(7, 1, "missing")
+
+
+def test_pick_fastest():
+    """Test choosing the lowest median engine per multi-engine part"""
+
+    def timed(median):
+        return {"stats": {"median": median}}
+
+    document = {
+        "results": {
+            "7": {
+                "input.txt": {
+                    "parse": timed(0.1),
+                    "part1:sorted": timed(0.3),
+                    "part1:insertion": timed(0.2),
+                    "part2:sorted": timed(0.1),
+                    "part2:insertion": {"error": "ValueError: x"},
+                }
+            },
+            "4": {"input.txt": {"part1:default": timed(0.1)}},
+        }
+    }
+    assert pick_fastest(document) == {"7.1": "insertion", "7.2": "sorted"}
@@ -0,0 +1,31 @@
+"""Python test file for unit testing the differential fuzz harness"""
+from . import days as aoc_days
+from .fuzz import fuzz_part, get_fuzzed_parts, minimize
+
+
+def test_minimize():
+    """Test that a failing input shrinks to the lines it needs"""
+    text_data = "".join(f"line {i}\n" for i in range(20))
+    smallest = minimize(text_data, lambda t: "line 3\n" in t and "line 17\n" in t)
+    assert smallest == "line 3\nline 17\n"
+
+
+def test_fuzz_part(monkeypatch):
+    """Test agreement, then a planted bug caught with a minimal reproducer"""
+    assert get_fuzzed_parts(7) == [1, 2]
+    assert get_fuzzed_parts(17) == [1, 2]
+    report = fuzz_part(7, 1, cases=20)
+    assert report["mismatches"] == [] and report["skipped"] == 0
+
+    module = aoc_days.load_module(7)
+    fast = module.get_total_winnings_sorted
+    monkeypatch.setattr(
+        module,
+        "get_total_winnings_sorted",
+        lambda data: fast(data) + (len(data) >= 3),
+    )
+    report = fuzz_part(7, 1, cases=20)
+    assert report["mismatches"]
+    reproducer = report["reproducer"]
+    assert len(reproducer["input"].splitlines()) == 3
+    assert reproducer["actual"] == reproducer["expected"] + 1
@@ -0,0 +1,72 @@
+"""Python test file for unit testing the synthetic input generators"""
+import math
+import random
+import pytest
+from .days import discover_days, load_module, parse_input, solve_part
+from .generators import generate_input, load_generator
+from .shapes import get_tree_squares
+
+# days whose solvers are quick enough to run on small generated inputs
+SOLVABLE = [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 17, 19]
+
+
+@pytest.mark.parametrize("day", discover_days())
+def test_seeded(day):
+    """Test that every day has a generator and that seeds are repeatable"""
+    size = max(load_generator(day).DEFAULT_SIZE // 10, 5)
+    assert generate_input(day, size, seed=1) == generate_input(day, size, seed=1)
+    assert generate_input(day, size, seed=1) != generate_input(day, size, seed=2)
+
+
+@pytest.mark.parametrize("day", SOLVABLE)
+def test_solvable(day):
+    """Test that small generated inputs parse and solve without errors"""
+    module = load_module(day)
+    size = max(load_generator(day).DEFAULT_SIZE // 20, 5)
+    text_data = generate_input(day, size, seed=3)
+    for part in (1, 2):
+        parse_name = "parse_data2" if (day, part) == (6, 2) else "parse_data"
+        data = parse_input(module, parse_name, text_data)
+        assert solve_part(module, day, part, data) is not None
+
+
+def test_loop_shapes():
+    """Test the pipe loop and dig plan generators against area formulas"""
+    day10 = load_module(10)
+    text_data = generate_input(10, 25, seed=4)
+    loop_length = 2 * day10.function(day10.parse_data(text_data))
+    # the loop outlines the generator's polyomino, so Pick's theorem applies
+    area = len(get_tree_squares(random.Random(4), 6, 6))
+    enclosed = day10.get_enclosed_tile_count(day10.parse_data(text_data))
+    assert enclosed == area - loop_length // 2 + 1
+
+    day18 = load_module(18)
+    data = day18.parse_data(generate_input(18, 60, seed=4))
+    p = (0, 0)
+    area2 = 0
+    perimeter = 0
+    for d, n, _ in data:
+        q = (p[0] + d[0] * n, p[1] + d[1] * n)
+        area2 += p[0] * q[1] - q[0] * p[1]
+        perimeter += n
+        p = q
+    assert p == (0, 0)
+    assert day18.function(data) == abs(area2) // 2 + perimeter // 2 + 1
+
+
+def test_counter_periods():
+    """Test that the module network's answer is the LCM of its counter periods"""
+    day20 = load_module(20)
+    modules = day20.parse_data(generate_input(20, 6, seed=5))
+    periods = []
+    for name in modules["broadcaster"]["rxs"]:
+        period = 0
+        bit = 0
+        while name:
+            rxs = modules[name]["rxs"]
+            if any(modules[rx]["op"] == "&" for rx in rxs):
+                period |= 1 << bit
+            name = next((rx for rx in rxs if modules[rx]["op"] == "%"), None)
+            bit += 1
+        periods.append(period)
+    assert day20.function2(modules) == math.lcm(*periods)
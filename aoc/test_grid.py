@@ -0,0 +1,46 @@
+"""Python test file for unit testing the numpy grid loader"""
+import mmap
+import numpy as np
+import pytest
+from .grid import find, make_lookup, read_grid, split_grids, to_grid, view_chars
+
+
+def test_view_chars():
+    """Test that grids view the input buffer without copying it"""
+    text = b"#..\n.#.\n..S\n"
+    chars = view_chars(text)
+    assert chars.shape == (3, 3)
+    assert np.shares_memory(chars, np.frombuffer(text, dtype=np.uint8))
+    assert bytes(chars[2]) == b"..S"
+    assert find(chars, ord("S")) == (2, 2)
+    assert find(chars, ord("X")) is None
+
+    assert view_chars("\n\nab\r\ncd\r\n").tolist() == [[97, 98], [99, 100]]
+    with pytest.raises(ValueError):
+        view_chars("ab\nc\n")
+
+
+def test_to_grid():
+    """Test translating characters to compact codes"""
+    lookup = make_lookup({"O": 2, "#": 1})
+    grid = to_grid("O.#\n#O.", lookup)
+    assert grid.dtype == np.uint8
+    assert grid.tolist() == [[2, 0, 1], [1, 2, 0]]
+    grid[0, 0] = 0
+
+    rocks = make_lookup({"#": True}, dtype=bool)
+    assert to_grid("#.\n.#", rocks).tolist() == [[True, False], [False, True]]
+
+
+def test_split_grids(tmp_path):
+    """Test blank-line separated grids, read from a memory-mapped file"""
+    path = tmp_path / "grids.txt"
+    path.write_bytes(b"#.\n.#\n\n##.\n\n\n...\n...\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        grids = split_grids(m)
+        assert [g.shape for g in grids] == [(2, 2), (1, 3), (2, 3)]
+        del grids
+
+    path.write_bytes(b"123\n456\n")
+    digits = make_lookup({str(d): d for d in range(10)})
+    assert read_grid(path, digits).tolist() == [[1, 2, 3], [4, 5, 6]]
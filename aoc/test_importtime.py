@@ -0,0 +1,53 @@
+"""Python test file for unit testing the import time report"""
+import subprocess
+import sys
+
+from .days import ROOT
+from .importtime import get_total, measure_day, parse_importtime
+
+REPORT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _weakrefset
+import time:       300 |        420 |   threading
+import time:      1000 |       1420 | logging
+import time:        50 |         50 | aoc
+"""
+
+
+def test_parse_importtime():
+    """Test that importtime lines become nested per-module entries"""
+    entries = parse_importtime(REPORT)
+    assert [e["module"] for e in entries] == [
+        "_weakrefset",
+        "threading",
+        "logging",
+        "aoc",
+    ]
+    assert [e["depth"] for e in entries] == [2, 1, 0, 0]
+    assert entries[2]["self"] == 1000
+    assert get_total(entries) == 1470
+
+
+def test_measure_day():
+    """Test that a day without grids starts without numpy or the profilers"""
+    modules = {e["module"] for e in measure_day(7)}
+    assert "day7.solve" in modules
+    assert "aoc.runner" in modules
+    assert "numpy" not in modules
+    assert "cProfile" not in modules
+
+
+def test_import_days_keeps_sys_path():
+    """Test that importing every day as a package leaves sys.path alone"""
+    code = (
+        "import sys, importlib; before = list(sys.path); "
+        "[importlib.import_module(f'day{d}.solve') for d in range(1, 22)]; "
+        "print(sys.path == before)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "True"
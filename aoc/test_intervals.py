@@ -0,0 +1,48 @@
+"""Python test file for unit testing interval sets and boxes"""
+from .intervals import (
+    box_volume,
+    intersect,
+    map_intervals,
+    normalize,
+    split,
+    split_box,
+    total_length,
+    translate,
+    union,
+)
+
+
+def test_interval_sets():
+    """Test coalescing, set operations and threshold splits"""
+    assert normalize([(5, 8), (0, 2), (2, 3), (6, 10), (4, 4)]) == [(0, 3), (5, 10)]
+    assert union([(0, 2)], [(10, 12), (1, 5)]) == [(0, 5), (10, 12)]
+    assert intersect([(0, 5), (8, 12)], [(3, 9), (11, 20)]) == [
+        (3, 5),
+        (8, 9),
+        (11, 12),
+    ]
+    assert split([(0, 5), (8, 12)], 10) == ([(0, 5), (8, 10)], [(10, 12)])
+    assert split([(0, 5)], 0) == ([], [(0, 5)])
+    assert translate([(0, 5)], -2) == [(-2, 3)]
+    assert total_length([(0, 5), (8, 12)]) == 9
+
+
+def test_map_intervals():
+    """Test that covered fragments move and uncovered ones stay put"""
+    # the first almanac map of day 5: 98-99 move to 50-51, 50-97 to 52-99
+    shifts = [(98, 100, -48), (50, 98, 2)]
+    assert map_intervals([(79, 93), (55, 68)][::-1], shifts) == [(57, 70), (81, 95)]
+    assert map_intervals([(96, 100)], shifts) == [(50, 52), (98, 100)]
+    assert map_intervals([(40, 101)], shifts) == [(40, 101)]
+    assert map_intervals([(0, 10)], []) == [(0, 10)]
+
+
+def test_boxes():
+    """Test cutting a 4-D box along one axis"""
+    box = ((1, 4001),) * 4
+    lower, upper = split_box(box, 1, 2000)
+    assert lower[1] == (1, 2000) and upper[1] == (2000, 4001)
+    assert lower[0] == upper[0] == (1, 4001)
+    assert box_volume(lower) + box_volume(upper) == box_volume(box) == 4000**4
+    assert split_box(box, 0, 1) == (None, box)
+    assert split_box(box, 0, 5000) == (box, None)
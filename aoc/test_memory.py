@@ -0,0 +1,30 @@
+"""Python test file for unit testing the per-phase memory report"""
+from .memory import format_bytes, format_report, trace_day, trace_phase
+
+
+def make_transient(n):
+    """Build a large list and keep only its length"""
+    values = [str(i) for i in range(n)]
+    return len(values)
+
+
+def test_trace_phase():
+    """Test that freed structures count toward the peak but not retention"""
+    value, report = trace_phase(lambda: make_transient(200000), interval=0.001)
+    assert value == 200000
+    assert report["peak"] > 200000 * 40
+    assert report["retained"] < report["peak"] / 10
+    assert "aoc/test_memory.py" in report["peak_lines"][0]["line"]
+
+    kept, report = trace_phase(lambda: bytearray(10**6))
+    assert len(kept) == 10**6
+    assert report["retained"] >= 10**6
+
+
+def test_trace_day():
+    """Test tracing every phase of a day"""
+    results = {9: trace_day(9, "test.txt", top=3)}
+    assert set(results[9]) == {"parse", "part1", "part2"}
+    assert results[9]["part1"]["answer"] == 114
+    assert "day9 parse: peak" in format_report(results)
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
@@ -0,0 +1,41 @@
+"""Python test file for unit testing the AOC_PROFILE profiling wrapper"""
+import os
+from .days import get_input_path, load_module
+from .profiling import profile_main, profile_parts, run_cprofile, run_sampler
+
+
+def busy(n):
+    """Spend a little time in Python code"""
+    return sum(i * i for i in range(n))
+
+
+def test_profilers():
+    """Test that both profilers return the value and see the hot function"""
+    value, report = run_cprofile(busy, 10000)
+    assert value == busy(10000)
+    assert any(row[0].endswith("test_profiling.py:busy") for row in report["top"])
+    assert report["stats"]
+
+    value, report = run_sampler(busy, 300000, interval=0.0005)
+    assert value == busy(300000)
+    assert any("test_profiling.py:busy" in stack for stack in report["collapsed"])
+
+
+def test_profile_parts(tmp_path, monkeypatch):
+    """Test profiling a day's parts through its decorated main()"""
+    module = load_module(9)
+    original = module.find_extrapolation_sum
+    restore = profile_parts(module, "cprofile", str(tmp_path))
+    assert module.find_extrapolation_sum is not original
+    data = module.parse_data(module.get_file_data(get_input_path(9, "test.txt")))
+    assert module.find_extrapolation_sum(data) == 114
+    restore()
+    assert module.find_extrapolation_sum is original
+    names = sorted(os.listdir(tmp_path))
+    assert names == ["day9-part1.collapsed", "day9-part1.prof", "day9-part1.txt"]
+
+    calls = []
+    wrapped = profile_main(lambda: calls.append(1))
+    monkeypatch.delenv("AOC_PROFILE", raising=False)
+    wrapped()
+    assert calls == [1]
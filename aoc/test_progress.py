@@ -0,0 +1,54 @@
+"""Python test file for unit testing progress reports and time budgets"""
+import pytest
+from . import progress
+
+
+def test_report_callback(monkeypatch):
+    """Test that reports reach the callback with a rate and an estimate"""
+    monkeypatch.setattr(progress, "REPORT_INTERVAL", 0)
+    updates = []
+    progress.report(1, 10)
+    with progress.budget(label="count", callback=updates.append):
+        for i in range(10):
+            progress.report(i + 1, 10)
+    assert [u["done"] for u in updates] == list(range(1, 11))
+    assert updates[-1]["label"] == "count"
+    assert updates[-1]["eta"] == 0
+    assert "10/10 (100%)" in progress.format_progress(updates[-1])
+    # reports outside a budget are dropped
+    progress.report(1, 10)
+    assert len(updates) == 10
+
+
+def test_budget_cancels():
+    """Test that a reporting loop and a silent loop are both cancelled"""
+    with pytest.raises(TimeoutError):
+        with progress.budget(0.05, callback=None):
+            done = 0
+            while True:
+                done += 1
+                progress.report(done)
+    with pytest.raises(TimeoutError):
+        with progress.budget(0.05, callback=None):
+            while True:
+                pass
+    # nothing is left armed once the block exits
+    with progress.budget(None):
+        progress.report(1)
+
+
+def test_logging_and_stages(monkeypatch):
+    """Test that progress is only logged when asked and stages relabel reports"""
+    monkeypatch.setitem(progress._settings, "log", False)
+    assert progress.get_callback() is None
+    assert progress.get_callback(5) is progress.log_progress
+    monkeypatch.setitem(progress._settings, "log", True)
+    assert progress.get_callback() is progress.log_progress
+
+    monkeypatch.setattr(progress, "REPORT_INTERVAL", 0)
+    updates = []
+    with progress.budget(label="day 20 part 2", callback=updates.append):
+        with progress.stage("counter a"):
+            progress.report(3)
+        progress.report(4)
+    assert [u["label"] for u in updates] == ["day 20 part 2 counter a", "day 20 part 2"]
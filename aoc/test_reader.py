@@ -0,0 +1,30 @@
+"""Python test file for unit testing the memory-mapped input reader"""
+from .reader import iter_blocks, iter_lines, iter_sections, iter_split, read_input
+
+
+def test_iterators_match_split():
+    """Test that the iterators match strip().split() on str and mapped inputs"""
+    text = "\n\nseeds: 1 2 \n\nmap:\n3 4\r\n5 6\n\n"
+    for data in (text, text.encode()):
+        assert list(iter_split(data)) == text.strip().split("\n")
+        assert list(iter_lines(data)) == ["seeds: 1 2 ", "", "map:", "3 4", "5 6"]
+        assert list(iter_sections(data)) == ["seeds: 1 2", "map:\n3 4\r\n5 6"]
+        assert list(iter_split(data, ",")) == [text.strip()]
+    assert not list(iter_lines(" \n"))
+
+
+def test_read_input(tmp_path):
+    """Test reading a memory-mapped file and cutting it into blocks"""
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"aa\nbb\ncc\n\ndd\n")
+    data = read_input(path)
+    assert list(iter_lines(data)) == ["aa", "bb", "cc", "", "dd"]
+    assert [bytes(b) for b in iter_blocks(data, 4)] == [b"aa\nbb\n", b"cc\n\n", b"dd\n"]
+    assert [bytes(b) for b in iter_blocks(data, 4, "\n\n")] == [
+        b"aa\nbb\ncc\n\n",
+        b"dd\n",
+    ]
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert not list(iter_lines(read_input(empty)))
@@ -0,0 +1,47 @@
+"""Python test file for unit testing the multi-day runner"""
+import json
+from .days import discover_days, parse_day_range
+from .runner import run_day, run_days, format_table, format_json
+
+
+def test_day_selection():
+    """Test day discovery and --days range parsing"""
+    assert parse_day_range("1-3,7, 9-10") == [1, 2, 3, 7, 9, 10]
+    assert parse_day_range("4,4") == [4]
+    found = discover_days()
+    assert 1 in found
+    assert found == sorted(found)
+
+
+def test_run_day():
+    """Test a single day's answers and timings against its sample input"""
+    result = run_day(4, "test.txt")
+    assert "error" not in result
+    assert result["parts"][1]["answer"] == 13
+    assert result["parts"][2]["answer"] == 30
+    assert result["parse_time"] >= 0
+    assert result["parts"][1]["time"] >= 0
+
+
+def test_run_days():
+    """Test fanning days out across worker processes"""
+    results = run_days([2, 6, 9], jobs=2, input_name="test.txt")
+    assert [r["day"] for r in results] == [2, 6, 9]
+    answers = [(r["parts"][1]["answer"], r["parts"][2]["answer"]) for r in results]
+    assert answers == [(8, 2286), (288, 71503), (114, 2)]
+    assert "71503" in format_table(results)
+    assert json.loads(format_json(results))[1]["day"] == 6
+
+
+def test_run_day_error():
+    """Test that a missing input is reported instead of raised"""
+    result = run_day(1, "missing.txt")
+    assert "error" in result
+
+
+def test_run_day_budget():
+    """Test that a part running past its budget is reported as a timeout"""
+    result = run_day(14, "input.txt", parts=(2,), budget=0.1)
+    entry = result["parts"][2]
+    assert entry["timeout"] is True
+    assert entry["error"].startswith("TimeoutError")
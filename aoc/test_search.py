@@ -0,0 +1,77 @@
+"""Python test file for unit testing the shared graph searches"""
+import numpy as np
+from .search import (
+    INFINITY,
+    UNREACHED,
+    astar,
+    bfs,
+    decode,
+    dial,
+    dijkstra,
+    encode,
+    flood_fill,
+    grid_neighbors,
+)
+
+
+def test_bfs():
+    """Test grid distances around a wall, with and without a goal"""
+    passable = np.array(
+        [
+            [1, 1, 1],
+            [0, 0, 1],
+            [1, 1, 1],
+        ],
+        dtype=bool,
+    )
+    neighbors = grid_neighbors(passable.shape, passable)
+    dist, found = bfs([encode((0, 0), passable.shape)], neighbors, passable.size)
+    assert found is None
+    assert dist.reshape(passable.shape).tolist() == [
+        [0, 1, 2],
+        [UNREACHED, UNREACHED, 3],
+        [6, 5, 4],
+    ]
+    dist, found = bfs([0], neighbors, passable.size, goal=lambda s: s == 5)
+    assert decode(found, passable.shape) == (1, 2)
+    assert dist[found] == 3
+
+
+def test_weighted_searches_agree():
+    """Test that Dijkstra, Dial's buckets and A* find the same distances"""
+    rng = np.random.default_rng(0)
+    weights = rng.integers(1, 10, size=(12, 15))
+    steps = grid_neighbors(weights.shape)
+
+    def neighbors(state):
+        return [(n, int(weights.flat[n])) for n in steps(state)]
+
+    def heuristic(state):
+        r, c = decode(state, weights.shape)
+        return (11 - r) + (14 - c)
+
+    goal = weights.size - 1
+    full, _ = dijkstra([0], neighbors, weights.size)
+    bucketed, found = dial([0], neighbors, weights.size, 9, goal=lambda s: s == goal)
+    assert found == goal
+    assert bucketed[goal] == full[goal]
+    assert np.array_equal(dial([0], neighbors, weights.size, 9)[0], full)
+    guided, found = astar([0], neighbors, weights.size, heuristic, lambda s: s == goal)
+    assert guided[found] == full[goal]
+    assert dijkstra([0], lambda s: [], 4)[0].tolist() == [0] + [INFINITY] * 3
+
+
+def test_flood_fill():
+    """Test that a fill stops at walls and never refills marked cells"""
+    grid = np.array(
+        [
+            [0, 0, 1, 0],
+            [0, 1, 0, 0],
+            [1, 0, 0, 0],
+        ]
+    )
+    assert flood_fill(grid, (0, 0), 2) == 3
+    assert flood_fill(grid, (0, 1), 3) == 0
+    assert flood_fill(grid, (5, 5), 3) == 0
+    assert flood_fill(grid, (2, 2), 3) == 6
+    assert grid.tolist() == [[2, 2, 1, 3], [2, 1, 3, 3], [1, 3, 3, 3]]
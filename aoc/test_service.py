@@ -0,0 +1,105 @@
+"""Python test file for unit testing the asyncio solve service"""
+import json
+import socket
+import threading
+import time
+
+from .daemon import send_requests
+from .service import percentile, serve
+
+
+def test_percentile():
+    """Test nearest-rank percentiles"""
+    assert percentile([], 50) is None
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
+    assert percentile([5], 1) == 5
+
+
+def wait_for_stats(socket_path, **expected):
+    """Poll the service's stats until they show the expected values"""
+    for _ in range(300):
+        stats = send_requests([{"command": "stats"}], socket_path, timeout=30)[0]
+        if all(stats[key] == value for key, value in expected.items()):
+            return stats
+        time.sleep(0.01)
+    raise AssertionError(f"stats never reached {expected}: {stats}")
+
+
+def test_service(tmp_path):
+    """Test deadlines, rejection when full, cancellation and stats"""
+    socket_path = str(tmp_path / "aoc.sock")
+    stop = threading.Event()
+    ready = threading.Event()
+    server = threading.Thread(
+        target=serve,
+        args=(socket_path,),
+        kwargs={
+            "jobs": 1,
+            "days": [2, 14],
+            "max_pending": 1,
+            "stop": stop,
+            "ready": ready,
+        },
+    )
+    server.start()
+    try:
+        assert ready.wait(30)
+        request = {"day": 2, "part": 1, "input": "test.txt"}
+        reply = send_requests([request], socket_path, timeout=30)[0]
+        assert reply["answer"] == 8
+        assert reply["latency"] >= reply["queue_time"] >= 0
+
+        # a slow job holds the only worker and a second one fills the queue,
+        # so a third is turned away at once; the queued one is then cancelled
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(30)
+            conn.connect(socket_path)
+            with conn.makefile("rb") as reader:
+
+                def send(request):
+                    conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+                send({"day": 14, "part": 2, "id": "slow", "deadline": 1.0})
+                wait_for_stats(socket_path, running=1)
+                send(dict(request, id="queued"))
+                wait_for_stats(socket_path, queue_depth=1)
+                send(dict(request, id="rejected"))
+                assert json.loads(reader.readline()) == {
+                    "error": "overloaded: 1 jobs already queued",
+                    "rejected": True,
+                    "id": "rejected",
+                }
+                send({"command": "cancel", "id": "queued"})
+                assert json.loads(reader.readline())["cancelled"] is True
+                assert json.loads(reader.readline()) == {"ok": True}
+                reply = json.loads(reader.readline())
+        assert reply["id"] == "slow"
+        assert reply["timeout"] is True
+
+        # ids that cannot key a job, or that are already pending, get an error
+        # reply instead of breaking the connection or hiding the earlier job
+        wait_for_stats(socket_path, queue_depth=0, running=0)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(30)
+            conn.connect(socket_path)
+            lines = [dict(request, id=[1]), dict(request, id=7), dict(request, id=7)]
+            conn.sendall(b"".join(json.dumps(r).encode("utf-8") + b"\n" for r in lines))
+            with conn.makefile("rb") as reader:
+                replies = [json.loads(reader.readline()) for _ in lines]
+        errors = sorted(r["error"] for r in replies if "error" in r)
+        assert errors == [
+            "TypeError: job id must be a string or number, not [1]",
+            "ValueError: job id 7 is already pending",
+        ]
+        assert [r["answer"] for r in replies if "answer" in r] == [8]
+
+        stats = wait_for_stats(socket_path, queue_depth=0, running=0)
+        assert (stats["accepted"], stats["rejected"]) == (4, 1)
+        assert (stats["completed"], stats["timeouts"], stats["cancelled"]) == (2, 1, 1)
+        assert stats["latency"]["p50"] > 0
+        assert send_requests([{"command": "shutdown"}], socket_path) == [{"ok": True}]
+    finally:
+        stop.set()
+        server.join(30)
+    assert not (tmp_path / "aoc.sock").exists()
@@ -0,0 +1,31 @@
+"""Python test file for unit testing the shared-memory grid handoff"""
+from multiprocessing import shared_memory
+import numpy as np
+import pytest
+from .shm import attach, map_grid, release, share
+
+
+def get_row_sum(grid, row):
+    """Sum one row of a shared grid, run in a worker"""
+    return int(grid[row].sum())
+
+
+def test_share_attach():
+    """Test that views are read-only copies and released segments are unlinked"""
+    grid = np.arange(12, dtype=np.int64).reshape(3, 4)
+    handle = share(grid)
+    view = attach(handle)
+    assert np.array_equal(view, grid)
+    assert attach(handle) is view
+    with pytest.raises(ValueError):
+        view[0, 0] = 1
+    del view
+    release(handle)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle["name"])
+
+
+def test_map_grid():
+    """Test fanning tasks that read one grid out over worker processes"""
+    grid = np.arange(12, dtype=np.int64).reshape(3, 4)
+    assert map_grid(get_row_sum, grid, [2, 0, 1], jobs=2) == [38, 6, 22]
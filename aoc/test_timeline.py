@@ -0,0 +1,39 @@
+"""Python test file for unit testing the Chrome trace timeline"""
+import json
+from . import timeline
+from .runner import run_day
+
+
+def test_span(monkeypatch):
+    """Test that spans are only recorded while tracing and nest inside each other"""
+    monkeypatch.setattr(timeline, "_state", {"enabled": False, "events": []})
+    with timeline.span("ignored"):
+        pass
+    assert not timeline.drain()
+
+    monkeypatch.setenv(timeline.TRACE_ENV, "0")
+    timeline.enable()
+    with timeline.span("outer", cat="day"):
+        with timeline.span("inner", day=1):
+            pass
+    inner, outer = timeline.drain()
+    assert (inner["name"], outer["name"]) == ("inner", "outer")
+    assert inner["args"] == {"day": 1}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_run_day_trace(tmp_path, monkeypatch):
+    """Test that a traced day hands back its phases and writes a loadable file"""
+    monkeypatch.setattr(timeline, "_state", {"enabled": False, "events": []})
+    monkeypatch.setenv(timeline.TRACE_ENV, "0")
+    timeline.enable()
+    result = run_day(4, "test.txt")
+    names = [event["name"] for event in result["trace"]]
+    assert names == ["read", "parse", "part 1", "part 2", "day 4"]
+
+    path = tmp_path / "trace.json"
+    timeline.write_trace(str(path), result["trace"])
+    document = json.loads(path.read_text(encoding="utf-8"))
+    assert document["traceEvents"][0]["ph"] == "M"
+    assert len(document["traceEvents"]) == len(names) + 1
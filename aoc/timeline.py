@@ -0,0 +1,142 @@
+"""Chrome Trace Event timeline of where each worker process spent its time
+
+While tracing is on, the runner records a complete ('X') event per day and
+per read, parse and part, and solvers can nest spans for their own stages.
+Events stay in the process that recorded them until drain() hands them over,
+so pool workers send theirs back inside each day's result. Timestamps come
+from perf_counter, which is one system-wide monotonic clock on Linux, macOS
+and Windows, so spans from different workers line up. The written file opens
+in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV = "AOC_TRACE"
+
+_state = {"enabled": os.environ.get(TRACE_ENV) == "1", "events": []}
+
+
+def enable(on=True):
+    """Turn tracing on or off for this process and any it starts
+
+    Args:
+        on (bool, optional): record spans. Defaults to True.
+    """
+    _state["enabled"] = on
+    os.environ[TRACE_ENV] = "1" if on else "0"
+
+
+def enabled():
+    """Check whether spans are being recorded
+
+    Returns:
+        bool: True while tracing is on
+    """
+    return _state["enabled"]
+
+
+def now():
+    """Get the trace clock
+
+    Returns:
+        float: perf_counter seconds
+    """
+    return time.perf_counter()
+
+
+def add_span(name, start, end, cat="phase", **args):
+    """Record a finished span if tracing is on
+
+    Args:
+        name (str): span name shown in the viewer
+        start (float): now() when it began
+        end (float): now() when it ended
+        cat (str, optional): event category. Defaults to "phase".
+        **args: values shown when the span is selected
+    """
+    if not _state["enabled"]:
+        return
+    _state["events"].append(
+        {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": args,
+        }
+    )
+
+
+@contextmanager
+def span(name, cat="stage", **args):
+    """Record the time a block takes as a span, even if it raises
+
+    Args:
+        name (str): span name shown in the viewer
+        cat (str, optional): event category. Defaults to "stage".
+        **args: values shown when the span is selected
+    """
+    if not _state["enabled"]:
+        yield
+        return
+    start = now()
+    try:
+        yield
+    finally:
+        add_span(name, start, now(), cat, **args)
+
+
+def drain():
+    """Take the spans recorded in this process so far
+
+    Returns:
+        list: trace events, oldest first
+    """
+    events = _state["events"]
+    _state["events"] = []
+    return events
+
+
+def get_metadata(events):
+    """Name each process track in the viewer
+
+    Args:
+        events (list): trace events
+
+    Returns:
+        list: process_name metadata events, the calling process named 'runner'
+    """
+    pids = sorted({event["pid"] for event in events})
+    return [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "runner" if pid == os.getpid() else f"worker {pid}"},
+        }
+        for pid in pids
+    ]
+
+
+def write_trace(path, events):
+    """Write events as a Chrome Trace Event JSON file
+
+    Args:
+        path (str): output file
+        events (list): trace events from every process
+    """
+    events = sorted(events, key=lambda e: e["ts"])
+    document = {"traceEvents": get_metadata(events) + events, "displayTimeUnit": "ms"}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f)
+    logger.info("wrote %d spans to %s", len(events), path)
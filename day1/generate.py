@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 1"""
+import random
+import string
+
+DEFAULT_SIZE = 1000
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate calibration lines mixing letters, digits and spelled out digits
+
+    Args:
+        size (int, optional): number of lines. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        chunks = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            roll = rng.random()
+            if roll < 0.3:
+                chunks.append(str(rng.randint(1, 9)))
+            elif roll < 0.6:
+                chunks.append(rng.choice(WORDS))
+            else:
+                chunks.append(
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5)))
+                )
+        rng.shuffle(chunks)
+        lines.append("".join(chunks))
+    return "\n".join(lines) + "\n"
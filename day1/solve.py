@@ -1,13 +1,18 @@
 import logging
 import os
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 def get_file_data(fn='input.txt'):
-    with open(fn) as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 def get_cal_val(text):
     logger.debug(text)
@@ -20,7 +25,7 @@ def get_cal_sum(calibration_lines):
     return sum([get_cal_val(x) for x in calibration_lines])
 
 def get_cal_val_part2(text):
-    logger.debug(f"oldtext: {text}")
+    logger.debug("oldtext: %s", text)
     digits = list()
     for i in range(len(text)):
         if text[i].isdigit():
@@ -52,9 +57,10 @@ def get_cal_sum_part2(calibration_lines):
     return sum([get_cal_val_part2(x) for x in calibration_lines])
 
 def parse_data(text_data):
-    data = [line.strip() for line in text_data.strip().split('\n')]
+    data = [line.strip() for line in aoc_reader.iter_lines(text_data)]
     return data
 
+@aoc_profiling.profile_main
 def main():
     logger.setLevel(level=logging.INFO)
     data = get_file_data()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 10"""
+import random
+from aoc.shapes import NORTH, SOUTH, EAST, WEST, get_tree_squares, get_outline
+
+DEFAULT_SIZE = 140
+
+PIPES = {
+    frozenset([NORTH, SOUTH]): "|",
+    frozenset([EAST, WEST]): "-",
+    frozenset([NORTH, EAST]): "L",
+    frozenset([NORTH, WEST]): "J",
+    frozenset([SOUTH, WEST]): "7",
+    frozenset([SOUTH, EAST]): "F",
+}
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square field of pipes holding one large loop and S
+
+    Args:
+        size (int, optional): side length of the field. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    size = max(size, 5)
+    coarse = (size - 1) // 4
+    links = get_outline(get_tree_squares(rng, coarse, coarse))
+
+    # unused tiles hold junk pipes and ground, like the real puzzle
+    grid = [[rng.choice("|-LJ7F...") for _ in range(size)] for _ in range(size)]
+    for (r, c), dirs in links.items():
+        grid[r][c] = PIPES[frozenset(dirs)]
+
+    start = rng.choice(sorted(links))
+    grid[start[0]][start[1]] = "S"
+    # ground around S keeps junk pipes from looking connected to it
+    for dr, dc in (NORTH, SOUTH, EAST, WEST):
+        r, c = start[0] + dr, start[1] + dc
+        if 0 <= r < size and 0 <= c < size and (r, c) not in links:
+            grid[r][c] = "."
+    return "\n".join("".join(row) for row in grid) + "\n"
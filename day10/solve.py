@@ -4,41 +4,41 @@
 import os
 import logging
 import sys
-import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
-logger = logging.getLogger(__name__)
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+from aoc import search as aoc_search  # pylint: disable=wrong-import-position
 
-sys.setrecursionlimit(2000)
+logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
-
-
-def parse_char(char):
-    """Translate ASCII art pipe into coordinate delta for each end of pipe
-
-    Args:
-        char (str): ASCII char
-
-    Returns:
-        list: None, [], or tuple pairs of coordinate offsets representing the pipe
-    """
-    lookup = {
-        "S": [],
-        "|": [(-1, 0), (1, 0)],
-        "-": [(0, -1), (0, 1)],
-        "L": [(-1, 0), (0, 1)],
-        "J": [(-1, 0), (0, -1)],
-        "7": [(0, -1), (1, 0)],
-        "F": [(1, 0), (0, 1)],
-        ".": None,
-    }
-    return lookup[char]
+    return aoc_reader.read_input(fn)
+
+
+# grid codes for each tile character, and the pipe each code stands for as the
+# coordinate offsets of its two ends (None for ground, [] for the start)
+TILE_CODES = {".": 0, "S": 1, "|": 2, "-": 3, "L": 4, "J": 5, "7": 6, "F": 7}
+GROUND = TILE_CODES["."]
+START = TILE_CODES["S"]
+PIPES = [
+    None,
+    [],
+    [(-1, 0), (1, 0)],
+    [(0, -1), (0, 1)],
+    [(-1, 0), (0, 1)],
+    [(-1, 0), (0, -1)],
+    [(0, -1), (1, 0)],
+    [(1, 0), (0, 1)],
+]
+TILE_LOOKUP = aoc_grid.make_lookup(TILE_CODES)
 
 
 def get_side_tiles(entrance_vector, pipe_info):
@@ -114,38 +114,6 @@ def get_side_tiles(entrance_vector, pipe_info):
     return None
 
 
-def mark_adjacent_ground_tiles(grid, p, value):
-    """mark tile and everything around it
-
-    Args:
-        grid (np.ndarray): matrix the size of data representing knowledge about the tile
-        p (tuple): coordinates of point
-        value (int): value to make the point and surrounding points
-    """
-    # make sure the point is valid
-    if 0 <= p[0] < grid.shape[0] and 0 <= p[1] < grid.shape[1]:
-        # if unmarked, mark it and try to mark everything around it
-        if grid[p] == 0 or grid[p] == 1:
-            grid[p] = value
-            if p[0] != 0:  # not top row
-                mark_adjacent_ground_tiles(grid, (p[0] - 1, p[1]), value)
-            if p[0] != (grid.shape[0] - 1):  # not bottom row
-                mark_adjacent_ground_tiles(grid, (p[0] + 1, p[1]), value)
-            if p[1] != 0:  # not leftmost column
-                mark_adjacent_ground_tiles(grid, (p[0], p[1] - 1), value)
-            if p[1] != (grid.shape[1] - 1):
-                mark_adjacent_ground_tiles(grid, (p[0], p[1] + 1), value)
-
-
-def parse_line(text_line):
-    """Parses single line of text from the input file
-
-    Args:
-        text_line (str): raw text line from input file
-    """
-    return [parse_char(c) for c in list(text_line.strip())]
-
-
 def parse_data(text_data):
     """Parses full data input
 
@@ -155,68 +123,68 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
+    return aoc_grid.to_grid(text_data, TILE_LOOKUP)
 
-    return data
 
-
-def function(data):
-    """Complete Part 1 work
+def get_start_pipe(data, start):
+    """Work out the pipe hidden under S from the pipes leading into it
 
     Args:
-        data (list): list of parsed input objects/dictionaries
+        data (np.ndarray): grid of tile codes
+        start (tuple): coordinates of S
 
     Returns:
-        int: answer to Part 1 question
+        list: offsets to the tiles S is connected to
     """
-    # find S
-    start = None
-    for r, row in enumerate(data):
-        for c, entry in enumerate(row):
-            if entry == []:
-                start = (r, c)
-                break
-        if start:
-            break
-
     # get connected starting directions from S, by looking at all surrounding
     # cells and seeing which of them have pipes leading to S
     possibilites = [(-1, 0), (0, 1), (1, 0), (0, -1)]
     if start[0] == 0:
         possibilites.remove((-1, 0))
-    if start[0] == len(data) - 1:
+    if start[0] == data.shape[0] - 1:
         possibilites.remove((1, 0))
     if start[1] == 0:
         possibilites.remove((0, -1))
-    if start[1] == len(data[0]) - 1:
+    if start[1] == data.shape[1] - 1:
         possibilites.remove((0, 1))
 
     logger.debug(start)
     logger.debug(possibilites)
 
-    # populate start's connections/pipe
+    start_pipe = []
     for o in possibilites:
         # check if the possibility has a pipe connection to S
-        p_data = data[start[0] + o[0]][start[1] + o[1]]
+        p_data = PIPES[data[start[0] + o[0], start[1] + o[1]]]
         backward_check = (o[0] * -1, o[1] * -1)
         if p_data is None:
             continue
         if backward_check in p_data:
-            # add pipe connection to S
-            data[start[0]][start[1]].append(o)
+            start_pipe.append(o)
+
+    logger.debug(start_pipe)
+    return start_pipe
 
-    logger.debug(data[start[0]][start[1]])
+
+def function(data):
+    """Complete Part 1 work
+
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 1 question
+    """
+    start = aoc_grid.find(data, START)
+    start_pipe = get_start_pipe(data, start)
 
     # pick first pipe connection from S to begin counting
     step_count = 1
     last_point = start
-    last_offset = data[start[0]][start[1]][0]
+    last_offset = start_pipe[0]
     cur_point = (last_point[0] + last_offset[0], last_point[1] + last_offset[1])
     while cur_point != start:
         # get first next_point option
-        p1, p2 = data[cur_point[0]][cur_point[1]]
+        p1, p2 = PIPES[data[cur_point]]
         o = p1
         backward_check = (o[0] * -1, o[1] * -1)
         if backward_check == last_offset:
@@ -240,43 +208,8 @@ def get_enclosed_tile_count(data):
     Returns:
         int: answer to Part 2 question
     """
-    # find S
-    start = None
-    for r, row in enumerate(data):
-        for c, entry in enumerate(row):
-            if entry == []:
-                start = (r, c)
-                break
-        if start:
-            break
-
-    # get connected starting directions from S, by looking at all surrounding
-    # cells and seeing which of them have pipes leading to S
-    possibilites = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-    if start[0] == 0:
-        possibilites.remove((-1, 0))
-    if start[0] == len(data) - 1:
-        possibilites.remove((1, 0))
-    if start[1] == 0:
-        possibilites.remove((0, -1))
-    if start[1] == len(data[0]) - 1:
-        possibilites.remove((0, 1))
-
-    logger.debug(start)
-    logger.debug(possibilites)
-
-    # populate start's connections/pipe
-    for o in possibilites:
-        # check if the possibility has a pipe connection to S
-        p_data = data[start[0] + o[0]][start[1] + o[1]]
-        backward_check = (o[0] * -1, o[1] * -1)
-        if p_data is None:
-            continue
-        if backward_check in p_data:
-            # add pipe connection to S
-            data[start[0]][start[1]].append(o)
-
-    logger.debug(data[start[0]][start[1]])
+    start = aoc_grid.find(data, START)
+    start_pipe = get_start_pipe(data, start)
 
     # used a new grid of the right size to figure out and track inside vs. outside
     # 0 = unknown
@@ -284,21 +217,17 @@ def get_enclosed_tile_count(data):
     # 2 = lefthand ground tile
     # 3 = righthand ground tile
     # 4 = loop path pipe
-    grid = np.zeros((len(data), len(data[0])), dtype=int)
-    for r, row in enumerate(data):
-        for c, entry in enumerate(row):
-            if entry is not None:
-                grid[r, c] = 1
+    grid = (data != GROUND).astype(int)
 
     # first, run the circuit to mark the loop pipe
     last_point = start
-    last_offset = data[start[0]][start[1]][0]
+    last_offset = start_pipe[0]
     cur_point = (last_point[0] + last_offset[0], last_point[1] + last_offset[1])
     while cur_point != start:
         grid[cur_point] = 4
 
         # get first next_point option
-        p1, p2 = data[cur_point[0]][cur_point[1]]
+        p1, p2 = PIPES[data[cur_point]]
         o = p1
         backward_check = (o[0] * -1, o[1] * -1)
         if backward_check == last_offset:
@@ -311,13 +240,13 @@ def get_enclosed_tile_count(data):
 
     # figure out whether left or right is the inside in the direction of propagation
     last_point = start
-    last_offset = data[start[0]][start[1]][0]
+    last_offset = start_pipe[0]
     cur_point = (last_point[0] + last_offset[0], last_point[1] + last_offset[1])
     grid[last_point] = 4
     turn_count = 0
     while cur_point != start:
         # get first next_point option
-        p1, p2 = data[cur_point[0]][cur_point[1]]
+        p1, p2 = PIPES[data[cur_point]]
         o = p1
         backward_check = (o[0] * -1, o[1] * -1)
         if backward_check == last_offset:
@@ -327,20 +256,20 @@ def get_enclosed_tile_count(data):
         side_tiles = get_side_tiles(last_offset, [p1, p2])
         turn_count += side_tiles["turn"]
 
-        # mark all connected lefthand and righthand tiles
+        # mark all connected lefthand and righthand tiles that are not on the loop
         for offset in side_tiles["left"]:
             p = (cur_point[0] + offset[0], cur_point[1] + offset[1])
-            mark_adjacent_ground_tiles(grid, p, 2)
+            aoc_search.flood_fill(grid, p, 2, fillable=(0, 1))
         for offset in side_tiles["right"]:
             p = (cur_point[0] + offset[0], cur_point[1] + offset[1])
-            mark_adjacent_ground_tiles(grid, p, 3)
+            aoc_search.flood_fill(grid, p, 3, fillable=(0, 1))
 
         # progress step
         last_point = cur_point
         last_offset = o
         cur_point = (cur_point[0] + o[0], cur_point[1] + o[1])
 
-    np.savetxt("grid.txt", grid, fmt="%d")
+    aoc_artifacts.write_grid("day10-sides.txt", grid)
     # analyze grid to see whether left or right is the 'inside' side
     if turn_count > 0:  # more righthand turns... righthand is inside
         logger.debug("inside is the righthand side")
@@ -351,6 +280,52 @@ def get_enclosed_tile_count(data):
     return (grid == 2).sum()
 
 
+def get_loop_points(data):
+    """Walk the pipe loop from S back to itself
+
+    Args:
+        data (np.ndarray): grid of tile codes
+
+    Returns:
+        list: (row, col) of every loop tile in walking order, starting at S
+    """
+    start = aoc_grid.find(data, START)
+    last_offset = get_start_pipe(data, start)[0]
+    points = [start]
+    cur_point = (start[0] + last_offset[0], start[1] + last_offset[1])
+    while cur_point != start:
+        points.append(cur_point)
+        p1, p2 = PIPES[data[cur_point]]
+        o = p2 if (-p1[0], -p1[1]) == last_offset else p1
+        last_offset = o
+        cur_point = (cur_point[0] + o[0], cur_point[1] + o[1])
+    return points
+
+
+def get_enclosed_tile_count_shoelace(data):
+    """Complete Part 2 work from the loop's area
+
+    The shoelace formula gives the area inside the loop's tile centres, and
+    Pick's theorem (area = inside + boundary / 2 - 1) turns it into the
+    number of enclosed tiles, without marking any grid.
+
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 2 question
+    """
+    points = get_loop_points(data)
+    twice_area = abs(
+        sum(
+            r1 * c2 - r2 * c1
+            for (r1, c1), (r2, c2) in zip(points, points[1:] + points[:1])
+        )
+    )
+    return twice_area // 2 - len(points) // 2 + 1
+
+
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -358,8 +333,7 @@ def main():
     data = parse_data(text_data)
     answer = function(data)
     print(f"Day 10: Part 1: Find Step Count For Furthest Away Pipe: {answer}")
-    data = parse_data(text_data)
-    answer2 = get_enclosed_tile_count(data)
+    answer2 = get_enclosed_tile_count_shoelace(data)
     print(f"Day 10: Part 2: Find Number of Tiles Enclosed by Pipe Loop: {answer2}")
 
 
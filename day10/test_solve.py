@@ -1,7 +1,13 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
 import pytest
-from .solve import parse_data, function, get_enclosed_tile_count
+from .solve import (
+    parse_data,
+    function,
+    get_enclosed_tile_count,
+    get_enclosed_tile_count_shoelace,
+    START,
+)
 
 
 @pytest.fixture(name="test_data")
@@ -68,7 +74,7 @@ def test_parse_input(test_data):
     data = parse_data(test_data)
     assert len(data) == 5
     assert len(data[0]) == 5
-    assert data[2][0] == []
+    assert data[2][0] == START
 
 
 def test_all(test_data, test_data2, test_data3, test_data4):
@@ -82,9 +88,12 @@ def test_all(test_data, test_data2, test_data3, test_data4):
 
     data = parse_data(test_data2)
     assert get_enclosed_tile_count(data) == 4
+    assert get_enclosed_tile_count_shoelace(data) == 4
 
     data = parse_data(test_data3)
     assert get_enclosed_tile_count(data) == 8
+    assert get_enclosed_tile_count_shoelace(data) == 8
 
     data = parse_data(test_data4)
     assert get_enclosed_tile_count(data) == 10
+    assert get_enclosed_tile_count_shoelace(data) == 10
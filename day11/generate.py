@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 11"""
+import random
+
+DEFAULT_SIZE = 140
+
+DENSITY = 0.02
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square galaxy image with some empty rows and columns
+
+    Args:
+        size (int, optional): side length of the image. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    empty_rows = set(rng.sample(range(size), size // 15))
+    empty_cols = set(rng.sample(range(size), size // 15))
+    lines = []
+    for r in range(size):
+        lines.append(
+            "".join(
+                (
+                    "#"
+                    if r not in empty_rows
+                    and c not in empty_cols
+                    and rng.random() < DENSITY
+                    else "."
+                )
+                for c in range(size)
+            )
+        )
+    return "\n".join(lines) + "\n"
@@ -3,27 +3,28 @@
 """Python solver file for Advent of Code Day 11"""
 import os
 import logging
+import sys
 import itertools
 import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
-
+    return aoc_reader.read_input(fn)
 
-def parse_line(text_line):
-    """Parses single line of text from the input file
 
-    Args:
-        text_line (str): raw text line from input file
-    """
-    return [c == "#" for c in list(text_line)]
+GALAXY_LOOKUP = aoc_grid.make_lookup({"#": True}, dtype=bool)
 
 
 def parse_data(text_data):
@@ -35,10 +36,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
-    galaxies = np.array(data)
+    galaxies = aoc_grid.to_grid(text_data, GALAXY_LOOKUP)
     # logger.debug(galaxies)
     # logger.debug(galaxies.shape)
     return galaxies
@@ -58,9 +56,11 @@ def get_sum_galaxy_distances(data):
         if (data[r, :]).sum() == 0:
             data = np.insert(data, r, False, axis=0)
 
+    records = aoc_artifacts.records(logger)
     for c in range(data.shape[1] - 1, -1, -1):
         if (data[:, c]).sum() == 0:
-            logger.debug("inserting at column %d", c)
+            if records:
+                logger.debug("inserting at column %d", c)
             data = np.insert(data, c, False, axis=1)
 
     pairs = itertools.combinations(np.argwhere(data == True), 2)
@@ -93,11 +93,13 @@ def get_sum_galaxy_distances_multiple(data, expansion_mult=1000000):
 
     galaxy_indices = np.argwhere(data == True)
     expanded_galaxy_indices = list()
+    records = aoc_artifacts.records(logger)
     for i in galaxy_indices:
         r, c = i
         new_r = r + ((expansion_rows < r).sum() * (expansion_mult - 1))
         new_c = c + ((expansion_cols < c).sum() * (expansion_mult - 1))
-        logger.debug("%s became %s", i, (new_r, new_c))
+        if records:
+            logger.debug("%s became %s", i, (new_r, new_c))
         expanded_galaxy_indices.append((new_r, new_c))
 
     pairs = itertools.combinations(expanded_galaxy_indices, 2)
@@ -106,6 +108,7 @@ def get_sum_galaxy_distances_multiple(data, expansion_mult=1000000):
     return sum(distances)
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 12"""
+import random
+
+DEFAULT_SIZE = 1000
+
+MAX_LENGTH = 20
+
+
+def generate_row(rng):
+    """Generate one spring row from a hidden valid arrangement
+
+    Args:
+        rng (random.Random): random source
+
+    Returns:
+        str: springs with unknowns and their damaged group sizes
+    """
+    groups = []
+    length = -1
+    while True:
+        g = rng.randint(1, 5)
+        if length + g + 1 > MAX_LENGTH - 1 or (groups and rng.random() < 0.2):
+            break
+        groups.append(g)
+        length += g + 1
+    if not groups:
+        groups = [1]
+        length = 1
+    # spread the spare operational springs over the gaps between groups
+    gaps = [0] + [1] * (len(groups) - 1) + [0]
+    for _ in range(rng.randint(0, MAX_LENGTH - length)):
+        gaps[rng.randrange(len(gaps))] += 1
+    springs = "." * gaps[0]
+    for g, gap in zip(groups, gaps[1:]):
+        springs += "#" * g + "." * gap
+    springs = "".join("?" if rng.random() < 0.55 else c for c in springs)
+    return f"{springs} {','.join(str(g) for g in groups)}"
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate rows of hot springs with damaged group records
+
+    Args:
+        size (int, optional): number of rows. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    return "\n".join(generate_row(rng) for _ in range(size)) + "\n"
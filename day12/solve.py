@@ -3,16 +3,25 @@
 """Python solver file for Advent of Code Day 12"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import checkpoint as aoc_checkpoint  # pylint: disable=wrong-import-position
+from aoc import counters as aoc_counters  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import progress as aoc_progress  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -36,9 +45,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
+    data = [parse_line(line.strip()) for line in aoc_reader.iter_lines(text_data)]
     return data
 
 
@@ -52,6 +59,8 @@ def get_count_arrangements(arg_springs: list, arg_groupings: list):
     arg_entry = (tuple(arg_springs), tuple(arg_groupings))
     work_queue = [arg_entry]
     results = {}
+    records = aoc_artifacts.records(logger)
+    memo_hits = memo_misses = 0
     # completed = 0
     while len(work_queue) != 0:
         # completed += 1
@@ -63,6 +72,7 @@ def get_count_arrangements(arg_springs: list, arg_groupings: list):
             results[r_entry] = {"status": "open"}
 
         if results[r_entry]["status"] == "complete":
+            memo_hits += 1
             continue
 
         if results[r_entry]["status"] == "pending":
@@ -70,6 +80,7 @@ def get_count_arrangements(arg_springs: list, arg_groupings: list):
             result_count = 0
             for entry in results[r_entry]["data"]:
                 if entry in results and results[entry]["status"] == "complete":
+                    memo_hits += 1
                     result_count += results[entry]["data"]
                 else:
                     check = False
@@ -85,7 +96,9 @@ def get_count_arrangements(arg_springs: list, arg_groupings: list):
             work_queue.insert(0, r_entry)
             continue
 
-        logger.debug("attempting %s", (springs, groupings))
+        memo_misses += 1
+        if records:
+            logger.debug("attempting %s", (springs, groupings))
         if groupings == tuple():
             results[r_entry]["status"] = "complete"
             if springs.count("#") == 0:
@@ -141,6 +154,8 @@ def get_count_arrangements(arg_springs: list, arg_groupings: list):
             work_queue.append(opt)
             continue
     logger.debug(results[arg_entry])
+    aoc_counters.add("memo_hits", memo_hits)
+    aoc_counters.add("memo_misses", memo_misses)
     return results[arg_entry]["data"]
 
 
@@ -153,7 +168,13 @@ def get_sum_arrangements(data):
     Returns:
         int: answer to Part 1 question
     """
-    return sum([get_count_arrangements(*x) for x in data])
+    start, total = aoc_checkpoint.load("rows", (0, 0))
+    for i in range(start, len(data)):
+        springs, groupings = data[i]
+        total += get_count_arrangements(springs, groupings)
+        aoc_checkpoint.save("rows", (i + 1, total))
+        aoc_progress.report(i + 1, len(data))
+    return total
 
 
 def get_expanded_sum_arrangements(data):
@@ -170,14 +191,84 @@ def get_expanded_sum_arrangements(data):
     return get_sum_arrangements(new_data)
 
 
+def count_arrangements(springs, groupings):
+    """Count the arrangements of a row with a table over positions and groups
+
+    ways[i][j] holds the arrangements of springs[i:] using groupings[j:], so
+    each (position, group) pair is worked out once instead of exploring every
+    '?' choice through a work queue.
+
+    Args:
+        springs (list): list of springs in order
+        groupings (list): list of groupings in order
+
+    Returns:
+        int: number of possible arrangements
+    """
+    # a trailing '.' means every group is followed by an operational spring
+    springs = "".join(springs) + "."
+    n, m = len(springs), len(groupings)
+    # run[i]: springs from i on that could all be damaged
+    run = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        run[i] = run[i + 1] + 1 if springs[i] != "." else 0
+
+    ways = [[0] * (m + 1) for _ in range(n + 1)]
+    ways[n][m] = 1
+    for i in range(n - 1, -1, -1):
+        row, below = ways[i], ways[i + 1]
+        spring = springs[i]
+        for j in range(m + 1):
+            count = below[j] if spring != "#" else 0
+            if spring != "." and j < m:
+                g = groupings[j]
+                if run[i] >= g and springs[i + g] != "#":
+                    count += ways[i + g + 1][j + 1]
+            row[j] = count
+    aoc_counters.add("table_cells", n * (m + 1))
+    return ways[0][0]
+
+
+def get_sum_arrangements_dp(data):
+    """Complete Part 1 work with the arrangement table
+
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 1 question
+    """
+    start, total = aoc_checkpoint.load("rows", (0, 0))
+    for i in range(start, len(data)):
+        springs, groupings = data[i]
+        total += count_arrangements(springs, groupings)
+        aoc_checkpoint.save("rows", (i + 1, total))
+        aoc_progress.report(i + 1, len(data))
+    return total
+
+
+def get_expanded_sum_arrangements_dp(data):
+    """Complete Part 2 work with the arrangement table
+
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 2 question
+    """
+    new_data = [(list("?".join(["".join(s)] * 5)), g * 5) for s, g in data]
+    return get_sum_arrangements_dp(new_data)
+
+
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
     text_data = get_file_data()
     data = parse_data(text_data)
-    answer = get_sum_arrangements(data)
+    answer = get_sum_arrangements_dp(data)
     print(f"Day 12: Part 1: Hot Springs Damaged Arrangements: {answer}")
-    answer2 = get_expanded_sum_arrangements(data)
+    answer2 = get_expanded_sum_arrangements_dp(data)
     print(f"Day 12: Part 2: Hot Springs Damaged Arrangements: {answer2}")
 
 
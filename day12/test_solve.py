@@ -1,7 +1,14 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
 import pytest
-from .solve import parse_data, get_sum_arrangements, get_expanded_sum_arrangements
+from .solve import (
+    parse_data,
+    count_arrangements,
+    get_sum_arrangements,
+    get_expanded_sum_arrangements,
+    get_sum_arrangements_dp,
+    get_expanded_sum_arrangements_dp,
+)
 
 
 @pytest.fixture(name="test_data")
@@ -50,3 +57,6 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_sum_arrangements(data) == 21
     assert get_expanded_sum_arrangements(data) == 525152
+    assert get_sum_arrangements_dp(data) == 21
+    assert get_expanded_sum_arrangements_dp(data) == 525152
+    assert count_arrangements(list("?###????????"), [3, 2, 1]) == 10
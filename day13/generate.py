@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 13"""
+import random
+
+DEFAULT_SIZE = 100
+
+
+def get_mismatch_counts(rows):
+    """Count differing cells across every horizontal reflection line
+
+    Args:
+        rows (list): pattern rows as lists of '#'/'.' chars
+
+    Returns:
+        list: mismatch count for the lines above rows 1..n-1
+    """
+    counts = []
+    for line in range(1, len(rows)):
+        size = min(line, len(rows) - line)
+        counts.append(
+            sum(
+                a != b
+                for k in range(size)
+                for a, b in zip(rows[line - 1 - k], rows[line + k])
+            )
+        )
+    return counts
+
+
+def is_valid(rows):
+    """Check a pattern has exactly one perfect and exactly one smudged line
+
+    Args:
+        rows (list): pattern rows as lists of '#'/'.' chars
+
+    Returns:
+        bool: True if the pattern works for both parts
+    """
+    counts = get_mismatch_counts(rows) + get_mismatch_counts(
+        [list(col) for col in zip(*rows)]
+    )
+    return counts.count(0) == 1 and counts.count(1) == 1
+
+
+def generate_pattern(rng):
+    """Generate a pattern with a perfect reflection and a one-smudge reflection
+
+    The two reflections cover separate rows at opposite ends of the pattern,
+    so mirroring one never disturbs the other.
+
+    Args:
+        rng (random.Random): random source
+
+    Returns:
+        list: pattern rows as lists of '#'/'.' chars
+    """
+    while True:
+        # real patterns always have odd sides, which the solver relies on
+        n_rows = rng.choice(range(7, 18, 2))
+        n_cols = rng.choice(range(7, 18, 2))
+        rows = [rng.choices("#.", k=n_cols) for _ in range(n_rows)]
+        smudged = rng.randint(1, (n_rows - 2) // 2)
+        perfect = rng.randint(1, (n_rows - 2 * smudged) // 2)
+        for k in range(smudged):
+            rows[smudged + k] = list(rows[smudged - 1 - k])
+        for k in range(perfect):
+            rows[n_rows - perfect + k] = list(rows[n_rows - perfect - 1 - k])
+        r = rng.randrange(2 * smudged)
+        c = rng.randrange(n_cols)
+        rows[r][c] = "#" if rows[r][c] == "." else "."
+        if rng.random() < 0.5:
+            rows.reverse()
+        if rng.random() < 0.5:
+            rows = [list(col) for col in zip(*rows)]
+        if is_valid(rows):
+            return rows
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate blank line separated patterns of ash and rocks
+
+    Args:
+        size (int, optional): number of patterns. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    patterns = [generate_pattern(rng) for _ in range(size)]
+    return "\n\n".join("\n".join("".join(r) for r in p) for p in patterns) + "\n"
@@ -3,42 +3,28 @@
 """Python solver file for Advent of Code Day 13"""
 import os
 import logging
+import sys
 import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import counters as aoc_counters  # pylint: disable=wrong-import-position
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
-
-
-def parse_line(text_line):
-    """Parses single line of text from the input file
-
-    Args:
-        text_line (str): raw text line from input file
-    """
-    return [c == "#" for c in list(text_line.strip())]
+    return aoc_reader.read_input(fn)
 
 
-def parse_pattern(text_pattern):
-    """Parses a text blob representing a pattern
-
-    Args:
-        text_pattern (str): multiline ASCII grid
-
-    Returns:
-        ndarray: grid of True/False value for where the '#' chars are
-    """
-    data = [
-        parse_line(line.strip())
-        for line in text_pattern.strip().strip("\n").split("\n")
-    ]
-    return np.array(data)
+ROCK_LOOKUP = aoc_grid.make_lookup({"#": True}, dtype=bool)
 
 
 def parse_data(text_data):
@@ -50,11 +36,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    patterns = [
-        parse_pattern(blob.strip().strip("\n"))
-        for blob in text_data.strip().strip("\n").split("\n\n")
-    ]
-    return patterns
+    return aoc_grid.split_grids(text_data, ROCK_LOOKUP)
 
 
 def get_reflections(pattern):
@@ -129,6 +111,8 @@ def summarize_smudged_reflection_lines(patterns):
     """
     row_count = 0
     col_count = 0
+    flipped = 0
+    records = aoc_artifacts.records(logger)
     for pattern in patterns:
         # get baseline data
         b_rows, b_cols = get_reflections(pattern)
@@ -140,8 +124,10 @@ def summarize_smudged_reflection_lines(patterns):
         for (r_i, c_i), old_val in np.ndenumerate(p):
             if found_new:
                 break
-            logger.debug("r_i: %s, c_i: %s, old_val: %s", r_i, c_i, old_val)
+            if records:
+                logger.debug("r_i: %s, c_i: %s, old_val: %s", r_i, c_i, old_val)
             p[r_i, c_i] = not old_val
+            flipped += 1
             check_rows, check_cols = get_reflections(p)
             p[r_i, c_i] = old_val
             for check_row in check_rows:
@@ -153,9 +139,11 @@ def summarize_smudged_reflection_lines(patterns):
                     found_new = True
                     col_count += check_col
 
+    aoc_counters.add("cells_flipped", flipped)
     return row_count * 100 + col_count
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
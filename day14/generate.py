@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 14"""
+import random
+
+DEFAULT_SIZE = 100
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square platform of round rocks, cube rocks and empty space
+
+    Args:
+        size (int, optional): side length of the platform. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = [
+        "".join(rng.choices("O#.", weights=(20, 18, 62), k=size)) for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
@@ -3,27 +3,28 @@
 """Python solver file for Advent of Code Day 14"""
 import os
 import logging
+import sys
 import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import cycles as aoc_cycles  # pylint: disable=wrong-import-position
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
-def parse_line(text_line):
-    """Parses single line of text from the input file
-
-    Args:
-        text_line (str): raw text line from input file
-    """
-    lookup = {"O": 2, "#": 1, ".": 0}
-    return [lookup[x] for x in list(text_line)]
+# round rocks are 2, cube rocks 1 and empty spaces 0
+ROCK_LOOKUP = aoc_grid.make_lookup({"O": 2, "#": 1, ".": 0})
 
 
 def parse_data(text_data):
@@ -35,10 +36,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
-    return np.array(data)
+    return aoc_grid.to_grid(text_data, ROCK_LOOKUP)
 
 
 def get_load_after_north_tilt(platform):
@@ -160,31 +158,18 @@ def get_load_after_spin_cycles(platform, cycles=1000000000):
     Returns:
         int: answer to Part 2 question
     """
-    init_qty = 500
-    platform = platform.copy()
-
-    # find pattern
-    loads = []
-    i = 0
-    no_found_repeat = True
-    while len(loads) < init_qty and no_found_repeat:
-        i_load = get_load(platform)
-        logger.debug("load after %d cycles: %d", i, i_load)
-        loads.append(i_load)
-        i += 1
-        platform = run_spin_cycle(platform)
-
-    # find cycle length
-    i = 100
-    while loads[-i:] != loads[-i * 2 : -i]:
-        i += 1
-
-    # at this point, we know the end of the pattern works in multiples of i
-    repeat_end = loads[-i:]
-    end_value = repeat_end[(cycles - init_qty) % i]
-    return end_value
-
-
+    # the platform settles into a loop well before the cycle count, so only
+    # simulate until a layout repeats
+    _, _, platform = aoc_cycles.find_cycle(
+        lambda p: run_spin_cycle(p.copy()),
+        platform,
+        cycles,
+        key=lambda p: p.tobytes(),
+    )
+    return get_load(platform)
+
+
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 15"""
+import random
+import string
+
+DEFAULT_SIZE = 4000
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a comma separated initialization sequence of lens steps
+
+    Args:
+        size (int, optional): number of steps. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(size // 6, 1))
+    ]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 0.35:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
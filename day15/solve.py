@@ -3,16 +3,21 @@
 """Python solver file for Advent of Code Day 15"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -34,8 +39,7 @@ def parse_data(text_data):
         _type_: parsed input data ready for processing
     """
     steps = [
-        list(text_step.strip())
-        for text_step in text_data.strip().strip("\n").split(",")
+        list(text_step.strip()) for text_step in aoc_reader.iter_split(text_data, ",")
     ]
     return steps
 
@@ -125,6 +129,7 @@ def function2(steps):
     return total
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
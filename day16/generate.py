@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 16"""
+import random
+
+DEFAULT_SIZE = 110
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square contraption of mirrors, splitters and empty space
+
+    Args:
+        size (int, optional): side length of the contraption. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = [
+        "".join(rng.choices(".\\/|-", weights=(90, 2.5, 2.5, 2.5, 2.5), k=size))
+        for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
@@ -3,26 +3,45 @@
 """Python solver file for Advent of Code Day 16"""
 import os
 import logging
+import sys
 import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import checkpoint as aoc_checkpoint  # pylint: disable=wrong-import-position
+from aoc import counters as aoc_counters  # pylint: disable=wrong-import-position
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import progress as aoc_progress  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+from aoc import shm as aoc_shm  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
-
-
-def parse_line(text_line):
-    """Parses single line of text from the input file
-
-    Args:
-        text_line (str): raw text line from input file
-    """
-    return list(text_line)
+    return aoc_reader.read_input(fn)
+
+
+# tile codes for the . / \ | and - characters
+EMPTY = 0
+MIRROR = 1
+BACK_MIRROR = 2
+SPLIT_VERTICAL = 3
+SPLIT_HORIZONTAL = 4
+TILE_LOOKUP = aoc_grid.make_lookup(
+    {
+        ".": EMPTY,
+        "/": MIRROR,
+        "\\": BACK_MIRROR,
+        "|": SPLIT_VERTICAL,
+        "-": SPLIT_HORIZONTAL,
+    }
+)
 
 
 def parse_data(text_data):
@@ -34,10 +53,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
-    return np.array(data, dtype=str)
+    return aoc_grid.to_grid(text_data, TILE_LOOKUP)
 
 
 def get_energized_sum(data: np.array, init=(0, 0, (0, 1))):
@@ -52,39 +68,46 @@ def get_energized_sum(data: np.array, init=(0, 0, (0, 1))):
     energized_grid = np.zeros(data.shape, dtype=bool)
     energizing_queue = [init]
     done_flows = []
+    flows = steps = 0
+    records = aoc_artifacts.records(logger)
     while energizing_queue:
         flow = energizing_queue.pop()
-        logger.debug("starting %s", flow)
+        if records:
+            logger.debug("starting %s", flow)
         if flow in done_flows:
             continue
         r, c, d = flow
+        flows += 1
         while True:
             # evaluate space
             if r < 0 or r >= data.shape[0] or c < 0 or c >= data.shape[1]:
                 done_flows.append(flow)
                 break
             energized_grid[r, c] = True
+            steps += 1
             val = data[r, c]
             # dots, or entering ends of | or -
-            if val == ".":
+            if val == EMPTY:
                 r += d[0]
                 c += d[1]
-            elif (val == "-" and d[0] == 0) or (val == "|" and d[1] == 0):
+            elif (val == SPLIT_HORIZONTAL and d[0] == 0) or (
+                val == SPLIT_VERTICAL and d[1] == 0
+            ):
                 # call this flow done, and start a new one
                 done_flows.append(flow)
                 energizing_queue.append((r + d[0], c + d[1], d))
                 break
-            elif val == "/":
+            elif val == MIRROR:
                 done_flows.append(flow)
                 d = (-d[1], -d[0])  # 90 degree turn
                 energizing_queue.append((r + d[0], c + d[1], d))
                 break
-            elif val == "\\":
+            elif val == BACK_MIRROR:
                 done_flows.append(flow)
                 d = (d[1], d[0])
                 energizing_queue.append((r + d[0], c + d[1], d))
                 break
-            elif val == "|" or val == "-":
+            elif val == SPLIT_VERTICAL or val == SPLIT_HORIZONTAL:
                 done_flows.append(flow)
                 d1 = (d[1], d[0])
                 d2 = (-d[1], -d[0])
@@ -92,17 +115,19 @@ def get_energized_sum(data: np.array, init=(0, 0, (0, 1))):
                 energizing_queue.append((r + d2[0], c + d2[1], d2))
                 break
 
+    aoc_counters.add("flows", flows)
+    aoc_counters.add("cells_stepped", steps)
     return np.sum(energized_grid)
 
 
-def check_all_entrances_for_max(data):
-    """Complete Part 2 work
+def get_all_entrances(data):
+    """List every beam entering the grid from its edges
 
     Args:
-        data (list): list of parsed input objects/dictionaries
+        data (np.array): parsed tile grid
 
     Returns:
-        int: answer to Part 2 question
+        list: (row, col, direction) starting flows
     """
     # craft initial vectors
     from_left = [(r, 0, (0, 1)) for r in range(data.shape[0])]
@@ -113,16 +138,48 @@ def check_all_entrances_for_max(data):
     from_bottom = [
         (data.shape[0] - 1, c, (-1, 0)) for c in range(data.shape[1] - 1, -1, -1)
     ]
-    all_entrances = from_left + from_top + from_right + from_bottom
+    return from_left + from_top + from_right + from_bottom
+
+
+def check_all_entrances_for_max(data):
+    """Complete Part 2 work
 
-    max_tiles = 0
-    for entrance in all_entrances:
-        tiles = get_energized_sum(data, entrance)
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 2 question
+    """
+    entrances = get_all_entrances(data)
+    start, max_tiles = aoc_checkpoint.load("entrances", (0, 0))
+    for i in range(start, len(entrances)):
+        tiles = get_energized_sum(data, entrances[i])
         if tiles > max_tiles:
             max_tiles = tiles
+        aoc_checkpoint.save("entrances", (i + 1, max_tiles))
+        aoc_progress.report(i + 1, len(entrances))
     return max_tiles
 
 
+def check_all_entrances_for_max_shared(data, jobs=None):
+    """Complete Part 2 work with the entrances spread over worker processes
+
+    The grid goes into shared memory once, so each task only carries its
+    entrance. Work counters are not collected from the workers.
+
+    Args:
+        data (np.array): parsed tile grid
+        jobs (int, optional): worker processes, None for one per CPU.
+            Defaults to None.
+
+    Returns:
+        int: answer to Part 2 question
+    """
+    tiles = aoc_shm.map_grid(get_energized_sum, data, get_all_entrances(data), jobs)
+    return int(max(tiles))
+
+
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 17"""
+import random
+
+DEFAULT_SIZE = 141
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square city map of single digit heat loss values
+
+    Args:
+        size (int, optional): side length of the map. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = ["".join(rng.choices("123456789", k=size)) for _ in range(size)]
+    return "\n".join(lines) + "\n"
@@ -3,26 +3,27 @@
 """Python solver file for Advent of Code Day 17"""
 import os
 import logging
+import sys
 import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+from aoc import search as aoc_search  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
-
+    return aoc_reader.read_input(fn)
 
-def parse_line(text_line):
-    """Parses single line of text from the input file
 
-    Args:
-        text_line (str): raw text line from input file
-    """
-    return [int(x) for x in list(text_line)]
+DIGIT_LOOKUP = aoc_grid.make_lookup({str(d): d for d in range(10)})
 
 
 def parse_data(text_data):
@@ -34,10 +35,78 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
-    return np.array(data)
+    return aoc_grid.to_grid(text_data, DIGIT_LOOKUP)
+
+
+# headings in turn order, so (d + 2) % 4 is the reverse of d
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+EAST = 0
+SOUTH = 1
+
+
+def get_least_heat_loss(blocks, min_run, max_run, starting_point, dest_point):
+    """Find the least heat loss path for a crucible limited to runs of blocks
+
+    Search states are (cell, heading, blocks moved in that heading) encoded
+    into one int, and Dial's bucket queue fits the 1-9 heat loss weights.
+
+    Args:
+        blocks (np.array): grid representing heat loss amounts for passing through cells
+        min_run (int): blocks to move in a heading before turning or stopping
+        max_run (int): most blocks to move in one heading
+        starting_point (tuple): starting point to work from
+        dest_point (tuple): destination, negative values count from the end
+
+    Returns:
+        int: minimized heat loss value
+    """
+    rows, cols = blocks.shape
+    runs = max_run + 1
+    heat = blocks.ravel().tolist()
+    dest_cell = aoc_search.encode(
+        (dest_point[0] % rows, dest_point[1] % cols), blocks.shape
+    )
+
+    def encode(cell, heading, run):
+        return (cell * 4 + heading) * runs + run
+
+    def neighbors(state):
+        cell, rest = divmod(state, 4 * runs)
+        heading, run = divmod(rest, runs)
+        r, c = divmod(cell, cols)
+        moves = []
+        for new_heading, (dr, dc) in enumerate(DIRECTIONS):
+            if new_heading == (heading + 2) % 4:
+                continue
+            if new_heading == heading:
+                if run == max_run:
+                    continue
+                new_run = run + 1
+            elif run < min_run:
+                continue
+            else:
+                new_run = 1
+            new_r, new_c = r + dr, c + dc
+            if 0 <= new_r < rows and 0 <= new_c < cols:
+                new_cell = new_r * cols + new_c
+                moves.append((encode(new_cell, new_heading, new_run), heat[new_cell]))
+        return moves
+
+    def goal(state):
+        cell, rest = divmod(state, 4 * runs)
+        return cell == dest_cell and rest % runs >= min_run
+
+    start = aoc_search.encode(starting_point, blocks.shape)
+    dist, found = aoc_search.dial(
+        [encode(start, EAST, 0), encode(start, SOUTH, 0)],
+        neighbors,
+        rows * cols * 4 * runs,
+        max_weight=9,
+        goal=goal,
+    )
+    if found is None:
+        raise ValueError(f"no path to {dest_point}")
+    return int(dist[found])
 
 
 def get_least_heat_lost_crucibles(blocks, starting_point=(0, 0), dest_point=(-1, -1)):
@@ -47,6 +116,42 @@ def get_least_heat_lost_crucibles(blocks, starting_point=(0, 0), dest_point=(-1,
         data (np.array): grid representing heat loss amounts for passing through cells
         starting_point (tuple, optional): starting point to work from. Defaults to (0, 0).
 
+    Returns:
+        int: minimized heat loss value
+    """
+    return get_least_heat_loss(blocks, 0, 3, starting_point, dest_point)
+
+
+def get_least_heat_loss_ultra_crucibles(
+    blocks, starting_point=(0, 0), dest_point=(-1, -1)
+):
+    """Complete Part 2 work
+
+    Args:
+        data (np.array): grid representing heat loss amounts for passing through cells
+        starting_point (tuple, optional): starting point to work from. Defaults to (0, 0).
+
+    Returns:
+        int: minimized heat loss value
+    """
+    return get_least_heat_loss(blocks, 4, 10, starting_point, dest_point)
+
+
+def get_least_heat_lost_crucibles_list_scan(
+    blocks, starting_point=(0, 0), dest_point=(-1, -1)
+):
+    """Complete Part 1 with the original list-scan search
+
+    Scans the whole work queue for the next entry at the current heat loss
+    level, so it is far slower than the Dial search, and kept as the
+    reference the fuzzer checks get_least_heat_lost_crucibles against.
+
+    Args:
+        blocks (np.array): grid representing heat loss amounts for passing through cells
+        starting_point (tuple, optional): starting point to work from. Defaults to (0, 0).
+        dest_point (tuple, optional): destination, negative values count from
+            the end. Defaults to (-1, -1).
+
     Returns:
         int: minimized heat loss value
     """
@@ -62,7 +167,6 @@ def get_least_heat_lost_crucibles(blocks, starting_point=(0, 0), dest_point=(-1,
             i for i, x in enumerate(work_queue) if x[3] == check_loss_level
         ]
         if not next_work_queue_indices:
-            logger.debug("completed loss level: %d...", check_loss_level)
             check_loss_level += 1
             continue
         p, d, r_steps, loss = work_queue.pop(next_work_queue_indices[0])
@@ -84,7 +188,7 @@ def get_least_heat_lost_crucibles(blocks, starting_point=(0, 0), dest_point=(-1,
             r, c = new_p
             if r < 0 or r >= blocks.shape[0] or c < 0 or c >= blocks.shape[1]:
                 continue
-            new_loss = loss + blocks[new_p]
+            new_loss = loss + int(blocks[new_p])
             if new_d == d:
                 if r_steps < 3:
                     new_entry = (new_p, new_d, r_steps + 1, new_loss)
@@ -100,18 +204,22 @@ def get_least_heat_lost_crucibles(blocks, starting_point=(0, 0), dest_point=(-1,
         p = entry[0]
         if best_cases[p] == 0 or best_cases[p] > loss:
             best_cases[p] = loss
-    logger.debug("\n %s", best_cases)
     return best_cases[dest_point]
 
 
-def get_least_heat_loss_ultra_crucibles(
+def get_least_heat_loss_ultra_crucibles_list_scan(
     blocks, starting_point=(0, 0), dest_point=(-1, -1)
 ):
-    """Complete Part 2 work
+    """Complete Part 2 with the original bucketed work-queue search
+
+    Kept as the reference the fuzzer checks
+    get_least_heat_loss_ultra_crucibles against.
 
     Args:
-        data (np.array): grid representing heat loss amounts for passing through cells
+        blocks (np.array): grid representing heat loss amounts for passing through cells
         starting_point (tuple, optional): starting point to work from. Defaults to (0, 0).
+        dest_point (tuple, optional): destination, negative values count from
+            the end. Defaults to (-1, -1).
 
     Returns:
         int: minimized heat loss value
@@ -119,22 +227,14 @@ def get_least_heat_loss_ultra_crucibles(
     # ensure destination only consists of positive integers
     dest_point = (dest_point[0] % blocks.shape[0], dest_point[1] % blocks.shape[1])
 
-    # queue entries: (point, direction, repeated_steps, heat_lost)
+    # queue entries by heat lost: (point, direction, repeated_steps)
     work_queue = {0: [(starting_point, (0, 1), 0), (starting_point, (1, 0), 0)]}
     results = {}
     loss = 0
     while work_queue:
-        # next_work_queue_indices = [
-        #     i for i, x in enumerate(work_queue) if x[3] == check_loss_level
-        # ]
         if loss in work_queue and len(work_queue[loss]) == 0:
             del work_queue[loss]
         if loss not in work_queue:
-            logger.debug(
-                "loss level: %d \t queue size: %s",
-                loss,
-                len(work_queue.items()),
-            )
             loss += 1
             continue
         p, d, r_steps = work_queue[loss].pop()
@@ -161,7 +261,7 @@ def get_least_heat_loss_ultra_crucibles(
             r, c = new_p
             if r < 0 or r >= blocks.shape[0] or c < 0 or c >= blocks.shape[1]:
                 continue
-            new_loss = loss + blocks[new_p]
+            new_loss = loss + int(blocks[new_p])
             if new_loss not in work_queue:
                 work_queue[new_loss] = []
             if new_d == d:
@@ -183,20 +283,22 @@ def get_least_heat_loss_ultra_crucibles(
                 if best_cases[p] == 0 or best_cases[p] > loss:
                     best_cases[p] = loss
     best_cases[(0, 0)] = 0
-    logger.debug("\n %s", blocks)
-    logger.debug("\n %s", best_cases)
+    if best_cases[dest_point] == 0:
+        # every block loses heat, so 0 means the destination was never reached
+        raise ValueError(f"no path to {dest_point}")
     return best_cases[dest_point]
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
     text_data = get_file_data()
     data = parse_data(text_data)
     answer = get_least_heat_lost_crucibles(data)
-    print(f"Day 17: Part 1: Least Heat Loss for Crucibles (Slow Algo): {answer}")
+    print(f"Day 17: Part 1: Least Heat Loss for Crucibles: {answer}")
     answer2 = get_least_heat_loss_ultra_crucibles(data)
-    print(f"Day 17: Part 2: Least Heat Loss for Ultra Crucibles (Fast Algo): {answer2}")
+    print(f"Day 17: Part 2: Least Heat Loss for Ultra Crucibles: {answer2}")
 
 
 if __name__ == "__main__":
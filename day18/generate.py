@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 18"""
+import itertools
+import random
+from aoc.shapes import NORTH, SOUTH, EAST, WEST, get_tree_squares, get_outline
+from aoc.shapes import trace_loop
+
+DEFAULT_SIZE = 800
+
+# each part's trench is the same loop drawn with its own spacing between
+# grid lines, so both plans stay simple polygons with the same turns
+DIRECTIONS = {EAST: ("R", 0), SOUTH: ("D", 1), WEST: ("L", 2), NORTH: ("U", 3)}
+
+MAX_HEX = 16**5 - 1
+
+
+def get_spacing(rng, count, low, high):
+    """Get strictly increasing coordinates for a run of grid lines
+
+    Args:
+        rng (random.Random): random source
+        count (int): number of grid lines
+        low (int): smallest gap between neighbouring lines
+        high (int): largest gap between neighbouring lines
+
+    Returns:
+        list: coordinate of each grid line
+    """
+    return list(itertools.accumulate(rng.randint(low, high) for _ in range(count)))
+
+
+def get_segments(loop):
+    """Merge a loop of unit steps into straight segments
+
+    Args:
+        loop (list): corner points in loop order
+
+    Returns:
+        list: (start point, end point, direction) segments
+    """
+    steps = []
+    for a, b in zip(loop, loop[1:] + loop[:1]):
+        steps.append((a, (b[0] - a[0], b[1] - a[1])))
+    # start on a corner so no segment wraps around the end of the list
+    first = next(i for i in range(len(steps)) if steps[i][1] != steps[i - 1][1])
+    steps = steps[first:] + steps[:first]
+    segments = []
+    for d, group in itertools.groupby(steps, key=lambda s: s[1]):
+        group = list(group)
+        start = group[0][0]
+        end = (start[0] + d[0] * len(group), start[1] + d[1] * len(group))
+        segments.append((start, end, d))
+    return segments
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a dig plan whose two readings both trace simple loops
+
+    Args:
+        size (int, optional): approximate number of dig instructions.
+            Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    coarse = max(int((size / 1.5) ** 0.5), 2)
+    segments = get_segments(
+        trace_loop(get_outline(get_tree_squares(rng, coarse, coarse)))
+    )
+    offset = rng.randrange(len(segments))
+    segments = segments[offset:] + segments[:offset]
+
+    lines_count = 4 * coarse + 1
+    small = [get_spacing(rng, lines_count, 1, 4) for _ in range(2)]
+    big_gap = max(MAX_HEX // lines_count, 2)
+    big = [get_spacing(rng, lines_count, big_gap // 2, big_gap) for _ in range(2)]
+
+    lines = []
+    for (r0, c0), (r1, c1), d in segments:
+        name, code = DIRECTIONS[d]
+        if d in (NORTH, SOUTH):
+            n = abs(small[0][r1] - small[0][r0])
+            hex_n = abs(big[0][r1] - big[0][r0])
+        else:
+            n = abs(small[1][c1] - small[1][c0])
+            hex_n = abs(big[1][c1] - big[1][c0])
+        color = f"#{hex_n:05x}{code}"
+        lines.append(f"{name} {n} ({color})")
+    return "\n".join(lines) + "\n"
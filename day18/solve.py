@@ -3,9 +3,17 @@
 """Python solver file for Advent of Code Day 18"""
 import os
 import logging
-import numpy as np
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+from aoc import search as aoc_search  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 RIGHT = (0, 1)
@@ -16,9 +24,7 @@ UP = (-1, 0)
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -41,9 +47,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    dig_plan = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
+    dig_plan = [parse_line(line.strip()) for line in aoc_reader.iter_lines(text_data)]
     return dig_plan
 
 
@@ -79,18 +83,22 @@ def function(data):
     Returns:
         int: answer to Part 1 question
     """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
     right_turns = 0
     p = (0, 0)
     last_d = (0, 0)
     digs = [(p, last_d)]
+    records = aoc_artifacts.records(logger)
     for d, n, _ in data:
         if d == get_turn_offset(last_d):
             right_turns += 1
         else:
             right_turns -= 1
-        logger.debug(
-            "last_d: %s, d: %s, p: %s, right_turns: %d", last_d, d, p, right_turns
-        )
+        if records:
+            logger.debug(
+                "last_d: %s, d: %s, p: %s, right_turns: %d", last_d, d, p, right_turns
+            )
 
         for _ in range(1, n + 1):
             p = (p[0] + d[0], p[1] + d[1])
@@ -102,9 +110,13 @@ def function(data):
     p_rows, p_cols = list(zip(*points))
     size = (max(p_rows) - min(p_rows) + 1, max(p_cols) - min(p_cols) + 1)
 
+    # shift the trench so every point is inside the grid rather than wrapping
+    # around through negative indices, which the bounded flood fill needs
+    min_r, min_c = min(p_rows), min(p_cols)
+    digs = [((p[0] - min_r, p[1] - min_c), d) for p, d in digs]
+
     dig_grid = np.zeros(size, dtype=bool)
 
-    logger.debug("\n %s", dig_grid)
     for p, d in digs:
         dig_grid[p] = True
 
@@ -115,19 +127,12 @@ def function(data):
 
     for p, d in digs:
         o = get_turn_offset(d, turn=turn)
-        logger.debug("p: %s d: %s o: %s", p, d, o)
         inside_p = (p[0] + o[0], p[1] + o[1])
-        logger.debug("new_p: %s", inside_p)
-        if not dig_grid[inside_p]:
-            to_fills = [inside_p]
-            while to_fills:
-                p1 = to_fills.pop()
-                dig_grid[p1] = True
-                for d in [UP, DOWN, LEFT, RIGHT]:
-                    p2 = (p1[0] + d[0], p1[1] + d[1])
-                    if not dig_grid[p2]:
-                        to_fills.append(p2)
+        if records:
+            logger.debug("p: %s d: %s o: %s, new_p: %s", p, d, o, inside_p)
+        aoc_search.flood_fill(dig_grid, inside_p, True, fillable=(False,))
 
+    aoc_artifacts.write_grid("day18-trench.txt", dig_grid)
     return np.sum(dig_grid)
 
 
@@ -140,6 +145,8 @@ def function2(data):
     Returns:
         int: answer to Part 2 question
     """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
     lookup = [RIGHT, DOWN, LEFT, UP]
 
     instructions = [
@@ -214,12 +221,12 @@ def function2(data):
             for i in range(last_s_r, s_r, d[0]):
                 dig_grid[(i, s_c)] = True
 
-    logger.debug("\n %s", dig_grid)
     if right_turns > 0:
         turn = RIGHT
     else:
         turn = LEFT
 
+    records = aoc_artifacts.records(logger)
     for points, dirs in vectors:
         # unpack values
         last_p, p = points
@@ -235,19 +242,10 @@ def function2(data):
 
         # populate interior cells
         o = get_turn_offset(d, turn=turn)
-        logger.debug("turn is %s", turn)
-        logger.debug("p: %s d: %s o: %s", p, d, o)
         inside_s_p = (s_r + o[0], s_c + o[1])
-        logger.debug("new_p: %s", inside_s_p)
-        if not dig_grid[inside_s_p]:
-            to_fills = [inside_s_p]
-            while to_fills:
-                p1 = to_fills.pop()
-                dig_grid[p1] = True
-                for d in [UP, DOWN, LEFT, RIGHT]:
-                    p2 = (p1[0] + d[0], p1[1] + d[1])
-                    if not dig_grid[p2]:
-                        to_fills.append(p2)
+        if records:
+            logger.debug("p: %s d: %s o: %s, new_p: %s", p, d, o, inside_s_p)
+        aoc_search.flood_fill(dig_grid, inside_s_p, True, fillable=(False,))
 
     visual_grid = np.zeros(dig_grid.shape, dtype=int)
     for i, v in np.ndenumerate(dig_grid):
@@ -277,10 +275,12 @@ def function2(data):
             # covers the remainder of the use cases
             visual_grid[i] = h * w
 
-    logger.debug("\n %s", visual_grid)
+    aoc_artifacts.write_grid("day18-sparse-trench.txt", dig_grid)
+    aoc_artifacts.write_grid("day18-sparse-areas.txt", visual_grid)
     return np.sum(visual_grid)
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 19"""
+import random
+import string
+
+DEFAULT_SIZE = 540
+
+CATEGORIES = "xmas"
+
+
+def get_names(rng, count):
+    """Draw unique lowercase workflow names, with 'in' first
+
+    Args:
+        rng (random.Random): random source
+        count (int): how many names
+
+    Returns:
+        list: workflow names
+    """
+    length = 2
+    while 26**length < count * 4:
+        length += 1
+    names = ["in"]
+    seen = {"in"}
+    while len(names) < count:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, length)))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a tree of workflows and a list of part ratings
+
+    Every workflow other than 'in' is sent to by exactly one earlier workflow,
+    so parts always end up accepted or rejected.
+
+    Args:
+        size (int, optional): number of workflows. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    names = get_names(rng, size)
+    children = {name: [] for name in names}
+    for i, name in enumerate(names[1:], start=1):
+        children[names[rng.randrange(i)]].append(name)
+
+    workflows = []
+    for name in names:
+        targets = children[name] + rng.choices("AR", k=rng.randint(0, 2))
+        while len(targets) < 2:
+            targets.append(rng.choice("AR"))
+        rng.shuffle(targets)
+        rules = [
+            f"{rng.choice(CATEGORIES)}{rng.choice('<>')}{rng.randint(2, 3999)}:{t}"
+            for t in targets[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join(rules + [targets[-1]])}}}")
+    rng.shuffle(workflows)
+
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in CATEGORIES) + "}"
+        for _ in range(max(size * 3 // 8, 1))
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
@@ -3,16 +3,22 @@
 """Python solver file for Advent of Code Day 19"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import intervals as aoc_intervals  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_rule(text_rule):
@@ -67,16 +73,19 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    text_workflows, text_parts = text_data.strip().strip("\n").split("\n\n")
+    text_workflows, text_parts = aoc_reader.iter_sections(text_data)
     workflows = {
         k: v
-        for entry in text_workflows.strip().split("\n")
+        for entry in aoc_reader.iter_lines(text_workflows)
         for k, v in parse_workflow(entry).items()
     }
-    parts = [parse_part_line(p) for p in text_parts.strip().split("\n")]
+    parts = [parse_part_line(p) for p in aoc_reader.iter_lines(text_parts)]
     return workflows, parts
 
 
+CATEGORIES = "xmas"
+
+
 def check_part(workflows, part, start="in"):
     cur = start
     while True:
@@ -119,7 +128,7 @@ def function(workflows, parts):
     return sum([sum(part.values()) for part in accepted_parts])
 
 
-def function2(workflows):
+def function2(workflows, start="in"):
     """Complete Part 2 work
 
     Args:
@@ -128,74 +137,44 @@ def function2(workflows):
     Returns:
         int: answer to Part 2 question
     """
-    # get all distinct bifurcation values by cats, across all workflow rules
-    dividers = {"x": {1, 4001}, "m": {1, 4001}, "a": {1, 4001}, "s": {1, 4001}}
-    for workflow_rules in workflows.values():
-        for rule in workflow_rules:
-            cat = rule["cat"]
-            if cat:
-                # get the lowest integer value in the upper range
-                if rule["cmp_op"] == "<":
-                    dividers[cat].add(rule["value"])
-                else:
-                    dividers[cat].add(rule["value"] + 1)
-
-    x_div = list(dividers["x"])
-    x_div.sort()
-    m_div = list(dividers["m"])
-    m_div.sort()
-    a_div = list(dividers["a"])
-    a_div.sort()
-    s_div = list(dividers["s"])
-    s_div.sort()
-
-    logger.debug(
-        "total_to_check: %d",
-        (len(x_div) - 1) * (len(m_div) - 1) * (len(a_div) - 1) * (len(s_div) - 1),
-    )
-
+    # follow boxes of x, m, a and s ranges through the workflows, cutting a
+    # box in two at each rule it straddles
     accepted_total = 0
-    for i_x, x in enumerate(x_div[:-1]):
-        for i_m, m in enumerate(m_div[:-1]):
-            for i_a, a in enumerate(a_div[:-1]):
-                for i_s, s in enumerate(s_div[:-1]):
-                    if check_part(workflows, {"a": a, "m": m, "x": x, "s": s}):
-                        # this subrange should then all be accepted
-                        x_next = x_div[i_x + 1]
-                        m_next = m_div[i_m + 1]
-                        a_next = a_div[i_a + 1]
-                        s_next = s_div[i_s + 1]
-                        accepted = (
-                            (x_next - x) * (m_next - m) * (a_next - a) * (s_next - s)
-                        )
-                        logger.debug(
-                            "(%d, %d), (%d, %d), (%d, %d), (%d, %d): accepted: %d",
-                            x,
-                            x_next,
-                            m,
-                            m_next,
-                            a,
-                            a_next,
-                            s,
-                            s_next,
-                            accepted,
-                        )
-                        accepted_total += accepted
+    work_queue = [(start, ((1, 4001),) * len(CATEGORIES))]
+    while work_queue:
+        cur, box = work_queue.pop()
+        if cur == "A":
+            accepted_total += aoc_intervals.box_volume(box)
+            continue
+        if cur == "R":
+            continue
+        for rule in workflows[cur]:
+            if not rule["cmp_op"]:
+                work_queue.append((rule["result"], box))
+                break
+            axis = CATEGORIES.index(rule["cat"])
+            if rule["cmp_op"] == "<":
+                matched, box = aoc_intervals.split_box(box, axis, rule["value"])
+            else:
+                box, matched = aoc_intervals.split_box(box, axis, rule["value"] + 1)
+            if matched is not None:
+                work_queue.append((rule["result"], matched))
+            if box is None:
+                break
 
     return accepted_total
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
-    logger.setLevel(level=logging.DEBUG)
+    logger.setLevel(level=logging.INFO)
     text_data = get_file_data()
     workflows, parts = parse_data(text_data)
     answer = function(workflows, parts)
     print(f"Day 19: Part 1: Get All Accepted Parts : {answer}")
     answer2 = function2(workflows)
-    print(
-        f"Day 19: Part 2: Get Total Distinct Combinations (1 Hour Runtime): {answer2}"
-    )
+    print(f"Day 19: Part 2: Get Total Distinct Combinations: {answer2}")
 
 
 if __name__ == "__main__":
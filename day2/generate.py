@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 2"""
+import random
+
+DEFAULT_SIZE = 100
+
+COLORS = ["red", "green", "blue"]
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate cube games with a handful of rounds each
+
+    Args:
+        size (int, optional): number of games. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = []
+    for game in range(1, size + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {game}: " + "; ".join(rounds))
+    return "\n".join(lines) + "\n"
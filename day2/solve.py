@@ -3,17 +3,22 @@
 """Python solver file for Advent of Code Day 2"""
 import os
 import logging
+import sys
 import math
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_bag(bag_text):
@@ -67,7 +72,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [parse_line(line) for (line) in text_data.strip().strip("\n").split("\n")]
+    data = [parse_line(line) for (line) in aoc_reader.iter_lines(text_data)]
     new_data = {k: v for (k, v) in data}
     logger.debug(new_data)
     return new_data
@@ -130,6 +135,7 @@ def get_min_power_sum(data):
     return sum(powers)
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
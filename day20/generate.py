@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 20"""
+import itertools
+import random
+import string
+
+DEFAULT_SIZE = 12
+
+# names of the fixed part of the network: four conjunction hubs, the inverters
+# they feed, then sq -> rx
+HUBS = ["vm", "kb", "dn", "vk"]
+INVERTERS = ["fv", "kk", "vt", "xr"]
+RESERVED = set(HUBS + INVERTERS + ["sq", "rx", "broadcaster"])
+
+
+def get_names(rng, count):
+    """Draw unique lowercase flip-flop names
+
+    Args:
+        rng (random.Random): random source
+        count (int): how many names
+
+    Returns:
+        list: module names
+    """
+    length = 2
+    while 26**length - len(RESERVED) < count:
+        length += 1
+    pool = [
+        "".join(p)
+        for p in itertools.product(string.ascii_lowercase, repeat=length)
+        if "".join(p) not in RESERVED
+    ]
+    return rng.sample(pool, count)
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate four flip-flop counters that each fire rx's feeder periodically
+
+    Each counter is a chain of flip-flops counting button presses; its hub
+    listens to the bits set in the counter's period and resets the rest,
+    which is the structure the real puzzle input has.
+
+    Args:
+        size (int, optional): flip-flops per counter, so periods are below
+            2 ** size. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    size = max(size, 2)
+    names = get_names(rng, 4 * size)
+    outputs = {}
+    firsts = []
+    for chain, (hub, inverter) in enumerate(zip(HUBS, INVERTERS)):
+        flip_flops = names[chain * size : (chain + 1) * size]
+        firsts.append(flip_flops[0])
+        # odd period with the top bit set, so the first and last bits feed the hub
+        period = rng.randrange(2 ** (size - 1) + 1, 2**size, 2)
+        outputs[hub] = [inverter]
+        for bit, name in enumerate(flip_flops):
+            outputs[name] = []
+            if bit + 1 < size:
+                outputs[name].append(flip_flops[bit + 1])
+            if period >> bit & 1:
+                outputs[name].append(hub)
+            if not period >> bit & 1 or bit == 0:
+                outputs[hub].append(name)
+        outputs[inverter] = ["sq"]
+    outputs["sq"] = ["rx"]
+
+    lines = [f"broadcaster -> {', '.join(firsts)}"]
+    for name, rxs in outputs.items():
+        op = "&" if name in HUBS or name in INVERTERS or name == "sq" else "%"
+        rng.shuffle(rxs)
+        lines.append(f"{op}{name} -> {', '.join(rxs)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
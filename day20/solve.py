@@ -3,17 +3,31 @@
 """Python solver file for Advent of Code Day 20"""
 import os
 import logging
+import sys
 import math
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import checkpoint as aoc_checkpoint  # pylint: disable=wrong-import-position
+from aoc import counters as aoc_counters  # pylint: disable=wrong-import-position
+from aoc import cycles as aoc_cycles  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import progress as aoc_progress  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+from aoc import timeline as aoc_timeline  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
+# button presses to simulate while looking for each counter to repeat
+MAX_ROUNDS = 1 << 16
+
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -46,9 +60,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    modules = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
+    modules = [parse_line(line.strip()) for line in aoc_reader.iter_lines(text_data)]
     modules = {k: v for k, v in modules}
     for name, m in modules.items():
         inputs = [
@@ -120,6 +132,7 @@ def function(modules, rounds=1000):
         #     "round %d complete :: low: %d, high: %d", i + 1, low_pulses, high_pulses
         # )
 
+    aoc_counters.add("pulses", low_pulses + high_pulses)
     return low_pulses * high_pulses
 
 
@@ -173,45 +186,42 @@ def get_pulse_counts(modules, rounds=1):
         #     "round %d complete :: low: %d, high: %d", i + 1, low_pulses, high_pulses
         # )
 
+    aoc_counters.add("pulses", sum(low_pulses.values()) + sum(high_pulses.values()))
     return low_pulses, high_pulses
 
 
-def print_deps_node(modules, node_name):
-    if node_name in modules:
-        outputs = modules[node_name]["rxs"]
-        print(f"{outputs} <- {modules[node_name]['state']} - {node_name}")
-        inputs = [f"{rx}:{state}" for rx, state in modules[node_name]["mem"].items()]
-        print(f"\t {node_name} <- {modules[node_name]['op']} - {inputs}")
-
-
-def sort_val(e):
-    return e[2]
+def format_deps_tree(modules, start="rx", periods=None):
+    """Render the modules feeding a module, breadth first
 
+    Args:
+        modules (dict): parsed modules
+        start (str, optional): module whose inputs are walked. Defaults to "rx".
+        periods (dict, optional): module name to press period, used to order
+            each module's inputs. Defaults to None.
 
-def print_deps_tree(modules, start="rx", flip_flops=None):
+    Returns:
+        list: one line per module with its operation and input states
+    """
+    periods = periods or {}
     start_deps = [name for name in modules if start in modules[name]["rxs"]]
-    s1 = start_deps[0]
-    logger.debug(f"{start} <- {s1}:{modules[s1]['state']}")
-    work_queue = start_deps
-    printed = []
+    lines = [f"{start} <- {', '.join(start_deps)}"]
+    work_queue = list(start_deps)
+    seen = set()
     while work_queue:
-        cur = work_queue.pop()
-        if cur not in printed:
-            mem_data = list(modules[cur]["mem"].items())
-            if flip_flops:
-                sorted_list = [
-                    (rx, state, flip_flops[rx]["period"] if rx in flip_flops else 0)
-                    for rx, state in mem_data
-                ]
-                sorted_list.sort(key=sort_val)
-                mem_data = [(rx, state) for rx, state, _ in sorted_list]
-            key_values = [f"{rx}:{state}" for rx, state in mem_data]
-
-            logger.debug(f"{cur} {modules[cur]['op']} <- {key_values}")
-            printed.append(cur)
-        for c in modules[cur]["mem"].keys():
-            if c not in printed:
-                work_queue.insert(0, c)
+        cur = work_queue.pop(0)
+        if cur in seen or cur not in modules:
+            continue
+        seen.add(cur)
+        mem_data = sorted(
+            modules[cur]["mem"].items(), key=lambda e: periods.get(e[0], 0)
+        )
+        key_values = [
+            f"{rx}:{state}" + (f"/{periods[rx]}" if rx in periods else "")
+            for rx, state in mem_data
+        ]
+        lines.append(f"{cur} {modules[cur]['op']} <- {key_values}")
+        work_queue.extend(rx for rx, _ in mem_data if rx not in seen)
+    return lines
 
 
 def init_modules(modules):
@@ -221,119 +231,132 @@ def init_modules(modules):
             m["mem"][x] = 0
 
 
-def function2(modules):
-    """Complete Part 2 work
+def get_upstream(modules, name):
+    """Collect every module whose pulses can reach the named module
 
     Args:
-        data (list): list of parsed input objects/dictionaries
+        modules (dict): parsed modules
+        name (str): module to walk back from
 
     Returns:
-        int: answer to Part 2 question
+        list: sorted names of the module and everything feeding it
     """
-    # find flip flops patterns
-    # dict entries: o is offset to first '1' value and 'r' is freq between repeats
-    flip_flops = {}
-    concerns = ["vm", "kb", "dn", "vk"]
-    for name, m in modules.items():
+    found = {name}
+    work_queue = [name]
+    while work_queue:
+        cur = work_queue.pop()
+        for src in modules[cur]["mem"]:
+            if src not in found:
+                found.add(src)
+                work_queue.append(src)
+    return sorted(found)
+
+
+def get_state_bits(modules, names):
+    """Pack the flip-flop states and conjunction memories of modules into an int
+
+    Args:
+        modules (dict): parsed modules
+        names (list): modules to pack, in a fixed order
+
+    Returns:
+        int: one bit per flip-flop state and per remembered conjunction input
+    """
+    bits = 0
+    for name in names:
+        m = modules[name]
         if m["op"] == "%":
-            for concern in concerns:
-                if name in modules[concern]["mem"].keys():
-                    flip_flops[name] = {"offset": 0, "period": 0, "pattern": []}
+            bits = bits << 1 | m["state"]
+        elif m["op"] == "&":
+            for val in m["mem"].values():
+                bits = bits << 1 | val
+    return bits
 
-    init_modules(modules)
-    rounds = 0
-    for _ in range(100000):
-        low, high = get_pulse_counts(modules, 1)
-        rounds += 1
-        for name, ff in flip_flops.items():
-            if modules[name]["state"] == 1:
-                # if ff["period"] == 0:
-                ff["pattern"].append(rounds)
-                # if len(ff["pattern"]) >= 4:
-                #     logger.debug("%s : %s", name, ff["pattern"])
-
-    for name, ff in flip_flops.items():
-        pattern = ff["pattern"].copy()
-        ff["offset"] = pattern[0]
-        high_count = 1
-        last_num = pattern.pop()
-        last_diff = 1
-        guess_low_count = 0
-        guess_high_count = 0
-        while ff["period"] == 0:
-            num = pattern.pop()
-            diff = last_num - num
-            if diff == 1:
-                high_count += 1
-            else:
-                if guess_low_count == diff:
-                    ff["period"] = guess_low_count
-                    logger.debug(
-                        "name: %s, value: %d, diff: %d, last_num: %d, num: %d",
-                        name,
-                        num,
-                        diff,
-                        last_num,
-                        num,
-                    )
-                else:
-                    logger.debug(
-                        "name: %s, value: %d, diff: %d, last_num: %d, num: %d",
-                        name,
-                        num,
-                        diff,
-                        last_num,
-                        num,
-                    )
-                    guess_low_count = diff
-                    guess_high_count = high_count
-                high_count = 1
-
-            last_num = num
-            last_diff = diff
-
-    for name, ff in flip_flops.items():
-        logger.debug(
-            "%s :: offset: %d, period: %d, pattern: %s",
-            name,
-            ff["offset"],
-            ff["period"],
-            ff["pattern"][-16:],
-        )
 
-    # pick a module and go deep on how its repetition works
+def set_state_bits(modules, names, bits):
+    """Restore the module states packed by get_state_bits
+
+    Args:
+        modules (dict): parsed modules, changed in place
+        names (list): modules to restore, in the order they were packed
+        bits (int): packed states
+    """
+    for name in reversed(names):
+        m = modules[name]
+        if m["op"] == "%":
+            m["state"] = bits & 1
+            bits >>= 1
+        elif m["op"] == "&":
+            for src in reversed(list(m["mem"])):
+                m["mem"][src] = bits & 1
+                bits >>= 1
+
+
+def function2(modules, max_rounds=MAX_ROUNDS):
+    """Complete Part 2 work
+
+    The conjunction feeding rx only sends it a low pulse when all of its
+    inputs pulse high on the same button press. Each input is driven by an
+    independent counter, so each counter's state is hashed until it repeats,
+    and when a counter fires once per period on the last press of it the
+    answer is the lcm of the periods.
+
+    Args:
+        modules (dict): parsed modules
+        max_rounds (int, optional): presses to give up after. Defaults to
+            MAX_ROUNDS.
 
+    Returns:
+        int: answer to Part 2 question
+    """
+    (final,) = [name for name, m in modules.items() if "rx" in m["rxs"]]
+    # periods found by an interrupted earlier run are not searched again
+    known = aoc_checkpoint.load("periods", {})
+    periods = []
+    for counter in modules[final]["mem"]:
+        if counter in known:
+            periods.append(known[counter])
+            continue
+        names = get_upstream(modules, counter)
+        fired = []
+
+        def press(bits, names=names, counter=counter, fired=fired):
+            set_state_bits(modules, names, bits)
+            low, _ = get_pulse_counts(modules, 1)
+            fired.append(low[counter] > 0)
+            return get_state_bits(modules, names)
+
+        init_modules(modules)
+        with aoc_progress.stage(f"counter {counter}"):
+            with aoc_timeline.span("period discovery", counter=counter):
+                prefix, period, _ = aoc_cycles.find_cycle(
+                    press, get_state_bits(modules, names), max_rounds
+                )
+        if period is None:
+            raise ValueError(f"{counter} does not repeat in {max_rounds} presses")
+        # each input inverts its counter, so it sends final a high pulse right
+        # after receiving a low one
+        presses = [i + 1 for i, f in enumerate(fired) if f]
+        if prefix > period or presses[:1] != [period]:
+            raise ValueError(f"{counter} does not fire once at the end of its cycle")
+        logger.debug("%s fires every %d presses", counter, period)
+        periods.append(period)
+        known = {**known, counter: period}
+        aoc_checkpoint.save("periods", known)
     init_modules(modules)
-    # for concern in concerns:
-    #     for n in modules[concern]["mem"]:
-    #         modules[concern]["mem"][n] = 1
-
-    print_deps_tree(modules, flip_flops=flip_flops)
-    rounds = 0
-    concerns = ["fv", "kk", "vt", "xr"]
-    offsets = []
-    while concerns:
-        low, high = get_pulse_counts(modules, 1)
-        rounds += 1
-        if low["rx"] > 0:
-            return rounds
-
-        for c in concerns:
-            if low[c] > 0:
-                logger.debug("%s low pulsed after %d pushes", c, rounds)
-                concerns.remove(c)
-                offsets.append(rounds)
-                # logger.debug(
-                #     "rx :: high count: %d, low count: %d", high["rx"], low["rx"]
-                # )
-                # print_deps_tree(modules, flip_flops=flip_flops)
-                # logger.debug("LOW: \n %s", low)
-                # logger.debug("HIGH: \n %s", high)
-                break
-
-    return math.lcm(*offsets)
+    if aoc_artifacts.enabled("deps"):
+        aoc_artifacts.write_lines(
+            "deps",
+            "day20-deps.txt",
+            format_deps_tree(
+                modules, periods=dict(zip(modules[final]["mem"], periods))
+            ),
+        )
+    with aoc_timeline.span("lcm", periods=periods):
+        return math.lcm(*periods)
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 21"""
+import random
+
+DEFAULT_SIZE = 131
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square garden with S in the middle of a clear row and column
+
+    Args:
+        size (int, optional): side length, rounded up to odd. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    size = size if size % 2 else size + 1
+    middle = size // 2
+    lines = []
+    for r in range(size):
+        row = [
+            "#" if rng.random() < 0.12 and r != middle and c != middle else "."
+            for c in range(size)
+        ]
+        if r == middle:
+            row[middle] = "S"
+        lines.append("".join(row))
+    return "\n".join(lines) + "\n"
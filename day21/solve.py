@@ -3,30 +3,27 @@
 """Python solver file for Advent of Code Day 21"""
 import os
 import logging
+import sys
 import numpy as np
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import grid as aoc_grid  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
+from aoc import search as aoc_search  # pylint: disable=wrong-import-position
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
-
+    return aoc_reader.read_input(fn)
 
-def parse_line(text_line):
-    """Parses single line of text from the input file
 
-    Args:
-        text_line (str): raw text line from input file
-    """
-    start = -1
-    line = [c in (".", "S") for c in text_line.strip()]
-    if "S" in text_line:
-        start = text_line.index("S")
-    return line, start
+GARDEN_LOOKUP = aoc_grid.make_lookup({".": True, "S": True}, dtype=bool)
 
 
 def parse_data(text_data):
@@ -38,14 +35,9 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    start = (0, 0)
-    data = []
-    for r, line in enumerate(text_data.strip().strip("\n").split("\n")):
-        row, c = parse_line(line.strip())
-        if c != -1:
-            start = (r, c)
-        data.append(row)
-    return np.array(data), start
+    chars = aoc_grid.view_chars(text_data)
+    start = aoc_grid.find(chars, ord("S")) or (0, 0)
+    return GARDEN_LOOKUP[chars], start
 
 
 NORTH = (-1, 0)
@@ -54,13 +46,6 @@ EAST = (0, 1)
 WEST = (0, -1)
 
 
-def check_bounds(point, dim):
-    r, c = point
-    if 0 <= r < dim[0] and 0 <= c < dim[1]:
-        return True
-    return False
-
-
 def function(tiles, start, steps=64):
     """Complete Part 1 work
 
@@ -70,37 +55,17 @@ def function(tiles, start, steps=64):
     Returns:
         int: answer to Part 1 question
     """
-    reached = np.zeros((len(tiles), len(tiles[0])), dtype=bool)
-    for r, row in enumerate(tiles):
-        for c, val in enumerate(row):
-            if val == "S":
-                start = (r, c)
-
-    # entries are (point, step_count)
-    work_queue = [(start, 0)]
-    completed = {}
-    while work_queue:
-        cur, step_count = work_queue.pop()
-        is_even = step_count % 2 == 0
-        if not tiles[cur]:
-            continue
-        if cur not in completed:
-            completed[cur] = {}
-        if is_even in completed[cur] and completed[cur][is_even] >= step_count:
-            continue
-
-        completed[cur][is_even] = step_count
-        if step_count == steps:
-            reached[cur] = True
-            continue
-        for option in [NORTH, SOUTH, EAST, WEST]:
-            r = option[0] + cur[0]
-            c = option[1] + cur[1]
-            if check_bounds((r, c), tiles.shape) and not reached[(r, c)]:
-                work_queue.insert(0, ((r, c), (step_count + 1)))
-
-    logger.debug(reached)
-    return np.sum(reached)
+    # a plot reached in d steps can be reached again in d + 2 by stepping
+    # back and forth, so the plots at the end are those at most steps away
+    # with matching parity
+    dist, _ = aoc_search.bfs(
+        [aoc_search.encode(start, tiles.shape)],
+        aoc_search.grid_neighbors(tiles.shape, tiles),
+        tiles.size,
+    )
+    reached = (dist >= 0) & (dist <= steps) & (dist % 2 == steps % 2)
+    logger.debug(reached.reshape(tiles.shape))
+    return int(np.sum(reached))
 
 
 def function2(tiles, start=None, steps=6):
@@ -112,6 +77,9 @@ def function2(tiles, start=None, steps=6):
     Returns:
         int: answer to Part 2 question
     """
+    # assumes square
+    size = tiles.shape[0]
+
     # default to center square
     if not start:
         start = (size // 2, size // 2)
@@ -119,9 +87,6 @@ def function2(tiles, start=None, steps=6):
     # guaranteed completed square
     full_step_count = size * 2
 
-    # assumes square
-    size = tiles.shape[0]
-
     running_total = 0
 
     memo = {}
@@ -147,10 +112,12 @@ def function2(tiles, start=None, steps=6):
         ring, s, rem_steps = work_queue.pop()
         if ring == 0:
             # need to setup trunks in all directions
+            pass
 
     return 0
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
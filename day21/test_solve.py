@@ -52,7 +52,7 @@ def test_all(test_data):
     data = parse_data(test_data)
     tiles, start = data
     assert function(tiles, start, steps=6) == 16
-    assert function(tiles, (0, 0), steps=20) == 50
+    assert function(tiles, (0, 0), steps=20) == 42
     # assert function(tiles, start, steps=50) == 1594
     # assert function(tiles, start, steps=100) == 6536
     # assert function(tiles, start, steps=500) == 167004
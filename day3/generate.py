@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 3"""
+import random
+
+DEFAULT_SIZE = 140
+
+SYMBOLS = ["-", "#", "%", "+", "&", "*", "=", "@", "/", "$"]
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate a square engine schematic of numbers, symbols and dots
+
+    Args:
+        size (int, optional): side length of the schematic. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.08:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.11:
+                # gears are the most common symbol so Part 2 has work to do
+                row.append("*" if rng.random() < 0.4 else rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        lines.append("".join(row[:size]))
+    return "\n".join(lines) + "\n"
@@ -3,8 +3,16 @@
 """Python solver file for Advent of Code Day 3"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 VALID_SYMBOLS = {"-", "#", "%", "+", "&", "*", "=", "@", "/", "$"}
@@ -12,9 +20,7 @@ VALID_SYMBOLS = {"-", "#", "%", "+", "&", "*", "=", "@", "/", "$"}
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(rownum, text_line):
@@ -64,8 +70,7 @@ def parse_data(text_data):
         symbols: list of symbols and their locations in the schematics
     """
     lines_data = [
-        parse_line(i, line)
-        for i, line in enumerate(text_data.strip().strip("\n").split("\n"))
+        parse_line(i, line) for i, line in enumerate(aoc_reader.iter_lines(text_data))
     ]
     numbers = list()
     symbols = list()
@@ -92,20 +97,22 @@ def get_part_number_sum(numbers, symbols):
     """
     # check numbers for adjacency and add to valid list
     parts = list()
+    records = aoc_artifacts.records(logger)
     for n in numbers:
         endj = n["j"] + len(str(n["num"])) - 1
         for s in symbols:
             if s["i"] >= n["i"] - 1 and s["i"] <= n["i"] + 1:
                 if s["j"] >= n["j"] - 1 and s["j"] <= endj + 1:
-                    logger.debug(
-                        "matched %d at (%d, %d) to %s at (%d, %d)",
-                        n["num"],
-                        n["i"],
-                        n["j"],
-                        s["sym"],
-                        s["i"],
-                        s["j"],
-                    )
+                    if records:
+                        logger.debug(
+                            "matched %d at (%d, %d) to %s at (%d, %d)",
+                            n["num"],
+                            n["i"],
+                            n["j"],
+                            s["sym"],
+                            s["i"],
+                            s["j"],
+                        )
                     parts.append(n["num"])
                     break
 
@@ -122,6 +129,7 @@ def get_gear_ratio_sum(numbers, symbols):
         int: answer to Part 2 question
     """
     gears = list()
+    records = aoc_artifacts.records(logger)
     for s in symbols:
         adjacent_numbers = list()
         for n in numbers:
@@ -132,7 +140,8 @@ def get_gear_ratio_sum(numbers, symbols):
                 and s["j"] >= n["j"] - 1
                 and s["j"] <= endj
             ):
-                logger.debug("appending %d", n["num"])
+                if records:
+                    logger.debug("appending %d", n["num"])
                 adjacent_numbers.append(n["num"])
         if len(adjacent_numbers) == 2:
             gears.append(adjacent_numbers[0] * adjacent_numbers[1])
@@ -140,6 +149,7 @@ def get_gear_ratio_sum(numbers, symbols):
     return sum(gears)
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
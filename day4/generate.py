@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 4"""
+import random
+
+DEFAULT_SIZE = 212
+
+# matches per card are drawn from this distribution; its mean stays below one
+# so the card copies won in Part 2 grow with size instead of exponentially
+MATCH_WEIGHTS = [55, 20, 10, 6, 4, 2, 1, 1, 0.5, 0.3, 0.2]
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate scratchcards with 10 winning and 25 drawn numbers
+
+    Args:
+        size (int, optional): number of cards. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    width = len(str(size))
+    lines = []
+    for card in range(1, size + 1):
+        # no card may win copies of cards past the end of the table
+        matches = rng.choices(range(len(MATCH_WEIGHTS)), MATCH_WEIGHTS)[0]
+        matches = min(matches, size - card)
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winning = numbers[:10]
+        drawn = winning[:matches] + numbers[10:]
+        rng.shuffle(winning)
+        rng.shuffle(drawn)
+        lines.append(
+            f"Card {card:>{width}}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in drawn)
+        )
+    return "\n".join(lines) + "\n"
@@ -3,16 +3,22 @@
 """Python solver file for Advent of Code Day 4"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -38,9 +44,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    cards = [
-        parse_line(line.strip()) for line in text_data.strip("\n").strip().split("\n")
-    ]
+    cards = [parse_line(line.strip()) for line in aoc_reader.iter_lines(text_data)]
     return cards
 
 
@@ -87,8 +91,10 @@ def get_cards_count(cards):
                 card_winners += 1
         winners_count[card_num] = card_winners
 
+    records = aoc_artifacts.records(logger)
     for i, _ in enumerate(cards_to_process):
-        logger.debug("processing card index %d", i)
+        if records:
+            logger.debug("processing card index %d", i)
         while cards_to_process[i] > 0:
             # process a card
             total_cards += 1
@@ -99,6 +105,7 @@ def get_cards_count(cards):
     return total_cards
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 5"""
+import random
+
+DEFAULT_SIZE = 35
+
+MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+SPAN = 2**32
+
+
+def generate_mapping(rng, size):
+    """Generate one map as a shuffled partition of the number space
+
+    Args:
+        rng (random.Random): random source
+        size (int): number of ranges in the map
+
+    Returns:
+        list: (dst_start, src_start, range) entries
+    """
+    cuts = sorted(rng.sample(range(1, SPAN), size - 1)) if size > 1 else []
+    bounds = [0] + cuts + [SPAN]
+    pieces = [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(size)]
+    order = list(range(size))
+    rng.shuffle(order)
+    entries = []
+    dst = 0
+    for i in order:
+        src, rng_len = pieces[i]
+        entries.append((dst, src, rng_len))
+        dst += rng_len
+    rng.shuffle(entries)
+    return entries
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate ten seed ranges and seven almanac maps
+
+    Args:
+        size (int, optional): number of ranges in each map. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(SPAN // 2)
+        seeds.extend([start, rng.randint(1, SPAN // 20)])
+    stanzas = ["seeds: " + " ".join(str(s) for s in seeds)]
+    for name in MAP_NAMES:
+        lines = [f"{name} map:"]
+        lines.extend(
+            f"{dst} {src} {rng_len}"
+            for dst, src, rng_len in generate_mapping(rng, size)
+        )
+        stanzas.append("\n".join(lines))
+    return "\n\n".join(stanzas) + "\n"
@@ -3,16 +3,22 @@
 """Python solver file for Advent of Code Day 5"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import intervals as aoc_intervals  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -58,9 +64,7 @@ def parse_data(text_data):
         text_light_temp,
         text_temp_humid,
         text_humid_loc,
-    ) = (
-        text_data.strip().strip("\n").strip().split("\n\n")
-    )
+    ) = aoc_reader.iter_sections(text_data)
     seeds = [int(x) for x in text_seeds.split(":")[1].strip().split()]
     seed_soil = parse_stanza(text_seed_soil)
     soil_fertilizer = parse_stanza(text_soil_fertilizer)
@@ -120,93 +124,24 @@ def find_lowest_location_with_ranges(seeds, mappings):
     Returns:
         int: answer to Part 2 question
     """
-    seed_ranges = [(seeds[x], seeds[x + 1]) for x in list(range(0, len(seeds), 2))]
-    src_ranges_to_process = seed_ranges
+    values = aoc_intervals.normalize(
+        (seeds[x], seeds[x] + seeds[x + 1]) for x in range(0, len(seeds), 2)
+    )
     for mapping in mappings:
-        dst_ranges = list()
-        while src_ranges_to_process:
-            sr = src_ranges_to_process.pop()
-            src_start, src_rng = sr
-            src_end = src_start + src_rng
-
-            # look for full or partial overlaps in mapping
-            found_match = False
-            for dst_start, map_src_start, rng in mapping:
-                map_src_end = map_src_start + rng
-                if src_start < map_src_start:
-                    # case with partial/exact overlap with mapping, non-encompassing
-                    if map_src_start < src_end <= map_src_end:
-                        # non-overlapping portion gets re-added to "to_process" queue
-                        src_ranges_to_process.append(
-                            (src_start, map_src_start - src_start)
-                        )
-
-                        # overlapping portion continues to be processed
-                        overlap_rng = src_end - map_src_start
-                        dst_ranges.append((dst_start, overlap_rng))
-                        found_match = True
-                        break
-
-                    # case where src is encompassing the entire range
-                    elif src_end > map_src_end:
-                        # non-overlapping portion 1
-                        src_ranges_to_process.append(
-                            (src_start, map_src_start - src_start)
-                        )
-                        # non-overlapping portion 2
-                        src_ranges_to_process.append(
-                            (map_src_end, src_end - map_src_end)
-                        )
-                        # overlapping portion gets processed
-                        dst_ranges.append((dst_start, rng))
-                        found_match = True
-                        break
-
-                    # irrelevant but here for completeness
-                    elif src_end <= map_src_start:
-                        continue
-
-                elif map_src_start <= src_start < map_src_end:
-                    # case with mapping encompassing src
-                    if src_end <= map_src_end:
-                        offset = src_start - map_src_start
-                        dst_ranges.append((dst_start + offset, src_rng))
-                        found_match = True
-                        break
-
-                    # case with partial overlap
-                    elif map_src_end < src_end:
-                        # non-overlapping portion
-                        src_ranges_to_process.append(
-                            (map_src_end, src_end - map_src_end)
-                        )
-                        # overlapping portion
-                        offset_start = src_start - map_src_start
-                        dst_ranges.append(
-                            (dst_start + offset_start, map_src_end - src_start)
-                        )
-                        found_match = True
-                        break
-
-                # irrelevant but here for completeness
-                elif src_start >= map_src_end:
-                    continue
-
-            if found_match is False:
-                # maps 1:1 when there is no mapping
-                dst_ranges.append(sr)
-        # when complete, the dst_ranges become the next round's src_ranges
-        src_ranges_to_process = dst_ranges
-
-        # find lowest in all ranges as answer
-        lowest_location = src_ranges_to_process[0][0]
-        for start, _ in src_ranges_to_process:
-            if start < lowest_location:
-                lowest_location = start
+        values = aoc_intervals.map_intervals(
+            values,
+            (
+                (src_start, src_start + rng, dst_start - src_start)
+                for dst_start, src_start, rng in mapping
+            ),
+        )
+        logger.debug("%d ranges after mapping", len(values))
 
-    return lowest_location
+    # interval sets are sorted, so the first range starts at the lowest location
+    return values[0][0]
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
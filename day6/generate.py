@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 6"""
+import random
+
+DEFAULT_SIZE = 100
+
+RACES = 4
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate four boat races that can all be won
+
+    Part 2 glues the digits of the four races together, so its race time
+    grows roughly with size ** 4.
+
+    Args:
+        size (int, optional): upper bound on each race time. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    times = [rng.randint(max(size // 2, 2), max(size, 2)) for _ in range(RACES)]
+    # the best possible distance is (t / 2) ** 2, so keep records below it
+    distances = [rng.randint(t * t // 8, t * t // 4 - 1) for t in times]
+    width = max(len(str(v)) for v in times + distances) + 3
+    return (
+        "Time:    "
+        + "".join(f"{t:>{width}}" for t in times)
+        + "\nDistance:"
+        + "".join(f"{d:>{width}}" for d in distances)
+        + "\n"
+    )
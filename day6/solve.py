@@ -4,16 +4,21 @@
 import os
 import math
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 # def parse_line(text_line):
@@ -34,7 +39,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    text_time, text_distance = text_data.strip().strip("\n").split("\n")
+    text_time, text_distance = aoc_reader.iter_lines(text_data)
     times = [int(t) for t in text_time.split(":")[1].strip().split()]
     distances = [int(d) for d in text_distance.split(":")[1].strip().split()]
     return times, distances
@@ -49,7 +54,7 @@ def parse_data2(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    text_time, text_distance = text_data.strip().strip("\n").split("\n")
+    text_time, text_distance = aoc_reader.iter_lines(text_data)
     time = int(text_time.split(":")[1].strip().replace(" ", ""))
     distance = int(text_distance.split(":")[1].strip().replace(" ", ""))
     return time, distance
@@ -85,15 +90,58 @@ def find_wins(times, distances):
     return math.prod(counts)
 
 
+def get_race_winners_closed_form(time, distance):
+    """Find race winners for a (time, distance) race from the quadratic's roots
+
+    Holding for s ms wins when s * (time - s) > distance, which holds strictly
+    between the roots (time -/+ sqrt(time^2 - 4 * distance)) / 2. An integer
+    square root puts the first and last winner guesses within a step of the
+    truth, so no float rounding can creep in.
+
+    Args:
+        time (int): time alloted for race in ms
+        distance (int): current record distance for race
+
+    Returns:
+        int: possible unique whole number (ms) charge times that result in a record breaker
+    """
+    discriminant = time * time - 4 * distance
+    if discriminant < 0:
+        return 0
+    root = math.isqrt(discriminant)
+    first = max((time - root) // 2, 0)
+    last = min((time + root + 1) // 2, time - 1)
+    while first <= last and first * (time - first) <= distance:
+        first += 1
+    while last >= first and last * (time - last) <= distance:
+        last -= 1
+    return last - first + 1
+
+
+def find_wins_closed_form(times, distances):
+    """Complete Part 1 work from each race's quadratic roots
+
+    Args:
+        times (list): time alloted for each race in ms
+        distances (list): record distance for each race
+
+    Returns:
+        int: answer to Part 1 question
+    """
+    counts = [get_race_winners_closed_form(t, d) for t, d in zip(times, distances)]
+    return math.prod(counts)
+
+
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
     text_data = get_file_data()
     data = parse_data(text_data)
-    answer = find_wins(*data)
+    answer = find_wins_closed_form(*data)
     print(f"Day 6: Part 1: Find possible winners: {answer}")
     data = parse_data2(text_data)
-    answer2 = get_race_winners(*data)
+    answer2 = get_race_winners_closed_form(*data)
     print(f"Day 6: Part 2: Find possible winners (large number): {answer2}")
 
 
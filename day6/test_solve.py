@@ -1,7 +1,14 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
 import pytest
-from .solve import parse_data, parse_data2, find_wins, get_race_winners
+from .solve import (
+    parse_data,
+    parse_data2,
+    find_wins,
+    find_wins_closed_form,
+    get_race_winners,
+    get_race_winners_closed_form,
+)
 
 
 @pytest.fixture(name="test_data")
@@ -51,6 +58,11 @@ def test_all(test_data):
     """
     data = parse_data(test_data)
     assert find_wins(*data) == 288
+    assert find_wins_closed_form(*data) == 288
 
     data = parse_data2(test_data)
     assert get_race_winners(*data) == 71503
+    assert get_race_winners_closed_form(*data) == 71503
+    # a record that can only be tied, and one that cannot be reached
+    assert get_race_winners_closed_form(4, 4) == 0
+    assert get_race_winners_closed_form(4, 5) == 0
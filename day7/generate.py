@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 7"""
+import random
+
+DEFAULT_SIZE = 1000
+
+CARDS = "23456789TJQKA"
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate camel card hands and their bids
+
+    Args:
+        size (int, optional): number of hands. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = [
+        f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
@@ -3,16 +3,26 @@
 """Python solver file for Advent of Code Day 7"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import artifacts as aoc_artifacts  # pylint: disable=wrong-import-position
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# cards from weakest to strongest, with jokers weakest in Part 2
+CARD_ORDER = "23456789TJQKA"
+JOKER_CARD_ORDER = "J23456789TQKA"
+
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -36,9 +46,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        parse_line(line.strip()) for line in text_data.strip().strip("\n").split("\n")
-    ]
+    data = [parse_line(line.strip()) for line in aoc_reader.iter_lines(text_data)]
     return data
 
 
@@ -255,10 +263,14 @@ def get_total_winnings(data):
                 sorted_hands.append(hand)
                 break
 
-    for i, hand in enumerate(sorted_hands):
-        logger.debug(
-            "hand: %s, bid: %s, rank: %d", "".join(hand["cards"]), hand["bid"], i + 1
-        )
+    if aoc_artifacts.records(logger):
+        for i, hand in enumerate(sorted_hands):
+            logger.debug(
+                "hand: %s, bid: %s, rank: %d",
+                "".join(hand["cards"]),
+                hand["bid"],
+                i + 1,
+            )
 
     winnings = sum([(i + 1) * hand["bid"] for i, hand in enumerate(sorted_hands)])
     return winnings
@@ -290,23 +302,73 @@ def get_total_winnings_2(data):
                 sorted_hands.append(hand)
                 break
 
-    for i, hand in enumerate(sorted_hands):
-        logger.debug(
-            "hand: %s, bid: %s, rank: %d", "".join(hand["cards"]), hand["bid"], i + 1
-        )
+    if aoc_artifacts.records(logger):
+        for i, hand in enumerate(sorted_hands):
+            logger.debug(
+                "hand: %s, bid: %s, rank: %d",
+                "".join(hand["cards"]),
+                hand["bid"],
+                i + 1,
+            )
 
     winnings = sum([(i + 1) * hand["bid"] for i, hand in enumerate(sorted_hands)])
     return winnings
 
 
+def get_winnings_sorted(data, hand_type, card_order):
+    """Rank hands with one keyed sort and total the winnings
+
+    Python's sort is stable, so equal hands keep their input order just like
+    the insertion sort in get_total_winnings.
+
+    Args:
+        data (list): list of (cards, bid) tuples
+        hand_type (callable): cards to their 1-7 hand type
+        card_order (str): cards from weakest to strongest
+
+    Returns:
+        int: sum of each bid times its rank
+    """
+    strength = {card: i for i, card in enumerate(card_order)}
+    ranked = sorted(
+        data, key=lambda hand: (hand_type(hand[0]), [strength[c] for c in hand[0]])
+    )
+    return sum(rank * bid for rank, (_, bid) in enumerate(ranked, 1))
+
+
+def get_total_winnings_sorted(data):
+    """Complete Part 1 work with a keyed sort
+
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 1 question
+    """
+    return get_winnings_sorted(data, get_hand_type, CARD_ORDER)
+
+
+def get_total_winnings_2_sorted(data):
+    """Complete Part 2 work with a keyed sort
+
+    Args:
+        data (list): list of parsed input objects/dictionaries
+
+    Returns:
+        int: answer to Part 2 question
+    """
+    return get_winnings_sorted(data, get_hand_type_2, JOKER_CARD_ORDER)
+
+
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
     text_data = get_file_data()
     data = parse_data(text_data)
-    answer = get_total_winnings(data)
+    answer = get_total_winnings_sorted(data)
     print(f"Day 7: Part 1: Get Total Winnings (no jokers): {answer}")
-    answer2 = get_total_winnings_2(data)
+    answer2 = get_total_winnings_2_sorted(data)
     print(f"Day 7: Part 2: Get Total Winnings (with jokers): {answer2}")
 
 
@@ -1,7 +1,13 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
 import pytest
-from .solve import parse_data, get_total_winnings, get_total_winnings_2
+from .solve import (
+    parse_data,
+    get_total_winnings,
+    get_total_winnings_2,
+    get_total_winnings_sorted,
+    get_total_winnings_2_sorted,
+)
 
 
 @pytest.fixture(name="test_data")
@@ -52,3 +58,5 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_total_winnings(data) == 6440
     assert get_total_winnings_2(data) == 5905
+    assert get_total_winnings_sorted(data) == 6440
+    assert get_total_winnings_2_sorted(data) == 5905
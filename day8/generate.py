@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 8"""
+import itertools
+import random
+import string
+
+DEFAULT_SIZE = 750
+
+GHOSTS = 6
+
+MIDDLE = string.ascii_uppercase
+# internal node names never end in A or Z so only the ghost ends match
+LAST = string.ascii_uppercase[1:-1]
+
+
+def get_primes(low, count):
+    """Get the first few primes at or above a lower bound
+
+    Args:
+        low (int): lower bound
+        count (int): how many primes to return
+
+    Returns:
+        list: ascending primes
+    """
+    primes = []
+    n = max(low, 2)
+    while len(primes) < count:
+        if all(n % d for d in range(2, int(n**0.5) + 1)):
+            primes.append(n)
+        n += 1
+    return primes
+
+
+def get_names(rng, count, taken):
+    """Draw unique internal node names, growing the name length when needed
+
+    Args:
+        rng (random.Random): random source
+        count (int): how many names
+        taken (set): names already used
+
+    Returns:
+        list: node names
+    """
+    length = 3
+    while len(MIDDLE) ** (length - 1) * len(LAST) < (count + len(taken)) * 2:
+        length += 1
+    names = []
+    seen = set(taken)
+    while len(names) < count:
+        name = "".join(rng.choices(MIDDLE, k=length - 1)) + rng.choice(LAST)
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate L/R instructions and a network of six ghost cycles
+
+    Each ghost walks from its ..A node to its ..Z node in a whole number of
+    instruction passes and then loops back, the same shape as the real puzzle.
+    The first ghost uses AAA and ZZZ so Part 1 has a path.
+
+    Args:
+        size (int, optional): approximate number of network nodes.
+            Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    n_instructions = get_primes(max(int((size / GHOSTS) ** 0.5), 2), 1)[0]
+    passes = get_primes(max(size // (GHOSTS * n_instructions), 2), GHOSTS)
+    instructions = [rng.choice("LR") for _ in range(n_instructions)]
+
+    ends = [("AAA", "ZZZ")]
+    prefixes = ("".join(p) for p in itertools.product(MIDDLE, repeat=2))
+    for prefix in prefixes:
+        if len(ends) == GHOSTS:
+            break
+        if prefix != "AA" and prefix != "ZZ":
+            ends.append((prefix + "A", prefix + "Z"))
+    taken = {name for pair in ends for name in pair}
+
+    nodes = {}
+    for (start, end), cycle_passes in zip(ends, passes):
+        length = cycle_passes * n_instructions
+        path = [start] + get_names(rng, length - 1, taken) + [end]
+        taken.update(path)
+        for i, name in enumerate(path):
+            # the node after ..Z is the node after ..A, closing the cycle
+            nxt = path[i + 1] if i < length else path[1]
+            decoy = rng.choice(path)
+            if instructions[i % n_instructions] == "L":
+                nodes[name] = (nxt, decoy)
+            else:
+                nodes[name] = (decoy, nxt)
+
+    names = list(nodes)
+    rng.shuffle(names)
+    lines = [f"{n} = ({nodes[n][0]}, {nodes[n][1]})" for n in names]
+    return "".join(instructions) + "\n\n" + "\n".join(lines) + "\n"
@@ -4,16 +4,21 @@
 import os
 import math
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_line(text_line):
@@ -64,10 +69,10 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    instructions, network_nodes = text_data.strip().strip("\n").split("\n\n")
+    instructions, network_nodes = aoc_reader.iter_sections(text_data)
     instructions = [parse_direction(d) for d in list(instructions.strip())]
     network_nodes = dict(
-        [parse_element(text_node) for text_node in network_nodes.strip().split("\n")]
+        [parse_element(text_node) for text_node in aoc_reader.iter_lines(network_nodes)]
     )
     return instructions, network_nodes
 
@@ -155,6 +160,7 @@ def get_min_required_ghost_steps(data):
     # return count
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day 9"""
+import random
+
+DEFAULT_SIZE = 200
+
+VALUES = 21
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate sequences sampled from low degree integer polynomials
+
+    Args:
+        size (int, optional): number of sequences. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients))
+            for x in range(VALUES)
+        ]
+        lines.append(" ".join(str(v) for v in values))
+    return "\n".join(lines) + "\n"
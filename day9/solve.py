@@ -3,16 +3,21 @@
 """Python solver file for Advent of Code Day 9"""
 import os
 import logging
+import sys
+
+# make the shared aoc package importable when run as a script from this folder,
+# leaving sys.path alone when imported as part of the dayN package
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from aoc import profiling as aoc_profiling  # pylint: disable=wrong-import-position
+from aoc import reader as aoc_reader  # pylint: disable=wrong-import-position
 
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
 def get_file_data(fn="input.txt"):
     """Function returning data blob from input.txt file"""
-    with open(fn, "r", encoding="utf-8") as f:
-        data = f.read()
-    return data
+    return aoc_reader.read_input(fn)
 
 
 def parse_data(text_data):
@@ -24,10 +29,7 @@ def parse_data(text_data):
     Returns:
         _type_: parsed input data ready for processing
     """
-    data = [
-        [int(x) for x in line.split()]
-        for line in text_data.strip().strip("\n").split("\n")
-    ]
+    data = [[int(x) for x in line.split()] for line in aoc_reader.iter_lines(text_data)]
     return data
 
 
@@ -111,6 +113,7 @@ def find_extrapolation_prev_sum(data):
     return sum([get_prev_extrapolated_value(seq) for seq in data])
 
 
+@aoc_profiling.profile_main
 def main():
     """Main function used to solve AoC problem"""
     logger.setLevel(level=logging.INFO)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+"""Seeded synthetic input generator for Advent of Code Day X"""
+import random
+
+DEFAULT_SIZE = 1000
+
+
+def generate(size=DEFAULT_SIZE, seed=0):
+    """Generate an input shaped like the real puzzle input
+
+    Args:
+        size (int, optional): number of lines. Defaults to DEFAULT_SIZE.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        str: input text blob
+    """
+    rng = random.Random(seed)
+    lines = [str(rng.randint(0, 9)) for _ in range(size)]
+    return "\n".join(lines) + "\n"